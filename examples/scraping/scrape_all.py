@@ -27,14 +27,9 @@ for year in years:
 
     scraper = Scraper(game_ids)
 
-    # Scrape the play by play for the year
-    pbp = scraper.play_by_play
-
-    # Setting filepath
-    filepath = SAVE_FOLDER / "pbp" / f"pbp_{year}.csv"
-
-    # Saving files
-    pbp.to_csv(filepath, index=False)
+    # Scrape the play by play for the year and save it to a Parquet dataset partitioned by
+    # season, session, and game ID, which can be read back with chicken_nhl.load_dataset
+    scraper.to_dataset(SAVE_FOLDER / "pbp", kinds=("play_by_play", "play_by_play_ext"))
 
     scraper.prep_stats(level="period", score=True, teammates=True, opposition=True)
     stats = scraper.stats
@@ -51,7 +51,15 @@ from chickenstats.chicken_nhl._aggregation import (
     prep_stats,
     prep_lines,
     prep_team_stats,
+    prep_stats_levels,
+    prep_lines_levels,
+    prep_team_stats_levels,
+    roll_up_stats,
 )
+from chickenstats.chicken_nhl._xg_features import build_xg_fields
+from chickenstats.chicken_nhl._corrections import load_corrections
+from chickenstats.chicken_nhl._dataset import dataset_game_ids, load_dataset, write_dataset
+from chickenstats.chicken_nhl._backfill import Backfill
 
 __all__ = [
     "Scraper",
@@ -59,10 +67,20 @@ __all__ = [
     "Game",
     "Player",
     "Team",
+    "Backfill",
     "build_play_by_play_ext",
+    "build_xg_fields",
+    "load_corrections",
+    "dataset_game_ids",
+    "load_dataset",
+    "write_dataset",
     "prep_ind",
     "prep_oi",
     "prep_stats",
     "prep_lines",
     "prep_team_stats",
+    "prep_stats_levels",
+    "prep_lines_levels",
+    "prep_team_stats_levels",
+    "roll_up_stats",
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 import narwhals as nw
 
@@ -28,22 +28,76 @@ from chickenstats.chicken_nhl.validation_polars import (
     team_stats_pandera_polars,
 )
 from chickenstats.chicken_nhl._validation_utils import validate_dataframe
+from chickenstats.exceptions import InvalidInputError
 
 
-def _cast_api_id_columns(df: pl.DataFrame) -> pl.DataFrame:
+PolarsFrameT = TypeVar("PolarsFrameT", pl.DataFrame, pl.LazyFrame)
+
+
+def _cast_api_id_columns(df: PolarsFrameT) -> PolarsFrameT:
     """Cast any Float64 ``*_api_id`` columns to Int64, filling NaN with null first.
 
     Pandas nullable integers become Float64 in Polars when data crosses the
     pandas→polars boundary (NaN represents missing values). ``cast(Int64)`` does
     not convert NaN to null by itself, so ``fill_nan(None)`` must run first.
-    Called at the top of ``prep_ind`` and ``prep_oi`` before player rows are built.
+    Called on the play-by-play before any player rows are built.
     """
-    float_cols = [c for c in df.columns if c.endswith("_api_id") and df.schema[c] == pl.Float64]
+    schema = df.collect_schema()
+    float_cols = [c for c, dtype in schema.items() if c.endswith("_api_id") and dtype == pl.Float64]
     if float_cols:
         df = df.with_columns([pl.col(c).fill_nan(None).cast(pl.Int64) for c in float_cols])
     return df
 
 
+def _collect_engine(streaming: bool) -> Literal["auto", "streaming"]:
+    """Return the Polars engine used to collect an aggregation plan."""
+    return "streaming" if streaming else "auto"
+
+
+def _join_play_by_play_ext(df: pl.DataFrame, df_ext: pl.DataFrame | None = None) -> pl.LazyFrame:
+    """Lazily join the play-by-play with its extended on-ice slot columns.
+
+    Every aggregation plan reads from this frame, so the join is planned once and
+    Polars only materializes the columns the downstream group-bys actually use.
+
+    Parameters:
+        df (pl.DataFrame): Play-by-play DataFrame (polars).
+        df_ext (pl.DataFrame | None): Extended play-by-play DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+    """
+    if df_ext is None:
+        df_ext = build_play_by_play_ext(df)
+
+    return (
+        _cast_api_id_columns(df)
+        .lazy()
+        .join(_cast_api_id_columns(df_ext).lazy(), on=["id", "event_idx"], how="left", nulls_equal=True)
+    )
+
+
+def _select_schema_columns(lf: pl.LazyFrame, schema) -> pl.LazyFrame:
+    """Keep the columns of ``lf`` that appear in a pandera schema, in schema order.
+
+    Mirrors the column selection ``validate_dataframe`` performs, for plans that feed
+    another plan instead of being collected and validated on their own.
+    """
+    columns = lf.collect_schema().names()
+
+    return lf.select([c for c in schema.columns if c in columns])
+
+
+def _add_rate_columns(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Drop rows without ice time, then add per-60 and on-ice percentage columns.
+
+    Used by the line and team stats plans, and again after those totals are rolled up.
+    """
+    lf = lf.filter(pl.col("toi") > 0)
+
+    lf = _prep_p60(lf, stats=P60_STATS)
+
+    return _prep_oi_percent(lf, stats_for=OI_PERCENT_STATS_FOR, stats_against=OI_PERCENT_STATS_AGAINST)
+
+
 @nw.narwhalify
 def _prep_p60(df: IntoFrameT, stats: list) -> IntoFrameT:
     """Adds columns to normalize statistics on a 60-minute basis.
@@ -123,6 +177,7 @@ def prep_ind(
     score: bool = False,
     teammates: bool = False,
     opposition: bool = False,
+    streaming: bool = False,
 ) -> pl.DataFrame:
     """Aggregate individual stats per player from play-by-play data.
 
@@ -136,10 +191,39 @@ def prep_ind(
         score (bool): Split by score state. Default ``False``.
         teammates (bool): Split by teammate lineup. Default ``False``.
         opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
     """
-    df = df.clone()
+    ind_stats = _prep_ind_plan(
+        _cast_api_id_columns(df).lazy(),
+        level=level,
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+    ).collect(engine=_collect_engine(streaming))
+
+    return validate_dataframe(ind_stats, ind_stats_pandera_polars)
+
+
+def _prep_ind_plan(
+    df: pl.LazyFrame,
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+) -> pl.LazyFrame:
+    """Build the lazy query plan behind ``prep_ind``; the result is not yet validated.
 
-    df = _cast_api_id_columns(df)
+    Parameters:
+        df (pl.LazyFrame): Play-by-play LazyFrame with ``*_api_id`` columns already cast.
+        level (str): Aggregation level — ``'period'``, ``'game'``, ``'session'``, or ``'season'``. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+    """
+    df_columns = df.collect_schema().names()
 
     players = ["player_1", "player_2", "player_3"]
 
@@ -188,7 +272,7 @@ def prep_ind(
 
     polars_schema = {column: polars_schema[column] for column in merge_list}
 
-    ind_stats = pl.DataFrame(schema=polars_schema)
+    ind_stats = pl.LazyFrame(schema=polars_schema)
 
     for player in players:
         player_eh_id = f"{player}_eh_id"
@@ -215,7 +299,7 @@ def prep_ind(
                 for c in build_group_list(
                     group_base, strength_state=strength_state, score=score, teammates=teammates, opposition=opposition
                 )
-                if c in df.columns
+                if c in df_columns
             ]
 
             stats_list = [
@@ -255,7 +339,7 @@ def prep_ind(
 
             # stats_dict = {x: "sum" for x in stats_list if x in df.columns}
 
-            agg_stats = [pl.sum(x) for x in stats_list if x in df.columns]
+            agg_stats = [pl.sum(x) for x in stats_list if x in df_columns]
 
             new_cols = {
                 "block": "ibs",
@@ -302,7 +386,7 @@ def prep_ind(
 
             player_df = filter_df.group_by(group_list).agg(agg_stats)
 
-            rename_cols = {column: new_cols[column] for column in new_cols if column in player_df.columns}
+            rename_cols = {column: new_cols[column] for column in new_cols if column in player_df.collect_schema()}
 
             player_df = player_df.rename(rename_cols)
 
@@ -337,7 +421,7 @@ def prep_ind(
 
             stats_1 = ["block", "block_adj", "fac", "hit", "pen0", "pen2", "pen4", "pen5", "pen10", "ozf", "nzf", "dzf"]
 
-            agg_stats_1 = [pl.sum(x) for x in stats_1 if x.lower() in df.columns]
+            agg_stats_1 = [pl.sum(x) for x in stats_1 if x.lower() in df_columns]
 
             event_types = ["BLOCK", "FAC", "HIT", "PENL", "DELPEN"]
 
@@ -392,7 +476,7 @@ def prep_ind(
                 "defense_api_id": "opp_defense_api_id",
             }
 
-            rename_cols = {column: new_cols_1[column] for column in new_cols_1 if column in opps.columns}
+            rename_cols = {column: new_cols_1[column] for column in new_cols_1 if column in opps.collect_schema()}
 
             opps = opps.rename(rename_cols)
 
@@ -400,7 +484,7 @@ def prep_ind(
 
             stats_2 = ["goal", "pred_goal", "teammate_block", "teammate_block_adj"]
 
-            agg_stats_2 = [pl.sum(x) for x in stats_2 if x in df.columns]
+            agg_stats_2 = [pl.sum(x) for x in stats_2 if x in df_columns]
 
             event_types = ["BLOCK", "GOAL"]
 
@@ -418,7 +502,7 @@ def prep_ind(
                 "teammate_block_adj": "isb_adj",
             }
 
-            rename_cols = {column: new_cols_2[column] for column in new_cols_2 if column in own.columns}
+            rename_cols = {column: new_cols_2[column] for column in new_cols_2 if column in own.collect_schema()}
 
             own = own.rename(rename_cols)
 
@@ -430,12 +514,12 @@ def prep_ind(
                 for c in build_group_list(
                     group_base, strength_state=strength_state, score=score, teammates=teammates, opposition=opposition
                 )
-                if c in df.columns
+                if c in df_columns
             ]
 
             stats_list = ["goal", "pred_goal"]
 
-            agg_stats = [pl.sum(x) for x in stats_list if x in df.columns]
+            agg_stats = [pl.sum(x) for x in stats_list if x in df_columns]
 
             player_df = df.filter(~pl.col(player).is_in(["BENCH", "REFEREE"])).group_by(group_list).agg(agg_stats)
 
@@ -449,7 +533,7 @@ def prep_ind(
                 position: "position",
             }
 
-            rename_cols = {column: new_cols[column] for column in new_cols if column in player_df.columns}
+            rename_cols = {column: new_cols[column] for column in new_cols if column in player_df.collect_schema()}
 
             player_df = player_df.rename(rename_cols)
 
@@ -457,7 +541,9 @@ def prep_ind(
 
     # Fixing some stats
 
-    null_columns = (pl.col(x).fill_null(0) for x in ind_stats.columns if x not in merge_list)
+    ind_columns = ind_stats.collect_schema().names()
+
+    null_columns = (pl.col(x).fill_null(0) for x in ind_columns if x not in merge_list)
 
     ind_stats = ind_stats.with_columns(null_columns)
 
@@ -467,7 +553,7 @@ def prep_ind(
         icf=pl.col("iff") + pl.col("isb") + pl.col("isb_right"),
         icf_adj=pl.col("iff_adj") + pl.col("isb_adj") + pl.col("isb_adj_right"),
     )
-    if "ixg" in ind_stats.columns:
+    if "ixg" in ind_columns:
         ind_stats = ind_stats.with_columns(gax=pl.col("g") - pl.col("ixg"))
 
     stats = [
@@ -512,11 +598,11 @@ def prep_ind(
         "ipend10",
     ]
 
-    stats = [x for x in stats if x in ind_stats.columns]
+    ind_columns = ind_stats.collect_schema().names()
 
-    ind_stats = ind_stats.remove(pl.all_horizontal(pl.col(stats) == 0))
+    stats = [x for x in stats if x in ind_columns]
 
-    ind_stats = validate_dataframe(ind_stats, ind_stats_pandera_polars)
+    ind_stats = ind_stats.remove(pl.all_horizontal(pl.col(stats) == 0))
 
     return ind_stats
 
@@ -570,14 +656,17 @@ def prep_oi(
     score: bool = False,
     teammates: bool = False,
     opposition: bool = False,
+    streaming: bool = False,
 ) -> pl.DataFrame:
     """Aggregate on-ice stats per player from play-by-play data.
 
     Called internally by ``_ScraperStatsMixin._prep_oi``. Joins ``df`` with
-    ``df_ext`` (on-ice lineup data), then builds "for" and "against" perspectives
-    separately across 21 player slots (event_on_1–7, opp_on_1–7, change_on_1–7)
-    before merging into a single row per player. Output columns are documented
-    in ``Scraper.oi_stats``.
+    ``df_ext`` (on-ice lineup data), then builds the event team ("for"), opposing
+    team ("against"), and line change perspectives from their seven player slots
+    (event_on_1–7, opp_on_1–7, change_on_1–7) before merging into a single row per
+    player. Each perspective unpivots its slots into one row per on-ice player and
+    is aggregated with a single lazy group-by. Output columns are documented in
+    ``Scraper.oi_stats``.
 
     Parameters:
         df (pl.DataFrame): Play-by-play DataFrame (polars).
@@ -588,31 +677,64 @@ def prep_oi(
         score (bool): Split by score state. Default ``False``.
         teammates (bool): Split by teammate lineup. Default ``False``.
         opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
     """
-    if df_ext is None:
-        df_ext = build_play_by_play_ext(df)
+    oi_stats = _prep_oi_plan(
+        _join_play_by_play_ext(df, df_ext),
+        level=level,
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+    ).collect(engine=_collect_engine(streaming))
 
-    merge_cols = ["id", "event_idx"]
+    return validate_dataframe(oi_stats, oi_stats_pandera_polars)
 
-    df = df.join(df_ext, on=merge_cols, how="left", nulls_equal=True)
 
-    df = _cast_api_id_columns(df)
+def _prep_oi_plan(
+    lf: pl.LazyFrame,
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+) -> pl.LazyFrame:
+    """Build the lazy query plan behind ``prep_oi``; the result is not yet validated.
 
-    players = (
-        [f"event_on_{x}" for x in range(1, 8)]
-        + [f"opp_on_{x}" for x in range(1, 8)]
-        + [f"change_on_{x}" for x in range(1, 8)]
-    )
+    Parameters:
+        lf (pl.LazyFrame): Play-by-play joined with the extended play-by-play, as returned
+            by ``_join_play_by_play_ext``.
+        level (str): Aggregation level — ``'period'``, ``'game'``, ``'session'``, or ``'season'``. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+    """
+    perspectives = ["event_on", "opp_on", "change_on"]
 
-    event_list = []
-    opp_list = []
-    zones_list = []
+    perspective_frames = []
 
-    for player in players:
+    for perspective in perspectives:
+        player = f"{perspective}_slot"
         position = f"{player}_pos"
         player_eh_id = f"{player}_eh_id"
         player_api_id = f"{player}_api_id"
 
+        # Unpivot the seven slots into one long frame of (event, on-ice player) rows
+        long_df = pl.concat(
+            [
+                lf.with_columns(
+                    pl.col(f"{perspective}_{x}").alias(player),
+                    pl.col(f"{perspective}_{x}_eh_id").alias(player_eh_id),
+                    pl.col(f"{perspective}_{x}_api_id").alias(player_api_id),
+                    pl.col(f"{perspective}_{x}_pos").alias(position),
+                )
+                for x in range(1, 8)
+            ]
+        )
+
+        columns = long_df.collect_schema().names()
+
         group_list = ["season", "session"]
 
         if level == "game":
@@ -664,7 +786,7 @@ def prep_oi(
         if "change_on" in player:
             stats_list = ["ozc", "nzc", "dzc", "otf"]
 
-        agg_stats = [pl.sum(x) for x in stats_list if x in df.columns]
+        agg_stats = [pl.sum(x) for x in stats_list if x in columns]
 
         if "event_on" in player or "change_on" in player:
             if level == "session" or level == "season":
@@ -787,7 +909,7 @@ def prep_oi(
                     teammates=teammates,
                     opposition=opposition,
                 )
-                if c in df.columns
+                if c in columns
             ]
         elif "opp_on" in player:
             group_list = [
@@ -801,23 +923,16 @@ def prep_oi(
                     teammates_cols=OPPOSITION_COLS,
                     opposition_cols=TEAMMATES_COLS,
                 )
-                if c in df.columns
+                if c in columns
             ]
 
-        player_df = df.group_by(group_list).agg(agg_stats)
+        player_df = long_df.group_by(group_list).agg(agg_stats)
 
-        col_names = {key: value for key, value in col_names.items() if key in player_df.columns}
+        col_names = {key: value for key, value in col_names.items() if key in player_df.collect_schema()}
 
         player_df = player_df.rename(col_names).drop_nulls(subset=["player", "eh_id", "api_id"])
 
-        if "event_on" in player:
-            event_list.append(player_df)
-
-        elif "opp_on" in player:
-            opp_list.append(player_df)
-
-        elif "change_on" in player:
-            zones_list.append(player_df)
+        perspective_frames.append(player_df)
 
     # On-ice stats
 
@@ -855,39 +970,24 @@ def prep_oi(
         "opp_defense_api_id",
     ]
 
-    event_stats = pl.concat(event_list)
-
-    agg_stats = [pl.sum(x) for x in event_stats.columns if x not in merge_cols]
-
-    group_list = [x for x in merge_cols if x in event_stats.columns]
-
-    event_stats = event_stats.group_by(group_list).agg(agg_stats).with_columns(event_df=pl.lit(1))
-
-    opp_stats = pl.concat(opp_list)
-
-    agg_stats = [pl.sum(x) for x in opp_stats.columns if x not in merge_cols]
-
-    group_list = [x for x in merge_cols if x in opp_stats.columns]
-
-    opp_stats = opp_stats.group_by(group_list).agg(agg_stats).with_columns(opp_df=pl.lit(1))
+    # Each perspective is already one row per player and group, so only its columns are reordered
+    perspective_columns = [frame.collect_schema().names() for frame in perspective_frames]
 
-    zones_stats = pl.concat(zones_list)
+    flags = ["event_df", "opp_df", "zones_df"]
 
-    agg_stats = [pl.sum(x) for x in zones_stats.columns if x not in merge_cols]
-
-    group_list = [x for x in merge_cols if x in zones_stats.columns]
-
-    zones_stats = zones_stats.group_by(group_list).agg(agg_stats).with_columns(zones_df=pl.lit(1))
+    event_stats, opp_stats, zones_stats = (
+        frame.select([x for x in merge_cols if x in columns] + [x for x in columns if x not in merge_cols])
+        .with_columns(pl.lit(1).alias(flag))
+        for frame, columns, flag in zip(perspective_frames, perspective_columns, flags, strict=True)
+    )
 
-    merge_cols = [
-        x for x in merge_cols if x in event_stats.columns and x in opp_stats.columns and x in zones_stats.columns
-    ]
+    merge_cols = [x for x in merge_cols if all(x in columns for columns in perspective_columns)]
 
     oi_stats = event_stats.join(opp_stats, on=merge_cols, how="full", coalesce=True, nulls_equal=True)  # .fill_null(0)
 
     oi_stats = oi_stats.join(zones_stats, on=merge_cols, how="full", coalesce=True, nulls_equal=True)  # .fill_null(0)
 
-    null_columns = (pl.col(x).fill_null(0) for x in oi_stats.columns if x not in merge_cols)
+    null_columns = (pl.col(x).fill_null(0) for x in oi_stats.collect_schema().names() if x not in merge_cols)
 
     oi_stats = oi_stats.with_columns(null_columns)
 
@@ -906,7 +1006,9 @@ def prep_oi(
         fac=(pl.col("ozfw") + pl.col("ozfl") + pl.col("nzfw") + pl.col("nzfl") + pl.col("dzfw") + pl.col("dzfl")),
     )
 
-    columns = [x for x in list(oi_stats_pandera_polars.dtypes.keys()) if x in oi_stats.columns] + [
+    oi_columns = oi_stats.collect_schema().names()
+
+    columns = [x for x in list(oi_stats_pandera_polars.dtypes.keys()) if x in oi_columns] + [
         "event_df",
         "opp_df",
         "zones_df",
@@ -975,12 +1077,10 @@ def prep_oi(
         "take",
     ]
 
-    stats = [x.lower() for x in stats if x.lower() in oi_stats.columns]
+    stats = [x.lower() for x in stats if x.lower() in columns]
 
     oi_stats = oi_stats.remove(pl.all_horizontal(pl.col(stats) == 0))
 
-    oi_stats = validate_dataframe(oi_stats, oi_stats_pandera_polars)
-
     return oi_stats
 
 
@@ -995,6 +1095,21 @@ def _merge_stats(ind_stats_df: pl.DataFrame, oi_stats_df: pl.DataFrame) -> pl.Da
         ind_stats_df (pl.DataFrame): Output of ``prep_ind()``.
         oi_stats_df (pl.DataFrame): Output of ``prep_oi()``.
     """
+    stats = _merge_stats_plan(ind_stats_df.lazy(), oi_stats_df.lazy()).collect()
+
+    return validate_dataframe(stats, stats_pandera_polars)
+
+
+def _merge_stats_plan(ind_stats_df: pl.LazyFrame, oi_stats_df: pl.LazyFrame) -> pl.LazyFrame:
+    """Build the lazy query plan behind ``_merge_stats``; the result is not yet validated.
+
+    Parameters:
+        ind_stats_df (pl.LazyFrame): Individual stats, as built by ``_prep_ind_plan``.
+        oi_stats_df (pl.LazyFrame): On-ice stats, as built by ``_prep_oi_plan``.
+    """
+    ind_columns = ind_stats_df.collect_schema().names()
+    oi_columns = oi_stats_df.collect_schema().names()
+
     merge_cols = [
         "season",
         "session",
@@ -1029,18 +1144,32 @@ def _merge_stats(ind_stats_df: pl.DataFrame, oi_stats_df: pl.DataFrame) -> pl.Da
         "opp_goalie_api_id",
     ]
 
-    merge_cols = [x for x in merge_cols if x in ind_stats_df.columns and x in oi_stats_df.columns]
+    merge_cols = [x for x in merge_cols if x in ind_columns and x in oi_columns]
 
     oi_stats_df = oi_stats_df.filter(pl.col("toi") > 0)
 
     stats = oi_stats_df.join(ind_stats_df, how="left", on=merge_cols, nulls_equal=True)
 
-    null_columns = (pl.col(x).fill_null(0) for x in stats.columns if x not in merge_cols)
+    stats_columns = stats.collect_schema().names()
+
+    null_columns = (pl.col(x).fill_null(0) for x in stats_columns if x not in merge_cols)
 
     stats = stats.with_columns(null_columns)
 
     integer_columns = ["api_id", "own_goalie_api_id", "opp_goalie_api_id"]
-    integer_columns = (pl.col(x).cast(pl.Int64) for x in integer_columns if x in stats.columns)
+    integer_columns = (pl.col(x).cast(pl.Int64) for x in integer_columns if x in stats_columns)
+
+    stats = _sort_stats(stats.with_columns(integer_columns))
+
+    stats = _prep_p60(stats, stats=P60_STATS)
+    stats = _prep_oi_percent(stats, stats_for=OI_PERCENT_STATS_FOR, stats_against=OI_PERCENT_STATS_AGAINST)
+
+    return stats
+
+
+def _sort_stats(stats: PolarsFrameT) -> PolarsFrameT:
+    """Sort merged player stats by season, game, team, player, and game state."""
+    stats_columns = stats.collect_schema().names()
 
     sort_stuff = {
         "season": False,
@@ -1056,17 +1185,10 @@ def _merge_stats(ind_stats_df: pl.DataFrame, oi_stats_df: pl.DataFrame) -> pl.Da
         "forwards": False,
     }
 
-    sort_list = [x for x in sort_stuff.keys() if x in stats.columns]
-    descending_list = [v for k, v in sort_stuff.items() if k in stats.columns]
-
-    stats = stats.with_columns(integer_columns).sort(by=sort_list, descending=descending_list)
+    sort_list = [x for x in sort_stuff.keys() if x in stats_columns]
+    descending_list = [v for k, v in sort_stuff.items() if k in stats_columns]
 
-    stats = prep_p60(stats)
-    stats = prep_oi_percent(stats)
-
-    stats = validate_dataframe(cast(pl.DataFrame, stats), stats_pandera_polars)
-
-    return stats
+    return stats.sort(by=sort_list, descending=descending_list)
 
 
 def prep_stats(
@@ -1077,10 +1199,13 @@ def prep_stats(
     score: bool = False,
     teammates: bool = False,
     opposition: bool = False,
+    streaming: bool = False,
 ) -> pl.DataFrame:
     """Aggregate individual and on-ice player stats from a play-by-play DataFrame.
 
-    Public entry point that calls ``prep_ind`` + ``prep_oi`` then merges the results.
+    Public entry point that combines the ``prep_ind`` and ``prep_oi`` aggregations and
+    merges the results. The join with ``df_ext``, both aggregations, the merge, and the
+    per-60 and percentage columns form a single query plan that is collected once.
     When ``base_xg``, ``pred_goal``, and/or ``context_xg`` columns are present in ``df``,
     ``base_ixg``/``base_xgf``/``base_xga``, ``ixg``/``xgf``/``xga``, and
     ``context_ixg``/``context_xgf``/``context_xga`` are computed respectively.
@@ -1094,11 +1219,9 @@ def prep_stats(
         score (bool): Split by score state. Default ``False``.
         teammates (bool): Split by teammate lineup. Default ``False``.
         opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
     """
-    ind = prep_ind(
-        df, level=level, strength_state=strength_state, score=score, teammates=teammates, opposition=opposition
-    )
-    oi = prep_oi(
+    _, _, stats_plan = _prep_stats_plans(
         df,
         df_ext=df_ext,
         level=level,
@@ -1107,7 +1230,56 @@ def prep_stats(
         teammates=teammates,
         opposition=opposition,
     )
-    return _merge_stats(ind_stats_df=ind, oi_stats_df=oi)
+
+    stats = stats_plan.collect(engine=_collect_engine(streaming))
+
+    return validate_dataframe(stats, stats_pandera_polars)
+
+
+def _prep_stats_plans(
+    df: pl.DataFrame,
+    df_ext: pl.DataFrame | None = None,
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+) -> tuple[pl.LazyFrame, pl.LazyFrame, pl.LazyFrame]:
+    """Build the individual, on-ice, and merged stats plans over one shared input.
+
+    The three plans read from the same lazy play-by-play join, so collecting them
+    together with ``pl.collect_all`` evaluates the shared subplans only once.
+    None of the results are validated.
+
+    Parameters:
+        df (pl.DataFrame): Play-by-play DataFrame (polars).
+        df_ext (pl.DataFrame | None): Extended on-ice slot DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+        level (str): Aggregation level. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+    """
+    lf = _join_play_by_play_ext(df, df_ext)
+
+    options = {
+        "level": level,
+        "strength_state": strength_state,
+        "score": score,
+        "teammates": teammates,
+        "opposition": opposition,
+    }
+
+    ind_plan = _prep_ind_plan(lf, **options)
+    oi_plan = _prep_oi_plan(lf, **options)
+
+    stats_plan = _merge_stats_plan(
+        _select_schema_columns(ind_plan, ind_stats_pandera_polars),
+        _select_schema_columns(oi_plan, oi_stats_pandera_polars),
+    )
+
+    return ind_plan, oi_plan, stats_plan
 
 
 def prep_lines(
@@ -1119,6 +1291,7 @@ def prep_lines(
     score: bool = False,
     teammates: bool = False,
     opposition: bool = False,
+    streaming: bool = False,
 ) -> pl.DataFrame:
     """Aggregate line-level on-ice stats from play-by-play data.
 
@@ -1136,13 +1309,46 @@ def prep_lines(
         score (bool): Split by score state. Default ``False``.
         teammates (bool): Split by teammate lineup. Default ``False``.
         opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
     """
-    if df_ext is None:
-        df_ext = build_play_by_play_ext(df)
+    lines = _prep_lines_plan(
+        _join_play_by_play_ext(df, df_ext),
+        position=position,
+        level=level,
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+    ).collect(engine=_collect_engine(streaming))
 
-    merge_cols = ["id", "event_idx"]
+    return validate_dataframe(lines, line_stats_pandera_polars)
 
-    data = df.join(df_ext, how="left", on=merge_cols, nulls_equal=True)
+
+def _prep_lines_plan(
+    data: pl.LazyFrame,
+    position: Literal["f", "d"] = "f",
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+    rates: bool = True,
+) -> pl.LazyFrame:
+    """Build the lazy query plan behind ``prep_lines``; the result is not yet validated.
+
+    Parameters:
+        data (pl.LazyFrame): Play-by-play joined with the extended play-by-play, as returned
+            by ``_join_play_by_play_ext``.
+        position (str): ``'f'`` for forward lines, ``'d'`` for defense pairs. Default ``'f'``.
+        level (str): Aggregation level — ``'period'``, ``'game'``, ``'session'``, or ``'season'``. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        rates (bool): Drop rows without ice time and add per-60 and percentage columns.
+            When ``False``, the additive totals are returned for every row. Default ``True``.
+    """
+    data_columns = data.collect_schema().names()
 
     # Creating the "for" dataframe
 
@@ -1217,7 +1423,7 @@ def prep_lines(
         "pen10",
     ]
 
-    agg_stats = [pl.sum(x) for x in stats if x in data.columns]
+    agg_stats = [pl.sum(x) for x in stats if x in data_columns]
 
     # Aggregating the "for" dataframe
 
@@ -1268,10 +1474,14 @@ def prep_lines(
 
     columns.update({"event_team": "team"})
 
-    columns = {k: v for k, v in columns.items() if k in lines_f.columns}
+    lines_f_columns = lines_f.collect_schema().names()
+
+    columns = {k: v for k, v in columns.items() if k in lines_f_columns}
 
     lines_f = lines_f.rename(columns)
 
+    lines_f_columns = lines_f.collect_schema().names()
+
     cols = [
         "forwards",
         "forwards_eh_id",
@@ -1291,7 +1501,7 @@ def prep_lines(
         "opp_goalie_eh_id",
     ]
 
-    cols = [pl.col(x).fill_null("") for x in cols if x in lines_f]
+    cols = [pl.col(x).fill_null("") for x in cols if x in lines_f_columns]
 
     lines_f = lines_f.with_columns(cols)
 
@@ -1384,7 +1594,7 @@ def prep_lines(
         "pen10",
     ]
 
-    agg_stats = [pl.sum(x) for x in stats if x in data.columns]
+    agg_stats = [pl.sum(x) for x in stats if x in data_columns]
 
     # Aggregating "against" dataframe
 
@@ -1456,10 +1666,14 @@ def prep_lines(
         }
     )
 
-    columns = {k: v for k, v in columns.items() if k in lines_a.columns}
+    lines_a_columns = lines_a.collect_schema().names()
+
+    columns = {k: v for k, v in columns.items() if k in lines_a_columns}
 
     lines_a = lines_a.rename(columns)
 
+    lines_a_columns = lines_a.collect_schema().names()
+
     cols = [
         "forwards",
         "forwards_eh_id",
@@ -1479,7 +1693,7 @@ def prep_lines(
         "opp_goalie_eh_id",
     ]
 
-    cols = [pl.col(x).fill_null("") for x in cols if x in lines_a]
+    cols = [pl.col(x).fill_null("") for x in cols if x in lines_a_columns]
 
     lines_a = lines_a.with_columns(cols)
 
@@ -1593,30 +1807,38 @@ def prep_lines(
 
     lines = lines_f.join(lines_a, how="full", on=merge_list, coalesce=True, nulls_equal=True)
 
-    null_columns = (pl.col(x).fill_null(0) for x in lines.columns if x not in merge_list)
+    null_columns = (pl.col(x).fill_null(0) for x in lines.collect_schema().names() if x not in merge_list)
 
     lines = lines.with_columns(null_columns)
 
     lines = lines.with_columns(
-        toi=(lines["toi"] + lines["toi_right"]) / 60,
-        cf=lines["bsf"] + lines["teammate_block"] + lines["ff"],
-        cf_adj=lines["bsf_adj"] + lines["teammate_block_adj"] + lines["ff_adj"],
-        ca=lines["bsa"] + lines["fa"],
-        ca_adj=lines["bsa_adj"] + lines["fa_adj"],
-        ozf=lines["ozfw"] + lines["ozfl"],
-        nzf=lines["nzfw"] + lines["nzfl"],
-        dzf=lines["dzfw"] + lines["dzfl"],
+        toi=(pl.col("toi") + pl.col("toi_right")) / 60,
+        cf=pl.col("bsf") + pl.col("teammate_block") + pl.col("ff"),
+        cf_adj=pl.col("bsf_adj") + pl.col("teammate_block_adj") + pl.col("ff_adj"),
+        ca=pl.col("bsa") + pl.col("fa"),
+        ca_adj=pl.col("bsa_adj") + pl.col("fa_adj"),
+        ozf=pl.col("ozfw") + pl.col("ozfl"),
+        nzf=pl.col("nzfw") + pl.col("nzfl"),
+        dzf=pl.col("dzfw") + pl.col("dzfl"),
     )
 
-    lines = lines.filter(pl.col("toi") > 0)
-
-    lines = prep_p60(lines)
+    if not rates:
+        return lines
 
-    lines = prep_oi_percent(lines)
+    return _add_rate_columns(lines)
 
-    lines = validate_dataframe(cast(pl.DataFrame, lines), line_stats_pandera_polars)
 
-    return lines
+# Team totals combining the "for" and "against" sides. Either side can be missing (null) for a row,
+# so these are rebuilt from the summed sides whenever team totals are summed again
+_TEAM_DERIVED_TOTALS = {
+    "cf": pl.col("ff") + pl.col("bsf") + pl.col("teammate_block"),
+    "cf_adj": pl.col("ff_adj") + pl.col("bsf_adj") + pl.col("teammate_block_adj"),
+    "ca": pl.col("fa") + pl.col("bsa"),
+    "ca_adj": pl.col("fa_adj") + pl.col("bsa_adj"),
+    "ozf": pl.col("ozfw") + pl.col("ozfl"),
+    "nzf": pl.col("nzfw") + pl.col("nzfl"),
+    "dzf": pl.col("dzfw") + pl.col("dzfl"),
+}
 
 
 def prep_team_stats(
@@ -1626,6 +1848,7 @@ def prep_team_stats(
     strength_state: bool = True,
     opposition: bool = False,
     score: bool = False,
+    streaming: bool = False,
 ) -> pl.DataFrame:
     """Aggregate team-level on-ice stats from play-by-play data.
 
@@ -1641,13 +1864,40 @@ def prep_team_stats(
         strength_state (bool): Split by strength state. Default ``True``.
         opposition (bool): Split by opposing lineup. Default ``False``.
         score (bool): Split by score state. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
     """
-    if df_ext is None:
-        df_ext = build_play_by_play_ext(df)
+    team_stats = _prep_team_stats_plan(
+        _join_play_by_play_ext(df, df_ext),
+        level=level,
+        strength_state=strength_state,
+        opposition=opposition,
+        score=score,
+    ).collect(engine=_collect_engine(streaming))
 
-    merge_cols = ["id", "event_idx"]
+    return validate_dataframe(team_stats, team_stats_pandera_polars)
+
+
+def _prep_team_stats_plan(
+    data: pl.LazyFrame,
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    opposition: bool = False,
+    score: bool = False,
+    rates: bool = True,
+) -> pl.LazyFrame:
+    """Build the lazy query plan behind ``prep_team_stats``; the result is not yet validated.
 
-    data = df.join(df_ext, how="left", on=merge_cols, nulls_equal=True)
+    Parameters:
+        data (pl.LazyFrame): Play-by-play joined with the extended play-by-play, as returned
+            by ``_join_play_by_play_ext``.
+        level (str): Aggregation level — ``'period'``, ``'game'``, ``'session'``, or ``'season'``. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        score (bool): Split by score state. Default ``False``.
+        rates (bool): Drop rows without ice time and add per-60 and percentage columns.
+            When ``False``, the additive totals are returned for every row. Default ``True``.
+    """
+    data_columns = data.collect_schema().names()
 
     # Getting the "for" stats
 
@@ -1704,7 +1954,7 @@ def prep_team_stats(
         "event_length",
     ]
 
-    agg_stats = [pl.sum(x) for x in stats if x in data.columns]
+    agg_stats = [pl.sum(x) for x in stats if x in data_columns]
 
     stats_for = data.group_by(group_list).agg(agg_stats)
 
@@ -1749,7 +1999,7 @@ def prep_team_stats(
 
     new_cols.update({"event_team": "team"})
 
-    new_cols = {k: v for k, v in new_cols.items() if k in stats_for.columns}
+    new_cols = {k: v for k, v in new_cols.items() if k in stats_for.collect_schema()}
     stats_for = stats_for.rename(new_cols)
 
     # Getting the "against" stats
@@ -1803,7 +2053,7 @@ def prep_team_stats(
         "event_length",
     ]
 
-    agg_stats = [pl.sum(x) for x in stats if x in data.columns]
+    agg_stats = [pl.sum(x) for x in stats if x in data_columns]
 
     stats_against = data.group_by(group_list).agg(agg_stats)
 
@@ -1851,7 +2101,7 @@ def prep_team_stats(
         }
     )
 
-    new_cols = {k: v for k, v in new_cols.items() if k in stats_against.columns}
+    new_cols = {k: v for k, v in new_cols.items() if k in stats_against.collect_schema()}
 
     stats_against = stats_against.rename(new_cols)
 
@@ -1867,25 +2117,504 @@ def prep_team_stats(
         "period",
     ]
 
-    merge_list = [x for x in merge_list if x in stats_for.columns and x in stats_against.columns]
+    stats_for_columns = stats_for.collect_schema().names()
+    stats_against_columns = stats_against.collect_schema().names()
+
+    merge_list = [x for x in merge_list if x in stats_for_columns and x in stats_against_columns]
 
     team_stats = stats_for.join(stats_against, on=merge_list, how="full", nulls_equal=True, coalesce=True)
 
     team_stats = team_stats.with_columns(
-        toi=(team_stats["toi"].fill_null(0) + team_stats["toi_right"].fill_null(0)) / 60,
-        cf=team_stats["ff"] + team_stats["bsf"] + team_stats["teammate_block"],
-        cf_adj=team_stats["ff_adj"] + team_stats["bsf_adj"] + team_stats["teammate_block_adj"],
-        ca=team_stats["fa"] + team_stats["bsa"],
-        ca_adj=team_stats["fa_adj"] + team_stats["bsa_adj"],
-        ozf=team_stats["ozfw"] + team_stats["ozfl"],
-        nzf=team_stats["nzfw"] + team_stats["nzfl"],
-        dzf=team_stats["dzfw"] + team_stats["dzfl"],
-    ).filter(pl.col("toi") > 0, pl.col("toi").is_not_null())
+        toi=(pl.col("toi").fill_null(0) + pl.col("toi_right").fill_null(0)) / 60,
+        **_TEAM_DERIVED_TOTALS,
+    )
+
+    if not rates:
+        return team_stats
+
+    return _add_rate_columns(team_stats)
+
+
+# Aggregation levels from finest to coarsest. Session and season totals share the same
+# grouping, so either can be rolled up from the other.
+_LEVEL_ORDER = ["period", "game", "session", "season"]
 
-    team_stats = prep_p60(team_stats)
+# Dimension columns that identify a row in any stats table; every other column is an
+# additive total, apart from the derived _p60 and _percent columns
+_ROLLUP_KEYS = [
+    "season",
+    "session",
+    "game_id",
+    "game_date",
+    "player",
+    "eh_id",
+    "api_id",
+    "position",
+    "team",
+    "opp_team",
+    "strength_state",
+    "period",
+    "score_state",
+    *TEAMMATES_COLS,
+    *OPPOSITION_COLS,
+]
+
+
+def _sorted_levels(levels: list[AggLevel | str]) -> list[str]:
+    """Return the requested aggregation levels, deduplicated and ordered finest first."""
+    invalid = [level for level in levels if level not in _LEVEL_ORDER]
+    if invalid or not levels:
+        raise InvalidInputError(f"levels must be one or more of {_LEVEL_ORDER}, got {invalid or levels!r}")
+
+    return [level for level in _LEVEL_ORDER if level in levels]
+
+
+def _roll_up(lf: pl.LazyFrame, level: str, opposition: bool = False) -> pl.LazyFrame:
+    """Sum a finer-grained stats table up to ``level``.
+
+    Dimension columns that ``level`` does not group by are dropped and every total is
+    summed over the remaining ones. Derived ``_p60`` and ``_percent`` columns are
+    dropped, so they must be recomputed from the rolled-up totals.
+
+    Parameters:
+        lf (pl.LazyFrame): Stats table at a level finer than, or equal to, ``level``.
+        level (str): Target aggregation level.
+        opposition (bool): Whether the table is split by opposing lineup, which keeps
+            ``opp_team`` at the session and season levels. Default ``False``.
+    """
+    dropped = {
+        "period": [],
+        "game": ["period"],
+        "session": ["game_id", "game_date", "period"],
+        "season": ["game_id", "game_date", "period"],
+    }[level]
+
+    if level in ("session", "season") and not opposition:
+        dropped = dropped + ["opp_team"]
+
+    columns = lf.collect_schema().names()
+
+    keys = [c for c in columns if c in _ROLLUP_KEYS and c not in dropped]
+    totals = [c for c in columns if c not in _ROLLUP_KEYS and not c.endswith(("_p60", "_percent"))]
+
+    return lf.group_by(keys).agg([_sum_totals(c) for c in totals])
+
+
+def _sum_totals(column: str) -> pl.Expr:
+    """Sum a total within each group, keeping null where every value is null, as aggregating directly does."""
+    return pl.when(pl.col(column).is_not_null().any()).then(pl.col(column).sum()).alias(column)
+
+
+def prep_stats_levels(
+    df: pl.DataFrame,
+    df_ext: pl.DataFrame | None = None,
+    levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+    streaming: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Aggregate player stats at several levels from a single pass over the play-by-play.
+
+    Individual and on-ice stats are aggregated once at the finest requested level. Because
+    counts and time on ice are additive, each coarser level is a group-by sum of those
+    totals, after which the merge and the per-60 and percentage columns are recomputed.
+    Each frame matches what ``prep_stats`` returns for that level.
+
+    Parameters:
+        df (pl.DataFrame): Play-by-play DataFrame (polars).
+        df_ext (pl.DataFrame | None): Extended on-ice slot DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+        levels (list[str] | None): Aggregation levels to return. Default ``['game', 'season']``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        dict[str, pl.DataFrame]: Stats keyed by aggregation level, finest first.
+
+    Examples:
+        >>> stats = prep_stats_levels(pbp, levels=["period", "game", "season"])
+        >>> season_stats = stats["season"]
+    """
+    levels = _sorted_levels(levels or ["game", "season"])
+
+    ind_plan, oi_plan, _ = _prep_stats_plans(
+        df,
+        df_ext=df_ext,
+        level=levels[0],
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+    )
+
+    ind_stats, oi_stats = pl.collect_all(
+        [
+            _select_schema_columns(ind_plan, ind_stats_pandera_polars),
+            _select_schema_columns(oi_plan, oi_stats_pandera_polars),
+        ],
+        engine=_collect_engine(streaming),
+    )
+
+    return roll_up_stats(ind_stats, oi_stats, levels=levels, opposition=opposition, streaming=streaming)
+
+
+def roll_up_stats(
+    ind_stats: pl.DataFrame,
+    oi_stats: pl.DataFrame,
+    levels: list[AggLevel | Literal["period", "game", "session", "season"]],
+    opposition: bool = False,
+    streaming: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Roll individual and on-ice stats up to coarser levels and merge them.
+
+    Called by ``prep_stats_levels``, and useful on its own when ``ind_stats`` and
+    ``oi_stats`` are already available at a fine level (e.g., ``Scraper.ind_stats``).
+
+    Parameters:
+        ind_stats (pl.DataFrame): Output of ``prep_ind()`` at a level no coarser than any of ``levels``.
+        oi_stats (pl.DataFrame): Output of ``prep_oi()`` at the same level as ``ind_stats``.
+        levels (list[str]): Aggregation levels to return.
+        opposition (bool): Whether the inputs are split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        dict[str, pl.DataFrame]: Stats keyed by aggregation level, finest first.
+    """
+    levels = _sorted_levels(levels)
+
+    plans = [
+        _merge_stats_plan(
+            _roll_up(ind_stats.lazy(), level, opposition=opposition),
+            _roll_up(oi_stats.lazy(), level, opposition=opposition),
+        )
+        for level in levels
+    ]
+
+    frames = pl.collect_all(plans, engine=_collect_engine(streaming))
+
+    return {level: validate_dataframe(frame, stats_pandera_polars) for level, frame in zip(levels, frames, strict=True)}
+
+
+def prep_lines_levels(
+    df: pl.DataFrame,
+    df_ext: pl.DataFrame | None = None,
+    position: Literal["f", "d"] = "f",
+    levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+    streaming: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Aggregate line stats at several levels from a single pass over the play-by-play.
+
+    Line totals are aggregated once at the finest requested level and summed up to each
+    coarser level before the per-60 and percentage columns are recomputed. Each frame
+    matches what ``prep_lines`` returns for that level.
+
+    Parameters:
+        df (pl.DataFrame): Play-by-play DataFrame (polars).
+        df_ext (pl.DataFrame | None): Extended play-by-play DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+        position (str): ``'f'`` for forward lines, ``'d'`` for defense pairs. Default ``'f'``.
+        levels (list[str] | None): Aggregation levels to return. Default ``['game', 'season']``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        dict[str, pl.DataFrame]: Line stats keyed by aggregation level, finest first.
+    """
+    levels = _sorted_levels(levels or ["game", "season"])
+
+    totals = _prep_lines_plan(
+        _join_play_by_play_ext(df, df_ext),
+        position=position,
+        level=levels[0],
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+        rates=False,
+    ).collect(engine=_collect_engine(streaming))
+
+    plans = [_add_rate_columns(_roll_up(totals.lazy(), level, opposition=opposition)) for level in levels]
+
+    frames = pl.collect_all(plans, engine=_collect_engine(streaming))
+
+    return {
+        level: validate_dataframe(frame, line_stats_pandera_polars) for level, frame in zip(levels, frames, strict=True)
+    }
+
+
+def prep_team_stats_levels(
+    df: pl.DataFrame,
+    df_ext: pl.DataFrame | None = None,
+    levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+    strength_state: bool = True,
+    opposition: bool = False,
+    score: bool = False,
+    streaming: bool = False,
+) -> dict[str, pl.DataFrame]:
+    """Aggregate team stats at several levels from a single pass over the play-by-play.
+
+    Team totals are aggregated once at the finest requested level and summed up to each
+    coarser level before the per-60 and percentage columns are recomputed. Each frame
+    matches what ``prep_team_stats`` returns for that level. With ``opposition=True``,
+    ``prep_team_stats`` keeps game-level "for" rows at the session and season levels,
+    so those levels are aggregated directly instead of rolled up.
+
+    Parameters:
+        df (pl.DataFrame): Play-by-play DataFrame (polars).
+        df_ext (pl.DataFrame | None): Extended play-by-play DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+        levels (list[str] | None): Aggregation levels to return. Default ``['game', 'season']``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        score (bool): Split by score state. Default ``False``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        dict[str, pl.DataFrame]: Team stats keyed by aggregation level, finest first.
+    """
+    levels = _sorted_levels(levels or ["game", "season"])
+
+    data = _join_play_by_play_ext(df, df_ext)
+
+    options = {"strength_state": strength_state, "opposition": opposition, "score": score}
+
+    direct_levels = [level for level in levels if opposition and level in ("session", "season")]
+
+    if len(direct_levels) < len(levels):
+        totals = _prep_team_stats_plan(data, level=levels[0], rates=False, **options).collect(
+            engine=_collect_engine(streaming)
+        )
+
+    plans = [
+        _prep_team_stats_plan(data, level=level, **options)
+        if level in direct_levels
+        else _add_rate_columns(
+            _roll_up(totals.lazy(), level, opposition=opposition).with_columns(**_TEAM_DERIVED_TOTALS)
+        )
+        for level in levels
+    ]
+
+    frames = pl.collect_all(plans, engine=_collect_engine(streaming))
+
+    return {
+        level: validate_dataframe(frame, team_stats_pandera_polars) for level, frame in zip(levels, frames, strict=True)
+    }
+
+
+# Levels whose rows span several games, so new games are summed into existing rows instead of appended
+_RESUMMED_LEVELS = ("session", "season")
+
+
+def _combine_totals(old: pl.LazyFrame, new: pl.LazyFrame) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    """Add new totals to a stats table at the same aggregation level.
+
+    Returns the rows of ``old`` that ``new`` does not touch, and the rows it does, with
+    ``new`` summed in. Both frames must hold totals only, without ``_p60`` or ``_percent`` columns.
+
+    Parameters:
+        old (pl.LazyFrame): Existing totals.
+        new (pl.LazyFrame): Totals for the added games, with the same columns as ``old``.
+    """
+    columns = old.collect_schema().names()
+
+    keys = [c for c in columns if c in _ROLLUP_KEYS]
+    totals = [c for c in columns if c not in _ROLLUP_KEYS]
+
+    new = new.select(columns)
+    affected = new.select(keys).unique()
+
+    kept = old.join(affected, on=keys, how="anti", nulls_equal=True)
+    touched = old.join(affected, on=keys, how="semi", nulls_equal=True)
+
+    resummed = (
+        pl.concat([touched, new], how="vertical_relaxed")
+        .group_by(keys)
+        .agg([_sum_totals(c) for c in totals])
+        .select(columns)
+    )
+
+    return kept, resummed
+
+
+def _update_stats(
+    ind_stats: pl.DataFrame,
+    oi_stats: pl.DataFrame,
+    stats: pl.DataFrame,
+    df: pl.DataFrame,
+    df_ext: pl.DataFrame | None = None,
+    level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+    strength_state: bool = True,
+    score: bool = False,
+    teammates: bool = False,
+    opposition: bool = False,
+    streaming: bool = False,
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Add the play-by-play of new games to existing individual, on-ice, and merged stats.
+
+    Called by ``_ScraperStatsMixin.prep_stats`` after ``add_games``. Only the new games are
+    aggregated; their totals are summed into ``ind_stats`` and ``oi_stats``, and only the
+    ``stats`` rows they touch are merged again and get new per-60 and percentage columns.
+    The results match aggregating every game with ``prep_ind``, ``prep_oi``, and ``prep_stats``.
+
+    Parameters:
+        ind_stats (pl.DataFrame): Output of ``prep_ind()`` for the existing games.
+        oi_stats (pl.DataFrame): Output of ``prep_oi()`` for the existing games.
+        stats (pl.DataFrame): Output of ``prep_stats()`` for the existing games.
+        df (pl.DataFrame): Play-by-play DataFrame of the new games only (polars).
+        df_ext (pl.DataFrame | None): Extended on-ice slot DataFrame. Built automatically
+            from list-typed lineup columns when ``None``.
+        level (str): Aggregation level of the existing stats. Default ``'game'``.
+        strength_state (bool): Split by strength state. Default ``True``.
+        score (bool): Split by score state. Default ``False``.
+        teammates (bool): Split by teammate lineup. Default ``False``.
+        opposition (bool): Split by opposing lineup. Default ``False``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]: Updated individual, on-ice, and merged stats.
+    """
+    engine = _collect_engine(streaming)
+
+    ind_plan, oi_plan, _ = _prep_stats_plans(
+        df,
+        df_ext=df_ext,
+        level=level,
+        strength_state=strength_state,
+        score=score,
+        teammates=teammates,
+        opposition=opposition,
+    )
+
+    new_ind, new_oi = pl.collect_all(
+        [
+            _select_schema_columns(ind_plan, ind_stats_pandera_polars),
+            _select_schema_columns(oi_plan, oi_stats_pandera_polars),
+        ],
+        engine=engine,
+    )
+
+    new_ind = validate_dataframe(new_ind, ind_stats_pandera_polars)
+    new_oi = validate_dataframe(new_oi, oi_stats_pandera_polars)
+
+    ind_plan = pl.concat(_combine_totals(ind_stats.lazy(), new_ind.lazy()), how="vertical_relaxed")
+    oi_plan = pl.concat(_combine_totals(oi_stats.lazy(), new_oi.lazy()), how="vertical_relaxed")
+
+    # Player rows touched by the new games, identified by the keys the merge joins on
+    keys = [c for c in stats.columns if c in _ROLLUP_KEYS and c in ind_stats.columns and c in oi_stats.columns]
+    affected = pl.concat([new_ind.select(keys), new_oi.select(keys)]).unique()
+
+    merged_plan = _merge_stats_plan(
+        ind_plan.join(affected.lazy(), on=keys, how="semi", nulls_equal=True),
+        oi_plan.join(affected.lazy(), on=keys, how="semi", nulls_equal=True),
+    )
+
+    ind_stats, oi_stats, merged = pl.collect_all([ind_plan, oi_plan, merged_plan], engine=engine)
+
+    merged = validate_dataframe(merged, stats_pandera_polars)
+
+    stats = _sort_stats(
+        pl.concat([stats.join(affected, on=keys, how="anti", nulls_equal=True), merged], how="vertical_relaxed")
+    )
+
+    return (
+        validate_dataframe(ind_stats, ind_stats_pandera_polars),
+        validate_dataframe(oi_stats, oi_stats_pandera_polars),
+        stats,
+    )
+
+
+def _collect_rated(
+    totals_plan: pl.LazyFrame,
+    schema,
+    keep_totals: bool = False,
+    streaming: bool = False,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Collect a line or team stats table from a plan built with ``rates=False``.
+
+    Returns the validated table and, with ``keep_totals``, the totals it was built from, which
+    ``_update_rated`` needs to add games at the session and season levels. Otherwise an empty
+    frame is returned in place of the totals.
+
+    Parameters:
+        totals_plan (pl.LazyFrame): Output of ``_prep_lines_plan`` or ``_prep_team_stats_plan``
+            with ``rates=False``.
+        schema: Pandera schema the table is validated against.
+        keep_totals (bool): Whether to also return the collected totals. Default ``False``.
+        streaming (bool): Collect the query plan with Polars' streaming engine. Default ``False``.
+    """
+    engine = _collect_engine(streaming)
+
+    if not keep_totals:
+        return validate_dataframe(_add_rate_columns(totals_plan).collect(engine=engine), schema), pl.DataFrame()
+
+    totals = totals_plan.collect(engine=engine)
+    rated = _add_rate_columns(totals.lazy()).collect(engine=engine)
+
+    return validate_dataframe(rated, schema), totals
+
+
+def _update_rated(
+    rated: pl.DataFrame,
+    totals: pl.DataFrame,
+    new_totals: pl.DataFrame,
+    level: AggLevel | Literal["period", "game", "session", "season"],
+    schema,
+    derived: dict[str, pl.Expr] | None = None,
+    streaming: bool = False,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Add the totals of new games to a line or team stats table.
+
+    At the period and game levels every row belongs to one game, so the new rows are rated
+    and appended. At the session and season levels the new totals are summed into ``totals``,
+    and only the rows they touch are replaced in ``rated``, with new per-60 and percentage
+    columns.
+
+    Parameters:
+        rated (pl.DataFrame): Existing table, as returned by ``_collect_rated``.
+        totals (pl.DataFrame): Totals ``rated`` was built from, kept by ``_collect_rated`` at the
+            session and season levels. Not read at the period and game levels.
+        new_totals (pl.DataFrame): Totals for the new games, at the same level.
+        level (str): Aggregation level of the table.
+        schema: Pandera schema the table is validated against.
+        derived (dict[str, pl.Expr] | None): Columns rebuilt from the other totals after summing,
+            e.g., ``_TEAM_DERIVED_TOTALS``. Default ``None``.
+        streaming (bool): Collect the query plans with Polars' streaming engine. Default ``False``.
+
+    Returns:
+        tuple[pl.DataFrame, pl.DataFrame]: Updated table and totals.
+    """
+    engine = _collect_engine(streaming)
+
+    if level not in _RESUMMED_LEVELS:
+        new_rated = validate_dataframe(_add_rate_columns(new_totals.lazy()).collect(engine=engine), schema)
+
+        return pl.concat([rated, new_rated], how="vertical_relaxed"), totals
+
+    kept, resummed = _combine_totals(totals.lazy(), new_totals.lazy())
+
+    if derived:
+        resummed = resummed.with_columns(**derived)
+
+    totals, new_rated = pl.collect_all(
+        [pl.concat([kept, resummed], how="vertical_relaxed"), _add_rate_columns(resummed)], engine=engine
+    )
 
-    team_stats = prep_oi_percent(team_stats)
+    new_rated = validate_dataframe(new_rated, schema)
 
-    team_stats = validate_dataframe(cast(pl.DataFrame, team_stats), team_stats_pandera_polars)
+    # Summing only adds ice time, so every row of rated that the new games touch is in new_rated
+    keys = [c for c in rated.columns if c in _ROLLUP_KEYS]
+    rated = rated.join(new_rated.select(keys), on=keys, how="anti", nulls_equal=True)
 
-    return team_stats
+    return pl.concat([rated, new_rated], how="vertical_relaxed"), totals
@@ -0,0 +1,537 @@
+"""Checkpointed, resumable backfills of whole seasons.
+
+Contains:
+    Backfill: Scrapes one or more seasons to a Parquet dataset, recording every game in a manifest.
+    content_hash: Returns a digest of a frame's contents, recorded for each data type of a game.
+
+The manifest is a JSON Lines file (``manifest.jsonl``) stored alongside the dataset, with one
+line appended per attempted game. A game's latest line is its current state, so a backfill that
+is interrupted (or killed) resumes from the last game it recorded. Each game's files are written
+before its manifest line, so a game is never marked complete without its data on disk.
+
+Games already in the dataset are skipped even without a manifest entry (e.g., games written with
+``Scraper.to_dataset``), so re-running a backfill each night syncs only the games played since.
+The manifest also records a digest of each report a game was built from, so ``Backfill.refresh``
+re-processes only the recent games whose reports the NHL has since edited.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import polars as pl
+
+from chickenstats.chicken_nhl._aggregation import prep_lines, prep_stats, prep_team_stats
+from chickenstats.chicken_nhl._dataset import _DERIVED_KINDS, dataset_game_ids, write_dataset
+from chickenstats.chicken_nhl._game_core import _DATA_SCHEMAS
+from chickenstats.chicken_nhl._game_utils import PrefetchedSession, season_and_session
+from chickenstats.chicken_nhl._scraper_core import _SCRAPE_ENDPOINTS, _result_to_frames, _scrape_type_for
+from chickenstats.chicken_nhl.game import Game
+from chickenstats.chicken_nhl.scraper import Scraper
+from chickenstats.chicken_nhl.season import Season
+from chickenstats.exceptions import InvalidInputError
+from chickenstats.utilities.enums import Backend
+from chickenstats.utilities.utilities import ChickenProgress, _to_backend, convert_to_list
+
+if TYPE_CHECKING:
+    import narwhals as nw
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_NAME = "manifest.jsonl"
+
+# Game-level tables aggregated from each game's play-by-play data, with the default Scraper options
+_DERIVED_BUILDERS: dict[str, Callable[[pl.DataFrame, pl.DataFrame], pl.DataFrame]] = {
+    "stats": prep_stats,
+    "lines": prep_lines,
+    "team_stats": prep_team_stats,
+}
+
+_MANIFEST_SCHEMA: dict[str, pl.DataType] = {
+    "game_id": pl.Int64(),
+    "season": pl.Int64(),
+    "session": pl.String(),
+    "status": pl.String(),
+    "started_at": pl.String(),
+    "seconds": pl.Float64(),
+    "game_date": pl.String(),
+    "sources": pl.String(),
+    "hashes": pl.String(),
+    "error": pl.String(),
+}
+
+
+def _read_sources(game_id: int, scrape_type: str, responses: dict | None) -> tuple[dict | None, str | None]:
+    """Return the SHA-256 digest of each downloaded report, keyed by endpoint, and the game date.
+
+    Reports that failed to download have a ``None`` digest. Returns ``(None, None)`` if the
+    game could not be downloaded at all.
+    """
+    if responses is None:
+        return None, None
+
+    game = Game(game_id, PrefetchedSession(responses))
+
+    sources = {}
+    for endpoint in _SCRAPE_ENDPOINTS[scrape_type]:
+        response = responses.get(getattr(game, endpoint))
+        sources[endpoint] = hashlib.sha256(response[1] or b"").hexdigest() if isinstance(response, tuple) else None
+
+    game_date = None
+    api_response = responses.get(game.api_endpoint)
+    if isinstance(api_response, tuple) and api_response[0] == 200:
+        try:
+            game_date = json.loads(api_response[1]).get("gameDate")
+        except ValueError:
+            logger.debug("Failed to read the date of game %s", game_id, exc_info=True)
+
+    return sources, game_date
+
+
+def content_hash(frame: pl.DataFrame) -> str:
+    """Return a SHA-256 digest of a frame's schema and values.
+
+    Frames with equal contents hash equally regardless of how they are chunked in memory.
+
+    Examples:
+        >>> content_hash(pl.DataFrame({"a": [1, 2]})) == content_hash(pl.DataFrame({"a": [1, 2]}))
+        True
+    """
+    buffer = io.BytesIO()
+    frame.rechunk().write_ipc(buffer, compression="uncompressed")
+
+    return hashlib.sha256(buffer.getvalue()).hexdigest()
+
+
+class Backfill:
+    """Scrapes whole seasons to a Parquet dataset, checkpointing every game in a manifest.
+
+    Game IDs come from ``Season.schedule`` (completed games only) and each game is scraped
+    with ``Scraper``, then written to the dataset with ``write_dataset`` as soon as it finishes.
+    The manifest records each game's status, timing, content hash of each data type, and error,
+    so re-running a backfill skips every game already written and a crash loses at most the
+    games in flight.
+
+    Game-level ``stats``, ``lines``, and ``team_stats`` are aggregated from each new game's
+    play-by-play data and written alongside it, so derived tables are updated without
+    re-aggregating the games already stored.
+
+    Parameters:
+        path (str | Path):
+            Root directory of the dataset. The manifest is written to ``path / "manifest.jsonl"``.
+        seasons (list[int | str] | int | str):
+            Seasons to backfill, as 4-digit first years or 8-digit season IDs, e.g., ``2023``
+            or ``[20222023, 20232024]``
+        kinds (Iterable[str]):
+            Data types to write for each game, e.g., ``("play_by_play", "shifts")``, including
+            the game-level ``"stats"``, ``"lines"`` (forward lines), and ``"team_stats"`` tables.
+            Default ``("play_by_play",)``.
+        sessions (list[str] | str | None):
+            Sessions to include, e.g., ``"R"`` for the regular season. Defaults to the
+            ``Season.schedule`` default of the regular season and playoffs.
+        season_workers (int):
+            Number of seasons backfilled concurrently. Default ``1``.
+        max_workers (int):
+            Number of games scraped concurrently within each season. Default ``1``.
+        cache_dir (str | Path | None):
+            Directory for the on-disk HTTP response cache, passed to ``Scraper``. Default ``None``.
+        game_cache_dir (str | Path | None):
+            Directory for the processed-game cache, passed to ``Scraper``. Default ``None``.
+        backend (str):
+            DataFrame backend for the manifest. One of ``"polars"`` (default), ``"pandas"``,
+            ``"pyarrow"``, or ``"narwhals"``.
+        disable_progress_bar (bool):
+            Suppress the progress bar. Default ``False``.
+        transient_progress_bar (bool):
+            Clear the progress bar when finished. Default ``False``.
+
+    Attributes:
+        manifest_path (Path):
+            Location of the manifest file
+
+    Raises:
+        InvalidInputError: If ``kinds`` names an unknown data type, or ``season_workers`` or
+            ``max_workers`` is less than 1.
+
+    Examples:
+        Backfill three seasons, two at a time
+        >>> from chickenstats.chicken_nhl import Backfill
+        >>> backfill = Backfill("./nhl_data", [2021, 2022, 2023], season_workers=2, max_workers=4)
+        >>> manifest = backfill.run()
+
+        After a crash, running again picks up where the last run stopped
+        >>> manifest = Backfill("./nhl_data", [2021, 2022, 2023]).run()
+
+        Retry only the games that failed, without re-reading the schedules
+        >>> backfill.failed_games
+        >>> manifest = backfill.retry_failed()
+
+        Load the data
+        >>> from chickenstats.chicken_nhl import load_dataset
+        >>> pbp = load_dataset("./nhl_data").collect()
+
+        Sync last night's games and their stats each morning, then pick up any corrections
+        the NHL made to the last three days of games
+        >>> backfill = Backfill("./nhl_data", 2025, kinds=("play_by_play", "stats", "team_stats"))
+        >>> manifest = backfill.run()
+        >>> changed = backfill.refresh(window_days=3)
+        >>> stats = load_dataset("./nhl_data", "stats").collect()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        seasons: list[int | str] | int | str,
+        kinds: Iterable[str] = ("play_by_play",),
+        sessions: list[str] | str | None = None,
+        season_workers: int = 1,
+        max_workers: int = 1,
+        cache_dir: str | Path | None = None,
+        game_cache_dir: str | Path | None = None,
+        backend: Backend | Literal["pandas", "polars", "pyarrow", "narwhals"] = "polars",
+        disable_progress_bar: bool = False,
+        transient_progress_bar: bool = False,
+    ):
+        """Instantiate a Backfill and read any existing manifest at ``path``."""
+        kinds = tuple(dict.fromkeys([kinds] if isinstance(kinds, str) else kinds))
+
+        if season_workers < 1:
+            raise InvalidInputError(f"season_workers must be at least 1, got {season_workers!r}")
+
+        if max_workers < 1:
+            raise InvalidInputError(f"max_workers must be at least 1, got {max_workers!r}")
+
+        self.path: Path = Path(path)
+        self.seasons: list[int] = [Season(season).season for season in convert_to_list(seasons, "season")]
+        self.kinds: tuple[str, ...] = kinds
+        self.sessions: list[str] | str | None = sessions
+        self.season_workers: int = season_workers
+        self.max_workers: int = max_workers
+        self.cache_dir: str | Path | None = cache_dir
+        self.game_cache_dir: str | Path | None = game_cache_dir
+        self.disable_progress_bar: bool = disable_progress_bar
+        self.transient_progress_bar: bool = transient_progress_bar
+
+        self._backend: str = backend
+        self._derived: tuple[str, ...] = tuple(kind for kind in kinds if kind in _DERIVED_KINDS)
+
+        # Derived tables are aggregated from the play-by-play data, so it is scraped for them
+        scraped_kinds = [kind for kind in kinds if kind not in _DERIVED_KINDS]
+        if self._derived:
+            scraped_kinds += ["play_by_play", "play_by_play_ext"]
+
+        self._scrape_type: str = _scrape_type_for(scraped_kinds)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.manifest_path: Path = self.path / _MANIFEST_NAME
+
+        self._lock = threading.Lock()
+        self._entries: dict[int, dict] = self._read_manifest()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the Backfill object."""
+        return f"Backfill(path={str(self.path)!r}, seasons={self.seasons!r}, kinds={self.kinds!r})"
+
+    def _read_manifest(self) -> dict[int, dict]:
+        """Return the latest manifest entry for each game, skipping a partially written last line."""
+        entries: dict[int, dict] = {}
+
+        if not self.manifest_path.exists():
+            return entries
+
+        with self.manifest_path.open(encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping unreadable line in %s", self.manifest_path)
+                    continue
+
+                entries[entry["game_id"]] = entry
+
+        return entries
+
+    def _record(self, entry: dict) -> None:
+        """Append an entry to the manifest and make it the game's current state."""
+        with self._lock:
+            with self.manifest_path.open("a", encoding="utf-8") as manifest:
+                manifest.write(json.dumps(entry) + "\n")
+
+            self._entries[entry["game_id"]] = entry
+
+    @property
+    def manifest(self) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame:
+        """Latest manifest entry for each attempted game, ordered by game ID.
+
+        Returns:
+            game_id (int):
+                Unique game ID assigned by the NHL, e.g., 2023020001
+            season (int):
+                8-digit season identifier, e.g., 20232024
+            session (str):
+                Type of game played, e.g., R
+            status (str):
+                Whether the game was written (``"complete"``) or not (``"failed"``)
+            started_at (str):
+                UTC time the latest attempt started, in ISO 8601 format
+            seconds (float):
+                Time taken to scrape and write the game, in seconds
+            game_date (str):
+                Date the game was played, e.g., 2023-10-10
+            sources (str):
+                JSON object mapping each report endpoint to the SHA-256 digest of its content,
+                used by ``refresh`` to detect reports edited upstream
+            hashes (str):
+                JSON object mapping each data type to the ``content_hash`` of the game's data
+            error (str):
+                Error raised by a failed attempt, e.g., ``"HTTPError: 404 Client Error"``
+        """
+        entries = [
+            {
+                **entry,
+                **{
+                    column: json.dumps(entry[column]) if entry.get(column) is not None else None
+                    for column in ("sources", "hashes")
+                },
+            }
+            for _, entry in sorted(self._entries.items())
+        ]
+
+        return _to_backend(pl.DataFrame(entries, schema=_MANIFEST_SCHEMA), self._backend)
+
+    @property
+    def completed_games(self) -> list[int]:
+        """Game IDs whose latest attempt was written to the dataset."""
+        return sorted(game_id for game_id, entry in self._entries.items() if entry["status"] == "complete")
+
+    @property
+    def failed_games(self) -> list[int]:
+        """Game IDs whose latest attempt failed."""
+        return sorted(game_id for game_id, entry in self._entries.items() if entry["status"] == "failed")
+
+    def _season_game_ids(self, season: int) -> list[int]:
+        """Return the IDs of a season's completed games, in schedule order."""
+        schedule = Season(season, backend="polars").schedule(sessions=self.sessions, disable_progress_bar=True)
+
+        return schedule.filter(pl.col("game_state") == "OFF")["game_id"].unique(maintain_order=True).to_list()
+
+    def _backfill_game(self, scraper: Scraper, game_id: int, refresh: bool = False) -> dict | None:
+        """Download, parse, and write a single game, returning its manifest entry.
+
+        With ``refresh``, games whose reports match the source hashes in the manifest, or could
+        not all be downloaded, are left untouched and ``None`` is returned.
+        """
+        season, session = season_and_session(game_id)
+        started_at = dt.datetime.now(dt.timezone.utc).isoformat()
+        start = time.perf_counter()
+
+        entry = {"game_id": game_id, "season": season, "session": session, "started_at": started_at}
+
+        responses = scraper._download_game(game_id, self._scrape_type)
+        sources, game_date = _read_sources(game_id, self._scrape_type, responses)
+
+        if refresh:
+            if sources is None or None in sources.values() or sources == self._entries[game_id].get("sources"):
+                return None
+
+            # The cached frames were built from the old reports
+            if scraper._game_cache is not None:
+                scraper._game_cache.discard(game_id)
+
+        entry.update(game_date=game_date, sources=sources)
+
+        result = scraper._scrape_single_game(game_id, self._scrape_type, responses) if responses is not None else None
+
+        if result is None:
+            entry.update(status="failed", hashes=None, error=scraper._game_errors.pop(game_id, None))
+
+        else:
+            frames = {
+                key: frame if frame is not None else pl.DataFrame(schema=_DATA_SCHEMAS[key])
+                for key, frame in _result_to_frames(result).items()
+                if key != "game_id"
+            }
+            hashes = {}
+
+            try:
+                if self._derived and not frames["play_by_play"].is_empty():
+                    for kind in self._derived:
+                        frames[kind] = _DERIVED_BUILDERS[kind](frames["play_by_play"], frames["play_by_play_ext"])
+
+                for kind in self.kinds:
+                    frame = frames.get(kind, pl.DataFrame())
+                    if not frame.is_empty():
+                        write_dataset(frame, self.path, kind)
+                    hashes[kind] = content_hash(frame)
+
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to write game %s", game_id, exc_info=True)
+                entry.update(status="failed", hashes=None, error=f"{type(exc).__name__}: {exc}")
+
+            else:
+                entry.update(status="complete", hashes=hashes, error=None)
+
+        entry["seconds"] = round(time.perf_counter() - start, 3)
+        self._record(entry)
+
+        return entry
+
+    def _backfill_games(self, game_ids: list[int], progress: ChickenProgress, task, refresh: bool = False) -> list[int]:
+        """Scrape and write game_ids on ``max_workers`` threads, sharing one Scraper.
+
+        Returns the IDs of the games that were written or failed, i.e., every game not skipped
+        by ``refresh``.
+        """
+        scraper = Scraper(
+            game_ids,
+            disable_progress_bar=True,
+            max_workers=self.max_workers,
+            cache_dir=self.cache_dir,
+            game_cache_dir=self.game_cache_dir,
+            retain=(),
+        )
+
+        processed = []
+        verb = "Checked" if refresh else "Backfilled"
+
+        with scraper._requests_session, ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._backfill_game, scraper, game_id, refresh): game_id for game_id in game_ids}
+
+            try:
+                for future in as_completed(futures):
+                    if future.result() is not None:
+                        processed.append(futures[future])
+                    progress.update(task, description=f"{verb} {futures[future]}", advance=1, refresh=True)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        return sorted(processed)
+
+    def _backfill_season(self, season: int, progress: ChickenProgress) -> None:
+        """Backfill every completed game of a season that has not been written yet."""
+        task = progress.add_task(f"Reading the {season} schedule...", total=None)
+
+        # Games already in the dataset count as complete, e.g., games written by Scraper.to_dataset
+        stored = set.intersection(*(dataset_game_ids(self.path, kind) for kind in self.kinds))
+        completed = stored.union(self.completed_games)
+
+        game_ids = [game_id for game_id in self._season_game_ids(season) if game_id not in completed]
+
+        progress.update(task, description=f"Backfilling {season}...", total=len(game_ids))
+
+        if game_ids:
+            self._backfill_games(game_ids, progress, task)
+
+        progress.update(task, description=f"Finished backfilling {season}", refresh=True)
+
+    def _run_seasons(self, seasons: list[int], backfill: Callable[[int, ChickenProgress], None]) -> None:
+        """Run ``backfill(season, progress)`` for each season, ``season_workers`` seasons at a time."""
+        with ChickenProgress(disable=self.disable_progress_bar, transient=self.transient_progress_bar) as progress:
+            with ThreadPoolExecutor(max_workers=self.season_workers) as executor:
+                futures = [executor.submit(backfill, season, progress) for season in seasons]
+
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+    def run(self) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame:
+        """Backfill every completed game of each season that is not already in the dataset.
+
+        Games recorded as complete in the manifest, or already stored for every data type in
+        ``kinds``, are skipped, and games that failed in an earlier run are retried, so ``run``
+        can be called repeatedly until ``failed_games`` is empty, or nightly to add new games.
+        Seasons are backfilled ``season_workers`` at a time.
+
+        Returns:
+            The manifest, as returned by the ``manifest`` property
+
+        Examples:
+            >>> backfill = Backfill("./nhl_data", [2022, 2023], season_workers=2)
+            >>> manifest = backfill.run()
+        """
+        self._run_seasons(self.seasons, self._backfill_season)
+
+        return self.manifest
+
+    def retry_failed(self) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame:
+        """Retry only the games whose latest attempt failed, without re-reading the schedules.
+
+        Returns:
+            The manifest, as returned by the ``manifest`` property
+
+        Examples:
+            >>> backfill = Backfill("./nhl_data", 2023)
+            >>> manifest = backfill.retry_failed()
+        """
+        self._rerun_games(self.failed_games, "Retrying")
+
+        return self.manifest
+
+    def refresh(self, window_days: int = 3) -> list[int]:
+        """Re-download recently played games and re-process only those whose reports changed.
+
+        The NHL edits reports for days after a game, e.g., scoring changes and shift fixes.
+        Each complete game played within ``window_days`` is downloaded again and the digest of
+        every report is compared with the ``sources`` recorded in the manifest. Games whose
+        reports all match are left untouched; the rest are parsed again and rewritten, with
+        their processed-game cache entries replaced. With ``cache_dir`` set, unchanged reports
+        are confirmed with conditional requests rather than downloaded in full.
+
+        Parameters:
+            window_days (int):
+                Number of days back from today to check, by game date. Default ``3``.
+
+        Returns:
+            list[int]:
+                IDs of the games whose reports changed and were re-processed
+
+        Raises:
+            InvalidInputError: If ``window_days`` is negative.
+
+        Examples:
+            Pick up last week's scoring changes
+            >>> backfill = Backfill("./nhl_data", 2025, cache_dir="./http_cache")
+            >>> changed = backfill.refresh(window_days=7)
+        """
+        if window_days < 0:
+            raise InvalidInputError(f"window_days must be 0 or greater, got {window_days!r}")
+
+        cutoff = (dt.date.today() - dt.timedelta(days=window_days)).isoformat()
+
+        recent = [
+            game_id for game_id in self.completed_games if (self._entries[game_id].get("game_date") or "") >= cutoff
+        ]
+
+        return self._rerun_games(recent, "Refreshing", refresh=True)
+
+    def _rerun_games(self, game_ids: list[int], description: str, refresh: bool = False) -> list[int]:
+        """Backfill game_ids from the manifest, grouped by season, and return the games processed."""
+        by_season: dict[int, list[int]] = {}
+        for game_id in game_ids:
+            by_season.setdefault(self._entries[game_id]["season"], []).append(game_id)
+
+        processed: list[int] = []
+
+        def rerun_season(season: int, progress: ChickenProgress) -> None:
+            task = progress.add_task(f"{description} {season}...", total=len(by_season[season]))
+            processed.extend(self._backfill_games(by_season[season], progress, task, refresh=refresh))
+
+        self._run_seasons(list(by_season), rerun_season)
+
+        return sorted(processed)
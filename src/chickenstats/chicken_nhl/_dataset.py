@@ -0,0 +1,198 @@
+"""Hive-partitioned Parquet datasets of scraped data.
+
+Contains:
+    write_dataset: Writes scraped data to a Parquet dataset partitioned by season, session, and game ID.
+    load_dataset: Lazily scans one data type of a dataset, with partition pruning and predicate pushdown.
+    dataset_game_ids: Returns the game IDs stored for one data type, without reading any files.
+
+Each data type is stored in its own directory, with one Parquet file per game:
+
+    <path>/play_by_play/season=20232024/session=R/game_id=2023020001/0.parquet
+
+Files are written with the data type's Polars schema, so every game of a data type can be
+scanned together. Rewriting a game replaces its file, so re-scraping a game never duplicates rows.
+
+Game- or period-level ``stats``, ``lines``, and ``team_stats`` tables are stored the same way, so
+derived tables grow one game at a time alongside the play-by-play data they are built from.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from chickenstats.chicken_nhl._game_core import _DATA_SCHEMAS
+from chickenstats.chicken_nhl._game_utils import season_and_session
+from chickenstats.chicken_nhl._result_cache import _atomic_write
+from chickenstats.exceptions import InvalidInputError
+from chickenstats.utilities.utilities import _to_polars
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Hive partition columns, outermost first, with the dtypes they are read back as
+_PARTITION_SCHEMA: dict[str, pl.DataType] = {"season": pl.Int64(), "session": pl.String(), "game_id": pl.Int64()}
+
+# Aggregated tables, whose columns depend on the options they were aggregated with
+_DERIVED_KINDS: tuple[str, ...] = ("stats", "lines", "team_stats")
+
+
+def _check_kind(kind: str) -> dict | None:
+    """Return the Polars schema of a data type (``None`` for derived tables), raising for unknown types."""
+    if kind in _DERIVED_KINDS:
+        return None
+
+    if kind not in _DATA_SCHEMAS:
+        raise InvalidInputError(f"kind must be one of {sorted([*_DATA_SCHEMAS, *_DERIVED_KINDS])}, got {kind!r}")
+
+    return _DATA_SCHEMAS[kind]
+
+
+def write_dataset(data: pl.DataFrame | pd.DataFrame | pa.Table, path: str | Path, kind: str = "play_by_play") -> None:
+    """Write scraped data to a Parquet dataset partitioned by season, session, and game ID.
+
+    Each game is written to its own file, replacing any earlier file for that game, so data can
+    be appended one game or one season at a time. Partition columns are stored in the directory
+    names rather than the files and are restored by ``load_dataset``.
+
+    Parameters:
+        data (pl.DataFrame | pd.DataFrame | pa.Table):
+            Data for one or more games, with the columns of the matching Scraper property,
+            e.g., ``scraper.play_by_play``
+        path (str | Path):
+            Root directory of the dataset. The data is written under ``path / kind``.
+        kind (str):
+            Data type being written, e.g., ``"play_by_play"``, ``"shifts"``, or ``"stats"``.
+            Default ``"play_by_play"``.
+
+    Raises:
+        InvalidInputError: If ``kind`` is not a supported data type or ``data`` is missing its columns,
+            e.g., ``stats`` aggregated to the season level, which have no ``game_id``.
+
+    Examples:
+        Write a season's play-by-play data
+        >>> from chickenstats.chicken_nhl import Scraper, write_dataset
+        >>> scraper = Scraper(game_ids)
+        >>> write_dataset(scraper.play_by_play, "./nhl_data")
+
+        Shifts and game-level stats are stored alongside, in their own directories
+        >>> write_dataset(scraper.shifts, "./nhl_data", kind="shifts")
+        >>> write_dataset(scraper.stats, "./nhl_data", kind="stats")
+    """
+    schema = _check_kind(kind)
+    df = _to_polars(data)
+
+    missing = [column for column in (schema or _PARTITION_SCHEMA) if column not in df.columns]
+    if missing:
+        raise InvalidInputError(f"data is missing {kind} columns: {missing}")
+
+    if df.is_empty():
+        return
+
+    if schema is None:
+        schema = {
+            **_PARTITION_SCHEMA,
+            **{column: dtype for column, dtype in df.schema.items() if column not in _PARTITION_SCHEMA},
+        }
+
+    # play_by_play_ext only carries the event ID, which is the game ID followed by a four-digit index
+    game_id = pl.col("game_id") if "game_id" in schema else pl.col("id") // 10_000
+
+    df = df.select([pl.col(column).cast(dtype) for column, dtype in schema.items()]).with_columns(
+        game_id.alias("_partition_game_id")
+    )
+
+    partition_columns = [column for column in _PARTITION_SCHEMA if column in schema]
+
+    for (game_id_value,), game_df in df.partition_by(
+        "_partition_game_id", as_dict=True, include_key=False, maintain_order=True
+    ).items():
+        season, session = season_and_session(game_id_value)
+
+        game_dir = Path(path) / kind / f"season={season}" / f"session={session}" / f"game_id={game_id_value}"
+        game_dir.mkdir(parents=True, exist_ok=True)
+
+        _atomic_write(game_dir / "0.parquet", game_df.drop(partition_columns).write_parquet)
+
+
+def load_dataset(path: str | Path, kind: str = "play_by_play") -> pl.LazyFrame:
+    """Lazily scan one data type of a dataset written by ``write_dataset`` or ``Scraper.to_dataset``.
+
+    Filters on ``season``, ``session``, or ``game_id`` skip the directories of other games
+    entirely, and other filters are pushed down to the Parquet row groups, so only the data a
+    query needs is read from disk.
+
+    Parameters:
+        path (str | Path):
+            Root directory of the dataset
+        kind (str):
+            Data type to scan, e.g., ``"play_by_play"``, ``"shifts"``, or ``"stats"``.
+            Default ``"play_by_play"``.
+
+    Returns:
+        pl.LazyFrame:
+            Data with the columns of the matching Scraper property, followed by any partition
+            columns the data type does not otherwise have. Empty if nothing has been written.
+
+    Raises:
+        InvalidInputError: If ``kind`` is not a supported data type.
+
+    Examples:
+        Load one team's 5v5 events for a season
+        >>> import polars as pl
+        >>> from chickenstats.chicken_nhl import load_dataset
+        >>> pbp = (
+        ...     load_dataset("./nhl_data")
+        ...     .filter(pl.col("season") == 20232024, pl.col("event_team") == "NSH", pl.col("strength_state") == "5v5")
+        ...     .collect()
+        ... )
+    """
+    schema = _check_kind(kind)
+
+    # Derived tables lead with their partition columns, as they are returned by the Scraper
+    columns = (
+        [*_PARTITION_SCHEMA, pl.exclude(*_PARTITION_SCHEMA)]
+        if schema is None
+        else [*schema, *(column for column in _PARTITION_SCHEMA if column not in schema)]
+    )
+
+    root = Path(path) / kind
+
+    if not any(root.glob("**/*.parquet")):
+        return pl.LazyFrame(schema={**(schema or {}), **_PARTITION_SCHEMA}).select(columns)
+
+    lf = pl.scan_parquet(root / "**" / "*.parquet", hive_partitioning=True, hive_schema=_PARTITION_SCHEMA)
+
+    return lf.select(columns)
+
+
+def dataset_game_ids(path: str | Path, kind: str = "play_by_play") -> set[int]:
+    """Return the IDs of the games stored for one data type, read from the partition directory names.
+
+    Parameters:
+        path (str | Path):
+            Root directory of the dataset
+        kind (str):
+            Data type to list, e.g., ``"play_by_play"``. Default ``"play_by_play"``.
+
+    Returns:
+        set[int]:
+            Game IDs with a file in the dataset. Empty if nothing has been written.
+
+    Raises:
+        InvalidInputError: If ``kind`` is not a supported data type.
+
+    Examples:
+        Find the games of a season that still need to be scraped
+        >>> from chickenstats.chicken_nhl import dataset_game_ids
+        >>> missing = set(game_ids) - dataset_game_ids("./nhl_data")
+    """
+    _check_kind(kind)
+
+    return {
+        int(game_file.parent.name.removeprefix("game_id="))
+        for game_file in (Path(path) / kind).glob("season=*/session=*/game_id=*/0.parquet")
+    }
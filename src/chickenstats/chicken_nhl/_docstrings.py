@@ -1518,6 +1518,10 @@ _PREP_PROGRESS_PARAMS: dict[str, tuple[str, str]] = {
         "bool | None",
         "Override the Scraper-level ``transient_progress_bar`` setting for this call. Default ``None``",
     ),
+    "streaming": (
+        "bool",
+        "Collect the aggregation query plan with Polars' streaming engine to lower peak memory. Default ``False``",
+    ),
 }
 
 _LINES_POSITION_PARAM: dict[str, tuple[str, str]] = {
@@ -1913,9 +1917,12 @@ Examples:
 _PREP_STATS_DOC = f"""\
 Prepare (or re-prepare) the combined individual + on-ice stats DataFrame.
 
-Computes ``ind_stats`` and ``oi_stats`` concurrently via ``ThreadPoolExecutor``,
-then merges them into ``stats``. Call this to change aggregation options; subsequent
+Builds ``ind_stats``, ``oi_stats``, and the merged ``stats`` as one lazy Polars query
+plan and collects it once. Call this to change aggregation options; subsequent
 accesses to ``stats``, ``ind_stats``, and ``oi_stats`` will reflect the new settings.
+Results for recently used settings are kept in the Scraper's stats cache, so switching
+back to them does not re-aggregate. After ``add_games``, only the new games are aggregated
+and summed into the existing results.
 
 {_build_params(_STATS_COMMON_PARAMS | _PREP_PROGRESS_PARAMS)}
 
@@ -1937,6 +1944,13 @@ Examples:
     Re-prepare to add teammate splits
     >>> scraper.prep_stats(level="game", teammates=True)
 
+    Switching back to season-level stats reuses the cached result
+    >>> scraper.prep_stats(level="season", score=True)
+
+    After adding games, only the new games are aggregated
+    >>> scraper.add_games(2023020011)
+    >>> scraper.prep_stats(level="season", score=True)
+
     You can also chain the prep method with the stats property you're calling
     >>> stats = scraper.prep_stats(level="season").stats
 """
@@ -1973,6 +1987,8 @@ Prepare (or re-prepare) the line-level stats DataFrame.
 
 Aggregates on-ice stats by forward or defense line groupings. Call this to change
 aggregation options; subsequent accesses to ``lines`` will reflect the new settings.
+Results for recently used settings are kept in the Scraper's stats cache, and only games
+added since with ``add_games`` are aggregated when they are prepared again.
 
 {_build_params(_LINES_POSITION_PARAM | _STATS_COMMON_PARAMS | _PREP_PROGRESS_PARAMS)}
 
@@ -2026,7 +2042,9 @@ _PREP_TEAM_STATS_DOC = f"""\
 Prepare (or re-prepare) the team-level stats DataFrame.
 
 Aggregates on-ice stats by team. Call this to change aggregation options; subsequent
-accesses to ``team_stats`` will reflect the new settings.
+accesses to ``team_stats`` will reflect the new settings. Results for recently used
+settings are kept in the Scraper's stats cache, and only games added since with
+``add_games`` are aggregated when they are prepared again.
 
 {_build_params({k: v for k, v in (_STATS_COMMON_PARAMS | _PREP_PROGRESS_PARAMS).items() if k != "teammates"})}
 
@@ -2075,3 +2093,79 @@ Examples:
     You can also chain the prep method with the stats property you're calling
     >>> team_stats = scraper.prep_team_stats(level="season").team_stats
 """
+
+_LEVELS_PARAM: dict[str, tuple[str, str]] = {
+    "levels": (
+        "list[AggLevel | Literal['period', 'game', 'session', 'season']] | None",
+        "Aggregation levels to return. Aggregated once at the finest level, then rolled up. "
+        "Default ``['game', 'season']``",
+    )
+}
+
+_BY_LEVEL_PARAMS = _LEVELS_PARAM | {
+    k: v for k, v in (_STATS_COMMON_PARAMS | _PREP_PROGRESS_PARAMS).items() if k != "level"
+}
+
+_STATS_BY_LEVEL_DOC = f"""\
+Aggregate combined individual + on-ice stats at several levels at once.
+
+Aggregates the play-by-play once at the finest requested level, then sums those totals
+up to each coarser level and recomputes the per-60 and percentage columns. Each frame
+matches ``stats`` after ``prep_stats`` with that level. The cached ``stats`` frame is
+not changed.
+
+{_build_params(_BY_LEVEL_PARAMS)}
+
+Returns:
+    dict[str, DataFrame]: Stats keyed by aggregation level, finest first.
+
+Examples:
+    >>> from chickenstats.chicken_nhl import Scraper
+    >>> scraper = Scraper(list(range(2023020001, 2023020011)))
+
+    Period, game, and season stats from one aggregation
+    >>> stats = scraper.stats_by_level(levels=["period", "game", "season"])
+    >>> season_stats = stats["season"]
+"""
+
+_LINES_BY_LEVEL_DOC = f"""\
+Aggregate line-level stats at several levels at once.
+
+Aggregates the play-by-play once at the finest requested level, then sums those totals
+up to each coarser level and recomputes the per-60 and percentage columns. Each frame
+matches ``lines`` after ``prep_lines`` with that level. The cached ``lines`` frame is
+not changed.
+
+{_build_params(_LINES_POSITION_PARAM | _BY_LEVEL_PARAMS)}
+
+Returns:
+    dict[str, DataFrame]: Line stats keyed by aggregation level, finest first.
+
+Examples:
+    >>> from chickenstats.chicken_nhl import Scraper
+    >>> scraper = Scraper(list(range(2023020001, 2023020011)))
+
+    Game and season defense pairs from one aggregation
+    >>> lines = scraper.lines_by_level(position="d", levels=["game", "season"])
+"""
+
+_TEAM_STATS_BY_LEVEL_DOC = f"""\
+Aggregate team-level stats at several levels at once.
+
+Aggregates the play-by-play once at the finest requested level, then sums those totals
+up to each coarser level and recomputes the per-60 and percentage columns. Each frame
+matches ``team_stats`` after ``prep_team_stats`` with that level. The cached
+``team_stats`` frame is not changed.
+
+{_build_params({k: v for k, v in _BY_LEVEL_PARAMS.items() if k != "teammates"})}
+
+Returns:
+    dict[str, DataFrame]: Team stats keyed by aggregation level, finest first.
+
+Examples:
+    >>> from chickenstats.chicken_nhl import Scraper
+    >>> scraper = Scraper(list(range(2023020001, 2023020011)))
+
+    Game and season team stats from one aggregation
+    >>> team_stats = scraper.team_stats_by_level(levels=["game", "season"], score=True)
+"""
@@ -154,12 +154,16 @@ class _GameAPIMixin(_GameBase):
 
         # Transform raw plays into structured event dicts, then apply versioning and Pydantic validation
         assert self.api_response is not None
-        event_list = [
-            self._munge_single_api_event(event, teams_dict, roster_lookup)
-            for event in self.api_response.get("plays", [])
-        ]
+        with self._stage("munge_api_events") as stage:
+            event_list = [
+                self._munge_single_api_event(event, teams_dict, roster_lookup)
+                for event in self.api_response.get("plays", [])
+            ]
 
-        return apply_event_versioning(event_list)
+            api_events = apply_event_versioning(event_list, self._validation)
+            stage["rows"] = len(api_events)
+
+        return api_events
 
     @property
     @shared_doc(_GAME_API_EVENTS_DF_DOC)
@@ -213,13 +217,16 @@ class _GameAPIMixin(_GameBase):
             self._fetch_api_data()
 
         assert self.api_response is not None
-        # Transform each rosterSpots entry into a normalized player dict
-        players = [self._munge_api_player(player) for player in self.api_response.get("rosterSpots", [])]
+        with self._stage("munge_api_rosters") as stage:
+            # Transform each rosterSpots entry into a normalized player dict
+            players = [self._munge_api_player(player) for player in self.api_response.get("rosterSpots", [])]
+
+            # Apply external fixes for known data gaps (e.g., missing players)
+            new_player = api_rosters_fixes(season=self.season, session=self.session, game_id=self.game_id)
+            if new_player:
+                players.append(APIRosterPlayer.model_validate(new_player).model_dump())
 
-        # Apply external fixes for known data gaps (e.g., missing players)
-        new_player = api_rosters_fixes(season=self.season, session=self.session, game_id=self.game_id)
-        if new_player:
-            players.append(APIRosterPlayer.model_validate(new_player).model_dump())
+            stage["rows"] = len(players)
 
         return sorted(players, key=lambda k: (k["team_venue"], k["player_name"]))
 
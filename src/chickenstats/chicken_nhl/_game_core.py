@@ -1,15 +1,62 @@
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 from datetime import datetime as dt, timezone
 from typing import TYPE_CHECKING, Literal
 from zoneinfo import ZoneInfo
 
 import polars as pl
 
-from chickenstats.exceptions import InvalidGameIDError
+if TYPE_CHECKING:
+    import pandas as pd
+
+from chickenstats.exceptions import InvalidGameIDError, InvalidInputError
 from chickenstats.utilities.enums import Backend
 from chickenstats.utilities.utilities import ChickenSession, _to_backend
-from chickenstats.chicken_nhl._game_utils import prefetch_concurrent, _get_score_adjustments
+from chickenstats.chicken_nhl._game_utils import (
+    prefetch_concurrent,
+    _get_score_adjustments,
+    is_game_settled,
+    record_stage,
+    season_and_session,
+)
+from chickenstats.chicken_nhl.validation_polars import (
+    api_events_polars_schema,
+    api_rosters_polars_schema,
+    changes_polars_schema,
+    html_events_polars_schema,
+    html_rosters_polars_schema,
+    pbp_ext_polars_schema,
+    pbp_polars_schema,
+    rosters_polars_schema,
+    shifts_polars_schema,
+    xg_polars_schema,
+)
+
+# Polars schema of each Game data property, keyed by property name
+_DATA_SCHEMAS: dict[str, dict] = {
+    "api_events": api_events_polars_schema,
+    "api_rosters": api_rosters_polars_schema,
+    "changes": changes_polars_schema,
+    "html_events": html_events_polars_schema,
+    "html_rosters": html_rosters_polars_schema,
+    "rosters": rosters_polars_schema,
+    "shifts": shifts_polars_schema,
+    "play_by_play": pbp_polars_schema,
+    "play_by_play_ext": pbp_ext_polars_schema,
+    "xg_fields": xg_polars_schema,
+}
+
+# Columns of the per-stage metrics recorded by each Game — ``start`` is a Unix timestamp in seconds,
+# ``bytes`` is only set by fetch stages and ``rows`` by stages that produce records
+_STAGE_METRICS_SCHEMA: dict[str, pl.DataType] = {
+    "game_id": pl.Int64(),
+    "stage": pl.String(),
+    "start": pl.Float64(),
+    "seconds": pl.Float64(),
+    "bytes": pl.Int64(),
+    "rows": pl.Int64(),
+}
 
 
 class _GameBase:
@@ -33,6 +80,9 @@ class _GameBase:
         away_shifts_endpoint: str
         html_events_endpoint: str
         _requests_session: ChickenSession
+        _html_parser: str
+        _validation: str
+        stage_metrics: list[dict]
 
         # Score-adjustment state (from _GameCore.__init__)
         _score_adjustments: dict
@@ -52,7 +102,8 @@ class _GameBase:
         def _fetch_html_events(self) -> list: ...
         def _fetch_html_rosters(self) -> list: ...
         def _fetch_shifts(self) -> list: ...
-        def _finalize_dataframe(self, data: list, schema: pl.Schema) -> pl.DataFrame: ...
+        def _stage(self, stage: str) -> AbstractContextManager[dict]: ...
+        def _finalize_dataframe(self, data: list | pl.DataFrame, schema: pl.Schema) -> pl.DataFrame: ...
 
 
 class _GameCore(_GameBase):
@@ -61,6 +112,8 @@ class _GameCore(_GameBase):
         game_id: str | int | float,
         requests_session: ChickenSession | None = None,
         backend: Backend | Literal["pandas", "polars", "pyarrow", "narwhals"] = "polars",
+        html_parser: Literal["lxml", "bs4"] = "lxml",
+        validation: Literal["polars", "pydantic"] = "polars",
     ):
         """Instantiate a Game object for a given NHL game ID.
 
@@ -70,9 +123,17 @@ class _GameCore(_GameBase):
                 scraping multiple games. A new session is created if not provided.
             backend: DataFrame library to use for ``_df`` properties. One of ``"polars"``
                 (default), ``"pandas"``, ``"pyarrow"``, or ``"narwhals"``.
+            html_parser: Parser used for the HTML reports. ``"lxml"`` (default) parses with
+                ``lxml.html`` and XPath; ``"bs4"`` uses the original BeautifulSoup parser.
+                Both produce identical output.
+            validation: How API events, play-by-play, and xG rows are validated. ``"polars"``
+                (default) validates and coerces each game column-wise against the Polars schemas;
+                ``"pydantic"`` validates every event with its Pydantic model (slower, for debugging).
 
         Raises:
             InvalidGameIDError: If ``game_id`` is not a 10-digit integer string.
+            InvalidInputError: If ``html_parser`` is not ``"lxml"`` or ``"bs4"``, or ``validation``
+                is not ``"polars"`` or ``"pydantic"``.
 
         Examples:
             >>> from chickenstats.chicken_nhl import Game
@@ -86,20 +147,22 @@ class _GameCore(_GameBase):
         if str(game_id).isdigit() is False or len(str(game_id)) != 10:
             raise InvalidGameIDError(f"{game_id!r} is not a valid game ID")
 
+        if html_parser not in ("lxml", "bs4"):
+            raise InvalidInputError(f"html_parser must be 'lxml' or 'bs4', got {html_parser!r}")
+
+        if validation not in ("polars", "pydantic"):
+            raise InvalidInputError(f"validation must be 'polars' or 'pydantic', got {validation!r}")
+
         self._backend: str = backend
+        self._html_parser: str = html_parser
+        self._validation: str = validation
 
         self.game_id: int = int(game_id)
 
-        # Season derived from the first four digits of the game ID (the start year)
-        year = int(str(self.game_id)[0:4])
-        self.season: int = int(f"{year}{year + 1}")
-
-        # Digits 5-6 of the game ID encode the session type:
-        #   01 = PR (preseason), 02 = R (regular season), 03 = P (playoffs),
-        #   19 = FO (Four Nations Faceoff, international mid-season competition, 2024-25+)
-        game_sessions = {"01": "PR", "02": "R", "03": "P", "19": "FO"}
-        game_session: str = str(self.game_id)[4:6]
-        self.session: str = game_sessions[game_session]
+        # Season from the first four digits of the game ID, session type from digits 5-6
+        season, session = season_and_session(self.game_id)
+        self.season: int = season
+        self.session: str = session
 
         # Digits 5-10 form the HTML report ID used to construct nhl.com report URLs
         self.html_id: str = str(game_id)[4:]
@@ -141,6 +204,9 @@ class _GameCore(_GameBase):
         self._raw_html_rosters: list | None = None
         self._raw_shifts: list | None = None
 
+        # Wall time, bytes downloaded, and rows produced by each pipeline stage, in completion order
+        self.stage_metrics: list[dict] = []
+
     def __repr__(self) -> str:
         """Return a string representation of the Game object."""
         return f"Game(game_id={self.game_id}, season={self.season}, session={self.session!r})"
@@ -159,7 +225,11 @@ class _GameCore(_GameBase):
         if self.api_response is not None:
             return
 
-        response: dict = self._requests_session.get(self.api_endpoint).json()
+        with self._stage("fetch_api") as stage:
+            api_response = self._requests_session.get(self.api_endpoint)
+            stage["bytes"] = len(api_response.content or b"")
+
+        response: dict = api_response.json()
         self.api_response = response
 
         # Away team information
@@ -216,6 +286,19 @@ class _GameCore(_GameBase):
             self.current_period = response["periodDescriptor"]["number"]
             self.current_period_type = response["periodDescriptor"]["periodType"]
 
+        # Completed games never change, so a caching session can serve their reports from disk
+        if isinstance(self._requests_session, ChickenSession) and self._requests_session.cache_dir is not None:
+            if is_game_settled(response, self._requests_session.cache_settle_days):
+                self._requests_session.mark_settled(
+                    [
+                        self.api_endpoint,
+                        self.html_rosters_endpoint,
+                        self.html_events_endpoint,
+                        self.home_shifts_endpoint,
+                        self.away_shifts_endpoint,
+                    ]
+                )
+
     def prefetch(self) -> None:
         """Pre-fetch all raw network data in parallel to warm the cache.
 
@@ -236,11 +319,64 @@ class _GameCore(_GameBase):
         _ = self.html_rosters
         _ = self.shifts
 
-    def _finalize_dataframe(self, data: list, schema: pl.Schema) -> pl.DataFrame:
+    def _stage(self, stage: str) -> AbstractContextManager[dict]:
+        """Time a pipeline stage and append its record to ``stage_metrics``.
+
+        Used as a context manager that yields the stage's record, so the stage can fill in
+        the ``bytes`` it downloaded and the ``rows`` it produced.
+
+        Examples:
+            >>> with self._stage("munge_shifts") as stage:
+            ...     shifts = self._munge_shifts(raw_shifts, actives, scratches)
+            ...     stage["rows"] = len(shifts)
+        """
+        return record_stage(self.stage_metrics, self.game_id, stage)
+
+    @property
+    def stage_metrics_df(self) -> pd.DataFrame | pl.DataFrame:
+        """Wall time, bytes downloaded, and rows produced by each pipeline stage run so far.
+
+        One row per stage run, in completion order, with the columns ``game_id``, ``stage``,
+        ``start`` (Unix timestamp), ``seconds``, ``bytes``, and ``rows``. Stages only run when the
+        data that needs them is first accessed, e.g., ``merge``, ``state``, ``validate``, and
+        ``xg`` run on the first access of the play-by-play data.
+
+        Examples:
+            >>> game = Game(2023020001)
+            >>> game.play_by_play
+            >>> game.stage_metrics_df.sort("seconds", descending=True)
+        """
+        return _to_backend(pl.from_dicts(self.stage_metrics, schema=_STAGE_METRICS_SCHEMA), self._backend)
+
+    def _frame(self, key: str) -> pl.DataFrame:
+        """Return the data behind property ``key`` (e.g., ``"shifts"``) as a typed Polars DataFrame.
+
+        Pipelines that build their output column-wise (play-by-play, extended play-by-play,
+        and xG fields) expose it as a ``_<key>_frame`` attribute, which is returned as-is;
+        other properties are converted from their list of dicts.
+        """
+        frame = getattr(self, f"_{key}_frame", None)
+
+        if frame is not None:
+            return frame
+
+        data = getattr(self, key)
+
+        with self._stage("to_frame") as stage:
+            frame = pl.from_dicts(data=data, schema=_DATA_SCHEMAS[key])
+            stage["rows"] = frame.height
+
+        return frame
+
+    def _finalize_dataframe(self, data: list | pl.DataFrame, schema: pl.Schema) -> pl.DataFrame:
         """Build a typed Polars DataFrame from ``data`` and convert it to the requested backend.
 
+        Only a conversion from a list of dicts is recorded as a ``to_frame`` stage; frames that
+        are already built are converted to the backend without adding a stage record.
+
         Parameters:
-            data: List of dicts produced by a scrape pipeline (e.g., ``play_by_play``).
+            data: List of dicts produced by a scrape pipeline (e.g., ``shifts``), or a Polars
+                DataFrame already built with ``schema``.
             schema: Polars schema that enforces column names and dtypes, defined in
                 ``validation_polars.py``.
 
@@ -248,5 +384,10 @@ class _GameCore(_GameBase):
             DataFrame in the backend specified at instantiation (polars, pandas, pyarrow,
             or narwhals).
         """
-        df = pl.from_dicts(data=data, schema=schema)
-        return _to_backend(df, self._backend)
+        if isinstance(data, pl.DataFrame):
+            return _to_backend(data, self._backend)
+
+        with self._stage("to_frame") as stage:
+            df = pl.from_dicts(data=data, schema=schema)
+            stage["rows"] = df.height
+            return _to_backend(df, self._backend)
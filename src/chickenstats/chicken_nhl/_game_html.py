@@ -24,7 +24,13 @@ from chickenstats.chicken_nhl._corrections import (
     html_shifts_fixes,
     individual_shifts_fixes,
 )
-from chickenstats.chicken_nhl._game_utils import aggregate_players, hs_strip_html, prefetch_concurrent
+from chickenstats.chicken_nhl._game_utils import (
+    aggregate_players,
+    hs_strip_html,
+    lxml_shift_cells,
+    lxml_strip_html,
+    prefetch_concurrent,
+)
 from chickenstats.chicken_nhl._player_names import correct_player_name, correct_names_dict
 from chickenstats.chicken_nhl.team import team_codes
 from chickenstats.chicken_nhl.validation_pydantic import ChangeEvent, HTMLEvent, HTMLRosterPlayer, PlayerShift
@@ -210,7 +216,9 @@ class _GameHTMLMixin(_GameBase):
             return []
 
         # Transformation worker: passes shifts to O(N) grouping method
-        final_changes = self._munge_changes(shifts)
+        with self._stage("munge_changes") as stage:
+            final_changes = self._munge_changes(shifts)
+            stage["rows"] = len(final_changes)
 
         return final_changes
 
@@ -226,7 +234,8 @@ class _GameHTMLMixin(_GameBase):
         """Fetch raw HTML play-by-play events and cache them on ``self._raw_html_events``.
 
         Idempotent — returns the cached list immediately on subsequent calls.
-        Decodes ISO-8859-1, strips HTML tags via ``hs_strip_html``, applies unicode
+        Decodes ISO-8859-1, extracts the report cells with ``lxml_strip_html`` (or
+        BeautifulSoup + ``hs_strip_html`` when ``html_parser="bs4"``), applies unicode
         normalisation, and reshapes into (N, 8) event rows before returning.
         Returns an empty list if the endpoint is unreachable or the page has no content.
         """
@@ -237,64 +246,75 @@ class _GameHTMLMixin(_GameBase):
         s = self._requests_session
 
         try:
-            response = s.get(url)
+            with self._stage("fetch_html_events") as stage:
+                response = s.get(url)
+                stage["bytes"] = len(response.content or b"")
         except RetryError:
             self._raw_html_events = []
             return self._raw_html_events
 
-        soup = BeautifulSoup(response.content.decode("ISO-8859-1"), "lxml")
-        events = []
+        with self._stage("parse_html_events") as stage:
+            events = []
 
-        if soup.find("html") is None:
-            self._raw_html_events = []
-            return self._raw_html_events
+            if self._html_parser == "lxml":
+                events_data = lxml_strip_html(response.content)
 
-        tds = soup.find_all("td", {"class": re.compile(".*bborder.*")})
-        events_data = hs_strip_html(tds)
-        del soup
-        events_data = [unidecode(x).replace("\n ", ", ").replace("\n", "") for x in events_data]
-
-        length = int(len(events_data) / 8)
-        events_data = np.array(events_data).reshape(length, 8)
-
-        for _idx, event in enumerate(events_data):
-            column_names = [
-                "event_idx",
-                "period",
-                "strength",
-                "time",
-                "event",
-                "description",
-                "away_skaters",
-                "home_skaters",
-            ]
+            else:
+                soup = BeautifulSoup(response.content.decode("ISO-8859-1"), "lxml")
+
+                if soup.find("html") is None:
+                    self._raw_html_events = []
+                    return self._raw_html_events
+
+                tds = soup.find_all("td", {"class": re.compile(".*bborder.*")})
+                events_data = hs_strip_html(tds)
+                del soup
+
+            events_data = [unidecode(x).replace("\n ", ", ").replace("\n", "") for x in events_data]
+
+            length = int(len(events_data) / 8)
+            events_data = np.array(events_data).reshape(length, 8)
+
+            for _idx, event in enumerate(events_data):
+                column_names = [
+                    "event_idx",
+                    "period",
+                    "strength",
+                    "time",
+                    "event",
+                    "description",
+                    "away_skaters",
+                    "home_skaters",
+                ]
+
+                if "#" in event:
+                    continue
 
-            if "#" in event:
-                continue
+                event_dict = dict(zip(column_names, event, strict=True))
 
-            event_dict = dict(zip(column_names, event, strict=True))
+                # Ensure period is handled as an integer immediately
+                period_val = int(event_dict["period"]) if event_dict["period"].isdigit() else 1
 
-            # Ensure period is handled as an integer immediately
-            period_val = int(event_dict["period"]) if event_dict["period"].isdigit() else 1
+                new_values = {
+                    "season": self.season,
+                    "session": self.session,
+                    "game_id": self.game_id,
+                    "event_idx": int(event_dict["event_idx"]),
+                    "description": unidecode(event_dict["description"]).upper(),
+                    "period": period_val,
+                }
 
-            new_values = {
-                "season": self.season,
-                "session": self.session,
-                "game_id": self.game_id,
-                "event_idx": int(event_dict["event_idx"]),
-                "description": unidecode(event_dict["description"]).upper(),
-                "period": period_val,
-            }
+                event_dict.update(new_values)
 
-            event_dict.update(new_values)
+                # Handle specific missing events
+                if self.game_id == 2022020194 and event_dict["event_idx"] == 134:
+                    continue
+                if self.game_id == 2022020673 and event_dict["event_idx"] == 208:
+                    continue
 
-            # Handle specific missing events
-            if self.game_id == 2022020194 and event_dict["event_idx"] == 134:
-                continue
-            if self.game_id == 2022020673 and event_dict["event_idx"] == 208:
-                continue
+                events.append(event_dict)
 
-            events.append(event_dict)
+            stage["rows"] = len(events)
 
         self._raw_html_events = events
         return self._raw_html_events
@@ -651,7 +671,9 @@ class _GameHTMLMixin(_GameBase):
         }
 
         # 3. Transformation Worker
-        final_events = self._munge_html_events(raw_events, actives, scratches)
+        with self._stage("munge_html_events") as stage:
+            final_events = self._munge_html_events(raw_events, actives, scratches)
+            stage["rows"] = len(final_events)
 
         # 4. Sort and return
         return sorted(final_events, key=lambda k: k["event_idx"])
@@ -673,7 +695,9 @@ class _GameHTMLMixin(_GameBase):
             return self._raw_html_rosters
 
         try:
-            page = self._requests_session.get(self.html_rosters_endpoint)
+            with self._stage("fetch_html_rosters") as stage:
+                page = self._requests_session.get(self.html_rosters_endpoint)
+                stage["bytes"] = len(page.content or b"")
             if page.status_code == 404:
                 self._raw_html_rosters = []
                 return self._raw_html_rosters
@@ -811,7 +835,9 @@ class _GameHTMLMixin(_GameBase):
             return []
 
         # Step 2: Functional transformation and Pydantic validation
-        cleaned_players = [self._munge_single_html_player(player) for player in raw_players]
+        with self._stage("munge_html_rosters") as stage:
+            cleaned_players = [self._munge_single_html_player(player) for player in raw_players]
+            stage["rows"] = len(cleaned_players)
 
         # Step 3: Sort and return
         return sorted(cleaned_players, key=lambda k: (k["team_venue"], k["status"], k["player_name"]))
@@ -823,28 +849,41 @@ class _GameHTMLMixin(_GameBase):
         return self._finalize_dataframe(data=self.html_rosters, schema=html_rosters_polars_schema)
 
     def _parse_team_shifts(self, team_venue: str, response) -> list:
-        """Parse shift data for a single team (HOME or AWAY) from an already-fetched response."""
+        """Parse shift data for a single team (HOME or AWAY) from an already-fetched response.
+
+        Cell text is extracted with ``lxml_shift_cells`` (or BeautifulSoup when
+        ``html_parser="bs4"``), then each player's cells are sliced into five-column
+        shift records without building intermediate arrays.
+        """
         team_shifts = []
 
-        soup = BeautifulSoup(response.content.decode("ISO-8859-1"), "lxml", multi_valued_attributes=None)
+        if self._html_parser == "lxml":
+            team_name, cells = lxml_shift_cells(response.content)
+
+        else:
+            soup = BeautifulSoup(response.content.decode("ISO-8859-1"), "lxml", multi_valued_attributes=None)
+
+            team_name_td = soup.find("td", {"align": "center", "class": "teamHeading + border"})
+            team_name = team_name_td.get_text() if team_name_td else None
+
+            players = soup.find_all("td", {"class": ["playerHeading + border", "lborder + bborder"]})
+            cells = [player.get_text() for player in players]
+            del soup
 
-        team_name_td = soup.find("td", {"align": "center", "class": "teamHeading + border"})
-        if not team_name_td:
+        if team_name is None:
             return team_shifts
 
-        team_name = unidecode(team_name_td.get_text())
+        team_name = unidecode(team_name)
         if team_name == "PHOENIX COYOTES":
             team_name = "ARIZONA COYOTES"
         elif "CANADIENS" in team_name:
             team_name = "MONTREAL CANADIENS"
 
-        players = soup.find_all("td", {"class": ["playerHeading + border", "lborder + bborder"]})
         players_dict = {}
         full_name = " "
         eh_id = None
 
-        for player in players:
-            data = player.get_text()
+        for data in cells:
             if ", " in data:
                 name = data.split(",", 1)
                 last_name = name[0].split(" ", 1)[1].strip()
@@ -859,24 +898,35 @@ class _GameHTMLMixin(_GameBase):
                 players_dict[eh_id] = {"player_name": full_name, "eh_id": eh_id, "jersey": jersey, "shifts": []}
             else:
                 if eh_id is not None and full_name != " ":
-                    cast(list, players_dict[eh_id]["shifts"]).extend([data])
+                    cast(list, players_dict[eh_id]["shifts"]).append(data)
+
+        headers = ["shift_count", "period", "shift_start", "shift_end", "duration"]
+        team = team_codes.get(team_name, "")
+        team_venue_name = team_venue.upper()
+
+        for shifts in players_dict.values():
+            shift_cells = cast(list, shifts["shifts"])
+            if len(shift_cells) % 5 != 0:
+                raise ValueError(f"{len(shift_cells)} shift cells for {shifts['player_name']} is not a multiple of 5")
 
-        for player, shifts in players_dict.items():
-            length = int(len(np.array(shifts["shifts"])) / 5)
             player_name = cast(str, shifts["player_name"])
             eh_id = shifts["eh_id"]
-            team = team_codes.get(team_name, "")
-            team_venue_name = team_venue.upper()
             team_jersey = f"{team}{shifts['jersey']}"
             jersey = cast(int, shifts["jersey"])
 
-            for _number, shift in enumerate(np.array(shifts["shifts"]).reshape(length, 5)):
-                headers = ["shift_count", "period", "shift_start", "shift_end", "duration"]
-                shift_dict = dict(zip(headers, shift.flatten(), strict=True))
+            for start in range(0, len(shift_cells), 5):
+                shift_dict = dict(zip(headers, shift_cells[start : start + 5], strict=True))
                 shift_dict = individual_shifts_fixes(
                     game_id=self.game_id, player_name=player_name, shift_dict=shift_dict
                 )
 
+                shift_start = unidecode(shift_dict["shift_start"]).strip()
+                shift_end = unidecode(shift_dict["shift_end"]).strip()
+                start_time = shift_start.split("/", 1)[0].strip()
+
+                if start_time == "31:23":
+                    continue
+
                 shift_dict.update(
                     {
                         "season": self.season,
@@ -891,15 +941,14 @@ class _GameHTMLMixin(_GameBase):
                         "jersey": jersey,
                         "period": int(shift_dict["period"].replace("OT", "4").replace("SO", "5")),
                         "shift_count": int(shift_dict["shift_count"]),
-                        "shift_start": unidecode(shift_dict["shift_start"]).strip(),
-                        "start_time": unidecode(shift_dict["shift_start"]).strip().split("/", 1)[0].strip(),
-                        "shift_end": unidecode(shift_dict["shift_end"]).strip(),
-                        "end_time": unidecode(shift_dict["shift_end"]).strip().split("/", 1)[0].strip(),
+                        "shift_start": shift_start,
+                        "start_time": start_time,
+                        "shift_end": shift_end,
+                        "end_time": shift_end.split("/", 1)[0].strip(),
                     }
                 )
 
-                if shift_dict["start_time"] != "31:23":
-                    team_shifts.append(shift_dict)
+                team_shifts.append(shift_dict)
 
         return team_shifts
 
@@ -907,7 +956,7 @@ class _GameHTMLMixin(_GameBase):
         """Fetch shift data for HOME and AWAY teams.
 
         Fetches both team URLs concurrently (I/O only, GIL released during network wait),
-        then parses the responses sequentially (CPU-bound BeautifulSoup, no threading).
+        then parses the responses sequentially (CPU-bound parsing, no threading).
         """
         if self._raw_shifts is not None:
             return self._raw_shifts
@@ -916,7 +965,7 @@ class _GameHTMLMixin(_GameBase):
 
         # Phase 1: concurrent HTTP fetch — I/O-bound, releases GIL during socket reads
         responses: dict = {}
-        with ThreadPoolExecutor(max_workers=2) as executor:
+        with self._stage("fetch_shifts") as stage, ThreadPoolExecutor(max_workers=2) as executor:
             futures = {executor.submit(self._requests_session.get, url): venue for venue, url in endpoints.items()}
             for future in as_completed(futures):
                 venue = futures[future]
@@ -925,14 +974,19 @@ class _GameHTMLMixin(_GameBase):
                 except Exception:  # noqa: BLE001  # pyright: ignore[reportBroadExceptionCaught]
                     logger.debug("Failed to fetch shifts for %s venue", venue, exc_info=True)
 
+            stage["bytes"] = sum(len(response.content or b"") for response in responses.values())
+
         # Phase 2: sequential parse — CPU-bound, runs in this thread only
         game_list = []
-        for venue, response in responses.items():
-            try:
-                game_list.extend(self._parse_team_shifts(venue, response))
-            except Exception:  # noqa: BLE001  # pyright: ignore[reportBroadExceptionCaught]
-                logger.debug("Failed to parse shifts for %s venue", venue, exc_info=True)
-                continue
+        with self._stage("parse_shifts") as stage:
+            for venue, response in responses.items():
+                try:
+                    game_list.extend(self._parse_team_shifts(venue, response))
+                except Exception:  # noqa: BLE001  # pyright: ignore[reportBroadExceptionCaught]
+                    logger.debug("Failed to parse shifts for %s venue", venue, exc_info=True)
+                    continue
+
+            stage["rows"] = len(game_list)
 
         self._raw_shifts = game_list
         return self._raw_shifts
@@ -1187,7 +1241,9 @@ class _GameHTMLMixin(_GameBase):
         # 3. Functional Transformation
         # Because of the inter-shift dependencies (like finding max period time and injecting goalies),
         # we pass the entire list to a dedicated transformation worker rather than a single-shift loop.
-        final_shifts = self._munge_shifts(raw_shifts, actives, scratches)
+        with self._stage("munge_shifts") as stage:
+            final_shifts = self._munge_shifts(raw_shifts, actives, scratches)
+            stage["rows"] = len(final_shifts)
 
         # 4. Sort and return
         return sorted(final_shifts, key=lambda k: (k["period"], k["start_time_seconds"], k["team_venue"]))
@@ -18,8 +18,10 @@ from chickenstats.chicken_nhl._game_utils import (
     calculate_score_adjustment,
     prefetch_concurrent,
 )
+from chickenstats.chicken_nhl._validation_utils import validate_records_columnar
+from chickenstats.chicken_nhl._xg_features import build_xg_fields
 from chickenstats.chicken_nhl.validation_pydantic import PBPEvent, PBPEventExt, XGFields
-from chickenstats.chicken_nhl.validation_polars import pbp_polars_schema, xg_polars_schema
+from chickenstats.chicken_nhl.validation_polars import pbp_ext_polars_schema, pbp_polars_schema, xg_polars_schema
 from chickenstats.chicken_nhl._docstrings import (
     _GAME_PLAY_BY_PLAY_DF_DOC,
     _GAME_PLAY_BY_PLAY_DOC,
@@ -29,19 +31,19 @@ from chickenstats.chicken_nhl._docstrings import (
 from chickenstats.chicken_nhl._game_core import _GameBase
 from chickenstats.exceptions import DataMismatchError
 
-# Collapse raw NHL position codes to the F/D/G encoding used in xG model training.
-# Forwards (C, L, R, LW, RW, W) → "F"; defensemen → "D"; goalies → "G".
-_POSITION_COLLAPSE: dict[str, str] = {"C": "F", "L": "F", "R": "F", "LW": "F", "RW": "F", "W": "F", "D": "D", "G": "G"}
+# Field defaults of PBPEventExt, used to project events onto the extended schema without Pydantic
+_EXT_DEFAULTS: dict = {name: field.default for name, field in PBPEventExt.model_fields.items()}
 
 
-def _point_in_polygon(px: float, py: float, vertices: Sequence[tuple[float, float]]) -> bool:
-    """Ray-casting point-in-polygon test for convex or concave polygons."""
-    inside = False
+def _points_in_polygon(px: np.ndarray, py: np.ndarray, vertices: Sequence[tuple[float, float]]) -> np.ndarray:
+    """Vectorized ray-casting point-in-polygon test for convex or concave polygons."""
+    inside = np.zeros(len(px), dtype=bool)
     j = len(vertices) - 1
     for i, (xi, yi) in enumerate(vertices):
         xj, yj = vertices[j]
-        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-            inside = not inside
+        if yi != yj:
+            crosses = (yi > py) != (yj > py)
+            inside ^= crosses & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
         j = i
     return inside
 
@@ -60,6 +62,107 @@ _D2_VERTICES = [
     (-69, 22),
 ]
 
+# Shot types that keep the standard distance calculation on long-range attempts from the defensive zone
+_SHORT_RANGE_SHOT_TYPES = {"TIP-IN", "WRAP-AROUND", "WRAP", "DEFLECTED", "BAT", "BETWEEN LEGS", "POKE"}
+
+# Binary event indicator columns, each set when the lowercased event type matches the column name
+_EVENT_FLAG_COLUMNS = ("block", "change", "chl", "fac", "give", "goal", "hit", "miss", "penl", "shot", "stop", "take")
+
+# (event column, on-ice column suffix) pairs for the event team and the opposing team
+_TEAM_PERSPECTIVE_KEYS = (
+    ("event_team_skaters", "skaters"),
+    ("teammates_eh_id", "on_eh_id"),
+    ("teammates_api_id", "on_api_id"),
+    ("teammates", "on"),
+    ("teammates_positions", "on_positions"),
+    ("forwards_eh_id", "forwards_eh_id"),
+    ("forwards_api_id", "forwards_api_id"),
+    ("forwards", "forwards"),
+    ("forwards_count", "forwards_count"),
+    ("forwards_percent", "forwards_percent"),
+    ("defense_eh_id", "defense_eh_id"),
+    ("defense_api_id", "defense_api_id"),
+    ("defense", "defense"),
+    ("defense_count", "defense_count"),
+    ("own_goalie_eh_id", "goalie_eh_id"),
+    ("own_goalie_api_id", "goalie_api_id"),
+    ("own_goalie", "goalie"),
+)
+_OPP_PERSPECTIVE_KEYS = (
+    ("opp_team_skaters", "skaters"),
+    ("opp_team_on_eh_id", "on_eh_id"),
+    ("opp_team_on_api_id", "on_api_id"),
+    ("opp_team_on", "on"),
+    ("opp_team_on_positions", "on_positions"),
+    ("opp_forwards_eh_id", "forwards_eh_id"),
+    ("opp_forwards_api_id", "forwards_api_id"),
+    ("opp_forwards", "forwards"),
+    ("opp_forwards_count", "forwards_count"),
+    ("opp_forwards_percent", "forwards_percent"),
+    ("opp_defense_eh_id", "defense_eh_id"),
+    ("opp_defense_api_id", "defense_api_id"),
+    ("opp_defense", "defense"),
+    ("opp_defense_count", "defense_count"),
+    ("opp_goalie_eh_id", "goalie_eh_id"),
+    ("opp_goalie_api_id", "goalie_api_id"),
+    ("opp_goalie", "goalie"),
+)
+
+
+def _on_ice_columns(venue: str, players: list) -> dict:
+    """Aggregate one team's on-ice players into the ``home_*`` / ``away_*`` event columns."""
+    agg = aggregate_players(players)
+    skaters = agg["ALL"]["count"] - agg["G"]["count"]
+
+    return {
+        f"{venue}_skaters": skaters,
+        f"{venue}_on_eh_id": agg["ALL"]["eh_ids"],
+        f"{venue}_on_api_id": agg["ALL"]["api_ids"],
+        f"{venue}_on": agg["ALL"]["names"],
+        f"{venue}_on_positions": agg["ALL"]["positions"],
+        f"{venue}_forwards_eh_id": agg["F"]["eh_ids"],
+        f"{venue}_forwards_api_id": agg["F"]["api_ids"],
+        f"{venue}_forwards": agg["F"]["names"],
+        f"{venue}_forwards_positions": agg["F"]["positions"],
+        f"{venue}_forwards_count": agg["F"]["count"],
+        f"{venue}_forwards_percent": agg["F"]["count"] / max(1, skaters),
+        f"{venue}_defense_eh_id": agg["D"]["eh_ids"],
+        f"{venue}_defense_api_id": agg["D"]["api_ids"],
+        f"{venue}_defense": agg["D"]["names"],
+        f"{venue}_defense_positions": agg["D"]["positions"],
+        f"{venue}_defense_count": agg["D"]["count"],
+        f"{venue}_goalie_eh_id": agg["G"]["eh_ids"],
+        f"{venue}_goalie_api_id": agg["G"]["api_ids"],
+        f"{venue}_goalie": agg["G"]["names"],
+    }
+
+
+def _ice_state_columns(home: dict, away: dict) -> tuple[dict, dict, bool]:
+    """Build the on-ice and strength columns of one ice state, from the home and away team perspectives.
+
+    Returns ``(home_event_columns, away_event_columns, is_illegal)``.
+    """
+    h_str = "E" if not home["home_goalie"] else home["home_skaters"]
+    a_str = "E" if not away["away_goalie"] else away["away_skaters"]
+
+    is_illegal = bool(
+        (home["home_skaters"] > 5 and home["home_goalie"]) or (away["away_skaters"] > 5 and away["away_goalie"])
+    )
+
+    perspectives = []
+    for tm_pre, opp_pre, tm_cols, opp_cols, strength, opp_strength in (
+        ("home", "away", home, away, f"{h_str}v{a_str}", f"{a_str}v{h_str}"),
+        ("away", "home", away, home, f"{a_str}v{h_str}", f"{h_str}v{a_str}"),
+    ):
+        columns = {**home, **away}
+        columns.update({key: tm_cols[f"{tm_pre}_{suffix}"] for key, suffix in _TEAM_PERSPECTIVE_KEYS})
+        columns.update({key: opp_cols[f"{opp_pre}_{suffix}"] for key, suffix in _OPP_PERSPECTIVE_KEYS})
+        columns["strength_state"] = "ILLEGAL" if is_illegal else strength
+        columns["opp_strength_state"] = opp_strength
+        perspectives.append(columns)
+
+    return perspectives[0], perspectives[1], is_illegal
+
 
 class _GamePBPMixin(_GameBase):
     def _merge_pbp_events(self, html_events: list, api_events: list, changes: list, rosters: list) -> list:
@@ -229,7 +332,7 @@ class _GamePBPMixin(_GameBase):
         return sorted(game_list, key=lambda k: (k["period"], k["period_seconds"], k.get("sort_value", 99)))
 
     def _track_pbp_state(self, merged_events: list, actives: dict) -> list:
-        """Enrich each event with cumulative game state computed in a single sequential pass.
+        """Enrich each event with cumulative game state, computed column-wise over the whole game.
 
         Populates the following groups of fields on every event dict in-place:
 
@@ -237,7 +340,6 @@ class _GamePBPMixin(_GameBase):
           ``score_state``, ``opp_score_state``, ``score_diff``, ``opp_score_diff``
         - **On-ice**: ``home_on``, ``away_on``, and all associated ``_eh_id`` / ``_api_id`` /
           ``_positions`` / ``_count`` / ``_percent`` variants for forwards, defense, and goalies.
-          Re-aggregated lazily — only when a CHANGE event modifies the ice state.
         - **Strength**: ``strength_state``, ``opp_strength_state``, ``home_skaters``,
           ``away_skaters``, ``event_team_skaters``, ``opp_team_skaters``
         - **Spatial**: ``event_distance``, ``event_angle``, ``danger``, ``high_danger``,
@@ -249,62 +351,238 @@ class _GamePBPMixin(_GameBase):
           ``pen0``, ``pen2``, ``pen4``, ``pen5``, ``pen10``, ``teammate_block``
         - **Timing**: ``event_idx`` (sequential 1-based), ``event_length`` (seconds until
           the next event), ``id`` (composite game_id + event_idx key)
+
+        Score, spatial, flag, and timing columns are computed with NumPy over the game's events.
+        Only the on-ice rosters are tracked sequentially, and each distinct ice state is
+        aggregated once and shared by every event it applies to.
         """
-        home_score, away_score = 0, 0
-        home_on_ice, away_on_ice = {}, {}
-        prev_event_type, prev_event_team = None, None
-        _last_fac_sec, _last_fac_x, _last_fac_y, _last_fac_zone, _last_fac_team = None, None, None, None, None
+        n_events = len(merged_events)
+
+        if n_events == 0:
+            return merged_events
+
+        event_types = np.array([event["event"] for event in merged_events])
+        home_teams = [event["home_team"] for event in merged_events]
+        away_teams = [event["away_team"] for event in merged_events]
+        zones = [event.get("zone") for event in merged_events]
+
+        # --- Teams and score ---
+        # 1 = home event, 2 = away event, 0 = no event team (attributed to the home team)
+        venues = np.array(
+            [
+                1 if team == home else 2 if team == away else 0
+                for team, home, away in zip(
+                    (event.get("event_team") for event in merged_events), home_teams, away_teams, strict=True
+                )
+            ]
+        )
+
+        # Goals count from the following event onwards
+        is_goal = event_types == "GOAL"
+        home_scores = np.concatenate(([0], np.cumsum(is_goal & (venues != 2))[:-1])).tolist()
+        away_scores = np.concatenate(([0], np.cumsum(is_goal & (venues == 2))[:-1])).tolist()
+
+        # --- Distance, angle, and danger for events with coordinates ---
+        is_fenwick = np.isin(event_types, ("GOAL", "SHOT", "MISS"))
+        danger = np.zeros(n_events, dtype=int)
+        high_danger = np.zeros(n_events, dtype=int)
+        distances: dict[int, float] = {}
+        angles: dict[int, float] = {}
+
+        coords_idx = np.array(
+            [
+                idx
+                for idx, event in enumerate(merged_events)
+                if event.get("coords_x") is not None and event.get("coords_y") is not None and event["coords_x"] != ""
+            ],
+            dtype=int,
+        )
+
+        if len(coords_idx):
+            cx = np.array([merged_events[idx]["coords_x"] for idx in coords_idx])
+            cy = np.array([merged_events[idx]["coords_y"] for idx in coords_idx])
+            fen = is_fenwick[coords_idx]
+
+            # Long-range attempts from the defensive zone are measured to the far net
+            far_net = fen & np.array(
+                [
+                    bool(is_fen)
+                    and merged_events[idx].get("pbp_distance", 0) > 89
+                    and merged_events[idx].get("shot_type", "WRIST") not in _SHORT_RANGE_SHOT_TYPES
+                    and zones[idx] != "OFF"
+                    for idx, is_fen in zip(coords_idx, fen, strict=True)
+                ],
+                dtype=bool,
+            )
+
+            x_dist = np.where(far_net, np.where(cx < 0, np.abs(cx) + 89, cx + 89), 89 - np.abs(cx))
 
-        # CACHE INITIALIZATION
-        h_ice = aggregate_players([])
-        a_ice = aggregate_players([])
-        ice_changed = True
+            with np.errstate(divide="ignore", invalid="ignore"):
+                raw_angles = np.degrees(np.abs(np.arctan(cy / x_dist)))
 
-        # Mapping faceoff events to game seconds
+            # Python's ``** 0.5`` is kept over np.sqrt, which rounds a handful of distances differently
+            for idx, squared, x, angle in zip(
+                coords_idx.tolist(), (x_dist**2 + cy**2).tolist(), x_dist, raw_angles, strict=False
+            ):
+                distances[idx] = squared**0.5
+                angles[idx] = angle if x != 0 else 90
+
+            event_distance = np.array(list(distances.values()))
+            for idx in coords_idx[fen & (event_distance <= 64)]:
+                if zones[idx] == "DEF":
+                    zones[idx] = "OFF"
+
+            in_zone = fen & np.array([zones[idx] == "OFF" for idx in coords_idx], dtype=bool)
+            is_high = in_zone & (np.abs(cx) >= 69) & (np.abs(cx) <= 89) & (cy >= -9) & (cy <= 9)
+            is_danger = (
+                in_zone
+                & ~is_high
+                & (_points_in_polygon(cx, cy, _D1_VERTICES) | _points_in_polygon(cx, cy, _D2_VERTICES))
+            )
+
+            high_danger[coords_idx] = is_high
+            danger[coords_idx] = is_danger
+
+        # --- Zone starts for CHANGE events, inferred from a faceoff at the same time ---
         faceoff_events = {
             (event["period"], event["game_seconds"]): {
                 "coords_x": event.get("coords_x"),
                 "coords_y": event.get("coords_y"),
-                "zone": event.get("zone"),
+                "zone": zones[idx],
                 "event_team": event.get("event_team"),
             }
-            for event in merged_events
+            for idx, event in enumerate(merged_events)
             if event["event"] == "FAC"
-            # and event["game_seconds"] not in [0, 1200, 2400, 3600, 4800, 6000, 7200, 8400]
         }
 
-        for idx, event in enumerate(merged_events):
-            if prev_event_type == "GOAL":
-                if prev_event_team == event["home_team"]:
-                    home_score += 1
-                elif prev_event_team == event["away_team"]:
-                    away_score += 1
+        zone_starts: list = [event.get("zone_start") for event in merged_events]
+        change_coords: dict[int, tuple] = {}
 
-            event.update(
-                {
-                    "home_score": home_score,
-                    "away_score": away_score,
-                    "home_score_diff": home_score - away_score,
-                    "away_score_diff": away_score - home_score,
-                }
-            )
+        for idx in np.flatnonzero(event_types == "CHANGE").tolist():
+            event = merged_events[idx]
+            faceoff_event = faceoff_events.get((event["period"], event["game_seconds"]))
 
-            if event.get("event_team") == event["home_team"]:
-                event.update(
-                    {
-                        "opp_team": event["away_team"],
-                        "score_state": f"{home_score}v{away_score}",
-                        "opp_score_state": f"{away_score}v{home_score}",
-                        "score_diff": home_score - away_score,
-                        "opp_score_diff": away_score - home_score,
-                        "is_home": 1,
-                        "is_away": 0,
-                    }
+            if faceoff_event:
+                event_team = event["home_team"] if venues[idx] != 2 else event["away_team"]
+                fac_zone = faceoff_event["zone"]
+
+                zone_start = (
+                    fac_zone
+                    if event_team == faceoff_event["event_team"]
+                    else {"OFF": "DEF", "DEF": "OFF", "NEU": "NEU"}.get(fac_zone or "")
                 )
-            elif event.get("event_team") == event["away_team"]:
+                if abs(faceoff_event["coords_x"]) <= 25:
+                    zone_start = "NEU"
+
+                change_coords[idx] = (faceoff_event["coords_x"], faceoff_event["coords_y"])
+                zone_starts[idx] = zones[idx] = zone_start
+
+            else:
+                zone_starts[idx] = "OTF"
+
+        # --- Binary event flags ---
+        zone_arr = np.array(zones, dtype=object)
+        zone_start_arr = np.array(zone_starts, dtype=object)
+        lowered = np.char.lower(event_types)
+
+        flags = {flag: lowered == flag for flag in _EVENT_FLAG_COLUMNS}
+        flags["shot"] = np.isin(event_types, ("GOAL", "SHOT"))
+        flags["fenwick"] = is_fenwick
+        flags["corsi"] = np.isin(event_types, ("GOAL", "SHOT", "MISS", "BLOCK"))
+
+        is_high_danger = high_danger.astype(bool)
+        for flag in ("goal", "shot", "miss", "fenwick"):
+            flags[f"hd_{flag}"] = flags[flag] & is_high_danger
+
+        is_fac = event_types == "FAC"
+        is_change = event_types == "CHANGE"
+        for flag, zone in (("ozf", "OFF"), ("dzf", "DEF"), ("nzf", "NEU")):
+            flags[flag] = is_fac & (zone_arr == zone)
+        for flag, zone in (("ozc", "OFF"), ("dzc", "DEF"), ("nzc", "NEU"), ("otf", "OTF")):
+            flags[flag] = is_change & (zone_start_arr == zone)
+
+        is_penalty = np.isin(event_types, ("PENL", "DELPEN"))
+        penalty_lengths = np.array([event.get("penalty_length") for event in merged_events], dtype=object)
+        for p_len in (0, 2, 4, 5, 10):
+            flags[f"pen{p_len}"] = is_penalty & (penalty_lengths == p_len)
+
+        descriptions = [str(event.get("description", "")) for event in merged_events]
+        flags["teammate_block"] = (event_types == "BLOCK") & np.array(
+            ["BLOCKED BY TEAMMATE" in description for description in descriptions], dtype=bool
+        )
+        flags["block"] = flags["block"] & ~flags["teammate_block"]
+
+        # Penalty shots and regular-season shootout attempts are 1v0, unless the ice state is illegal
+        is_one_on_none = np.array(["PENALTY SHOT" in description for description in descriptions], dtype=bool)
+        if self.session == "R":
+            is_one_on_none |= np.array([event["period"] == 5 for event in merged_events], dtype=bool)
+
+        # --- Timing ---
+        game_seconds = np.array([event["game_seconds"] for event in merged_events])
+        event_lengths = np.diff(game_seconds, append=game_seconds[-1]).tolist()
+
+        columns = {
+            "danger": danger.tolist(),
+            "high_danger": high_danger.tolist(),
+            **{flag: values.astype(int).tolist() for flag, values in flags.items()},
+            "event_idx": list(range(1, n_events + 1)),
+            "event_length": event_lengths,
+            "id": [int(f"{self.game_id}{idx:04d}") for idx in range(1, n_events + 1)],
+        }
+        column_names = tuple(columns)
+
+        # --- Sequential pass: on-ice tracking and write-back ---
+        home_on_ice: dict = {}
+        away_on_ice: dict = {}
+        on_ice_cache: dict = {}
+        state_cache: dict = {}
+
+        def on_ice(venue: str, players: dict) -> tuple:
+            key = (venue, frozenset(players))
+            if key not in on_ice_cache:
+                on_ice_cache[key] = _on_ice_columns(venue, list(players.values()))
+            return key
+
+        home_key, away_key = on_ice("home", home_on_ice), on_ice("away", away_on_ice)
+
+        for idx, (event, values) in enumerate(zip(merged_events, zip(*columns.values(), strict=True), strict=True)):
+            if is_change[idx]:
+                on_jerseys = set(str(event["change_on_jersey"]).split(", ")) if event.get("change_on_jersey") else set()
+                off_jerseys = (
+                    set(str(event["change_off_jersey"]).split(", ")) if event.get("change_off_jersey") else set()
+                )
+                duplicate_jerseys = on_jerseys & off_jerseys
+                on_ice_players = home_on_ice if event["team_venue"] == "HOME" else away_on_ice
+
+                for tj in on_jerseys - duplicate_jerseys:
+                    if tj in actives:
+                        on_ice_players[tj] = actives[tj]
+                for tj in off_jerseys - duplicate_jerseys:
+                    on_ice_players.pop(tj, None)
+
+                if event["team_venue"] == "HOME":
+                    home_key = on_ice("home", home_on_ice)
+                else:
+                    away_key = on_ice("away", away_on_ice)
+
+            state = state_cache.get((home_key, away_key))
+            if state is None:
+                state = state_cache[(home_key, away_key)] = _ice_state_columns(
+                    on_ice_cache[home_key], on_ice_cache[away_key]
+                )
+
+            home_score, away_score = home_scores[idx], away_scores[idx]
+            venue = venues[idx]
+            home, away = home_teams[idx], away_teams[idx]
+
+            if venue == 2:
                 event.update(
                     {
-                        "opp_team": event["home_team"],
+                        "home_score": home_score,
+                        "away_score": away_score,
+                        "home_score_diff": home_score - away_score,
+                        "away_score_diff": away_score - home_score,
+                        "opp_team": home,
                         "score_state": f"{away_score}v{home_score}",
                         "opp_score_state": f"{home_score}v{away_score}",
                         "score_diff": away_score - home_score,
@@ -314,413 +592,162 @@ class _GamePBPMixin(_GameBase):
                     }
                 )
             else:
+                if venue == 0:
+                    event["event_team"] = home
                 event.update(
                     {
-                        "event_team": event["home_team"],
-                        "opp_team": event["away_team"],
+                        "home_score": home_score,
+                        "away_score": away_score,
+                        "home_score_diff": home_score - away_score,
+                        "away_score_diff": away_score - home_score,
+                        "opp_team": away,
                         "score_state": f"{home_score}v{away_score}",
                         "opp_score_state": f"{away_score}v{home_score}",
                         "score_diff": home_score - away_score,
                         "opp_score_diff": away_score - home_score,
-                        "is_home": 0,
+                        "is_home": int(venue == 1),
                         "is_away": 0,
                     }
                 )
 
-            # ICE CACHING LOGIC: Only re-aggregate if a change happens
-            if event["event"] == "CHANGE":
-                on_jerseys = set(str(event["change_on_jersey"]).split(", ")) if event.get("change_on_jersey") else set()
-                off_jerseys = (
-                    set(str(event["change_off_jersey"]).split(", ")) if event.get("change_off_jersey") else set()
-                )
-                duplicate_jerseys = on_jerseys & off_jerseys
-
-                for tj in on_jerseys - duplicate_jerseys:
-                    if tj in actives:
-                        if event["team_venue"] == "HOME":
-                            home_on_ice[tj] = actives[tj]
-                        else:
-                            away_on_ice[tj] = actives[tj]
-                for tj in off_jerseys - duplicate_jerseys:
-                    if event["team_venue"] == "HOME":
-                        home_on_ice.pop(tj, None)
-                    else:
-                        away_on_ice.pop(tj, None)
-                ice_changed = True
-
-            if ice_changed:
-                h_ice = aggregate_players(list(home_on_ice.values()))
-                a_ice = aggregate_players(list(away_on_ice.values()))
-                ice_changed = False
-
-            event.update(
-                {
-                    "home_skaters": h_ice["ALL"]["count"] - h_ice["G"]["count"],
-                    "away_skaters": a_ice["ALL"]["count"] - a_ice["G"]["count"],
-                    "home_on_eh_id": h_ice["ALL"]["eh_ids"],
-                    "home_on_api_id": h_ice["ALL"]["api_ids"],
-                    "home_on": h_ice["ALL"]["names"],
-                    "home_on_positions": h_ice["ALL"]["positions"],
-                    "home_forwards_eh_id": h_ice["F"]["eh_ids"],
-                    "home_forwards_api_id": h_ice["F"]["api_ids"],
-                    "home_forwards": h_ice["F"]["names"],
-                    "home_forwards_positions": h_ice["F"]["positions"],
-                    "home_forwards_count": h_ice["F"]["count"],
-                    "home_defense_eh_id": h_ice["D"]["eh_ids"],
-                    "home_defense_api_id": h_ice["D"]["api_ids"],
-                    "home_defense": h_ice["D"]["names"],
-                    "home_defense_positions": h_ice["D"]["positions"],
-                    "home_defense_count": h_ice["D"]["count"],
-                    "home_goalie_eh_id": h_ice["G"]["eh_ids"],
-                    "home_goalie_api_id": h_ice["G"]["api_ids"],
-                    "home_goalie": h_ice["G"]["names"],
-                    "away_on_eh_id": a_ice["ALL"]["eh_ids"],
-                    "away_on_api_id": a_ice["ALL"]["api_ids"],
-                    "away_on": a_ice["ALL"]["names"],
-                    "away_on_positions": a_ice["ALL"]["positions"],
-                    "away_forwards_eh_id": a_ice["F"]["eh_ids"],
-                    "away_forwards_api_id": a_ice["F"]["api_ids"],
-                    "away_forwards": a_ice["F"]["names"],
-                    "away_forwards_positions": a_ice["F"]["positions"],
-                    "away_forwards_count": a_ice["F"]["count"],
-                    "away_defense_eh_id": a_ice["D"]["eh_ids"],
-                    "away_defense_api_id": a_ice["D"]["api_ids"],
-                    "away_defense": a_ice["D"]["names"],
-                    "away_defense_positions": a_ice["D"]["positions"],
-                    "away_defense_count": a_ice["D"]["count"],
-                    "away_goalie_eh_id": a_ice["G"]["eh_ids"],
-                    "away_goalie_api_id": a_ice["G"]["api_ids"],
-                    "away_goalie": a_ice["G"]["names"],
-                }
-            )
-
-            event["home_forwards_percent"] = event["home_forwards_count"] / max(1, event["home_skaters"])
-            event["away_forwards_percent"] = event["away_forwards_count"] / max(1, event["away_skaters"])
-
-            h_str = "E" if not event["home_goalie"] else event["home_skaters"]
-            a_str = "E" if not event["away_goalie"] else event["away_skaters"]
-
-            is_h_ev = event["event_team"] == event["home_team"]
-
-            event["strength_state"] = f"{a_str}v{h_str}" if not is_h_ev else f"{h_str}v{a_str}"
-            event["opp_strength_state"] = f"{h_str}v{a_str}" if not is_h_ev else f"{a_str}v{h_str}"
-            if "PENALTY SHOT" in str(event.get("description", "")):
-                event["strength_state"] = "1v0"
-            if event["period"] == 5 and self.session == "R":
+            event.update(state[0] if venue != 2 else state[1])
+            if is_one_on_none[idx] and not state[2]:
                 event["strength_state"] = "1v0"
-            if (event["home_skaters"] > 5 and event["home_goalie"]) or (
-                event["away_skaters"] > 5 and event["away_goalie"]
-            ):
-                event["strength_state"] = "ILLEGAL"
 
-            tm_pre, opp_pre = ("home", "away") if is_h_ev else ("away", "home")
+            if idx in distances:
+                event["event_distance"] = distances[idx]
+                event["event_angle"] = angles[idx]
 
-            event.update(
-                {
-                    "event_team_skaters": event[f"{tm_pre}_skaters"],
-                    "teammates_eh_id": event[f"{tm_pre}_on_eh_id"],
-                    "teammates_api_id": event[f"{tm_pre}_on_api_id"],
-                    "teammates": event[f"{tm_pre}_on"],
-                    "teammates_positions": event[f"{tm_pre}_on_positions"],
-                    "forwards_eh_id": event[f"{tm_pre}_forwards_eh_id"],
-                    "forwards_api_id": event[f"{tm_pre}_forwards_api_id"],
-                    "forwards": event[f"{tm_pre}_forwards"],
-                    "forwards_count": event[f"{tm_pre}_forwards_count"],
-                    "forwards_percent": event[f"{tm_pre}_forwards_percent"],
-                    "defense_eh_id": event[f"{tm_pre}_defense_eh_id"],
-                    "defense_api_id": event[f"{tm_pre}_defense_api_id"],
-                    "defense": event[f"{tm_pre}_defense"],
-                    "defense_count": event[f"{tm_pre}_defense_count"],
-                    "own_goalie_eh_id": event[f"{tm_pre}_goalie_eh_id"],
-                    "own_goalie_api_id": event[f"{tm_pre}_goalie_api_id"],
-                    "own_goalie": event[f"{tm_pre}_goalie"],
-                    "opp_team_skaters": event[f"{opp_pre}_skaters"],
-                    "opp_team_on_eh_id": event[f"{opp_pre}_on_eh_id"],
-                    "opp_team_on_api_id": event[f"{opp_pre}_on_api_id"],
-                    "opp_team_on": event[f"{opp_pre}_on"],
-                    "opp_team_on_positions": event[f"{opp_pre}_on_positions"],
-                    "opp_forwards_eh_id": event[f"{opp_pre}_forwards_eh_id"],
-                    "opp_forwards_api_id": event[f"{opp_pre}_forwards_api_id"],
-                    "opp_forwards": event[f"{opp_pre}_forwards"],
-                    "opp_forwards_count": event[f"{opp_pre}_forwards_count"],
-                    "opp_forwards_percent": event[f"{opp_pre}_forwards_percent"],
-                    "opp_defense_eh_id": event[f"{opp_pre}_defense_eh_id"],
-                    "opp_defense_api_id": event[f"{opp_pre}_defense_api_id"],
-                    "opp_defense": event[f"{opp_pre}_defense"],
-                    "opp_defense_count": event[f"{opp_pre}_defense_count"],
-                    "opp_goalie_eh_id": event[f"{opp_pre}_goalie_eh_id"],
-                    "opp_goalie_api_id": event[f"{opp_pre}_goalie_api_id"],
-                    "opp_goalie": event[f"{opp_pre}_goalie"],
-                }
-            )
-            if event.get("opp_strength_state") is None and event["strength_state"] == "ILLEGAL":
-                event["opp_strength_state"] = "ILLEGAL"
-
-            event["danger"], event["high_danger"] = 0, 0
-            if event.get("coords_x") is not None and event.get("coords_y") is not None and event["coords_x"] != "":
-                cx, cy = event["coords_x"], event["coords_y"]
-                is_fen = event["event"] in ["GOAL", "SHOT", "MISS"]
-                bad_s = event.get("shot_type", "WRIST") not in [
-                    "TIP-IN",
-                    "WRAP-AROUND",
-                    "WRAP",
-                    "DEFLECTED",
-                    "BAT",
-                    "BETWEEN LEGS",
-                    "POKE",
-                ]
-
-                if is_fen and event.get("pbp_distance", 0) > 89 and bad_s and event.get("zone") != "OFF":
-                    mx = abs(cx) + 89 if cx < 0 else cx + 89
-                    event["event_distance"] = (mx**2 + cy**2) ** 0.5
-                    event["event_angle"] = np.degrees(abs(np.arctan(cy / mx))) if mx != 0 else 90
-                else:
-                    event["event_distance"] = ((89 - abs(cx)) ** 2 + cy**2) ** 0.5
-                    event["event_angle"] = (
-                        np.degrees(abs(np.arctan(cy / (89 - abs(cx))))) if (89 - abs(cx)) != 0 else 90
-                    )
-
-                if is_fen and event.get("zone") == "DEF" and event.get("event_distance", 0) <= 64:
-                    event["zone"] = "OFF"
-
-                if is_fen and event.get("zone") == "OFF":
-                    if 69 <= abs(cx) <= 89 and -9 <= cy <= 9:
-                        event["high_danger"] = 1
-                    elif _point_in_polygon(cx, cy, _D1_VERTICES) or _point_in_polygon(cx, cy, _D2_VERTICES):
-                        event["danger"] = 1
-
-            if event["event"] == "CHANGE":
-                change_key = (event["period"], event["game_seconds"])
-                faceoff_event = faceoff_events.get(change_key)
-
-                if faceoff_event:
-                    fac_zone = faceoff_event["zone"]
-                    fac_team = faceoff_event["event_team"]
-                    fac_coords_x = faceoff_event["coords_x"]
-                    fac_coords_y = faceoff_event["coords_y"]
-
-                    event["coords_x"], event["coords_y"] = fac_coords_x, fac_coords_y
-                    event["zone_start"] = (
-                        fac_zone
-                        if event["event_team"] == fac_team
-                        else {"OFF": "DEF", "DEF": "OFF", "NEU": "NEU"}.get(fac_zone or "")
-                    )
-
-                    if abs(fac_coords_x) <= 25:
-                        event["zone_start"] = "NEU"
+            if zones[idx] != event.get("zone"):
+                event["zone"] = zones[idx]
 
-                    event["zone"] = event["zone_start"]
-                    # if change_game_seconds in [0, 1200, 2400, 3600, 4800, 6000, 7200, 8400] and fac_zone == "NEU":
-                    #     event["zone_start"] = None
-
-                else:
-                    event["zone_start"] = "OTF"
+            if is_change[idx]:
+                if idx in change_coords:
+                    event["coords_x"], event["coords_y"] = change_coords[idx]
+                event["zone_start"] = zone_starts[idx]
 
-            for d in ["block", "change", "chl", "fac", "give", "goal", "hit", "miss", "penl", "shot", "stop", "take"]:
-                event[d] = 1 if event["event"].lower() == d else 0
-
-            event["shot"] = 1 if event["event"] in ["GOAL", "SHOT"] else 0
-            event["fenwick"] = 1 if event["event"] in ["GOAL", "SHOT", "MISS"] else 0
-            event["corsi"] = 1 if event["event"] in ["GOAL", "SHOT", "MISS", "BLOCK"] else 0
-
-            event["hd_goal"] = 1 if event["goal"] and event["high_danger"] else 0
-            event["hd_shot"] = 1 if event["shot"] and event["high_danger"] else 0
-            event["hd_miss"] = 1 if event["miss"] and event["high_danger"] else 0
-            event["hd_fenwick"] = 1 if event["fenwick"] and event["high_danger"] else 0
-
-            event["ozf"] = 1 if event["event"] == "FAC" and event.get("zone") == "OFF" else 0
-            event["dzf"] = 1 if event["event"] == "FAC" and event.get("zone") == "DEF" else 0
-            event["nzf"] = 1 if event["event"] == "FAC" and event.get("zone") == "NEU" else 0
-
-            z_start = event.get("zone_start")
-            event["ozc"] = 1 if event["event"] == "CHANGE" and z_start == "OFF" else 0
-            event["dzc"] = 1 if event["event"] == "CHANGE" and z_start == "DEF" else 0
-            event["nzc"] = 1 if event["event"] == "CHANGE" and z_start == "NEU" else 0
-            event["otf"] = 1 if event["event"] == "CHANGE" and z_start == "OTF" else 0
-
-            for p_len in [0, 2, 4, 5, 10]:
-                event[f"pen{p_len}"] = (
-                    1 if event["event"] in ["PENL", "DELPEN"] and event.get("penalty_length") == p_len else 0
-                )
-
-            if event["event"] == "BLOCK" and "BLOCKED BY TEAMMATE" in str(event.get("description", "")):
-                event["teammate_block"], event["block"] = 1, 0
-            else:
-                event["teammate_block"] = 0
-
-            event["event_idx"] = idx + 1
-            nxt_idx = min(idx + 1, len(merged_events) - 1)
-            event["event_length"] = merged_events[nxt_idx]["game_seconds"] - event["game_seconds"]
-            event["id"] = int(f"{self.game_id}{event['event_idx']:04d}")
-
-            prev_event_type, prev_event_team = event["event"], event["event_team"]
+            event.update(zip(column_names, values, strict=True))
 
         return merged_events
 
-    def _calculate_pbp_xg(self, events: list) -> tuple:
-        """Compute shot-context features, build extended on-ice columns, and validate.
+    def _calculate_pbp_xg(self, events: list) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+        """Build extended on-ice columns, validate, and compute the xG features.
 
-        Feature pass (sequential — each event depends on ``last_xg_ev`` state):
-        Computes temporal/geometric features for every fenwick event —
-        ``is_rebound``, ``rush_attempt``, ``is_scramble``, ``seconds_since_last``,
-        ``distance_from_last``, ``play_speed``, ``prior_event_*``, ``abs_y_distance``,
-        ``seconds_since_stoppage``. These are stored on the play dict and written to the
-        PBP schema so the inference API can compute xG values later.
-
-        Then expands on-ice player-slot columns from ``_EXT_SOURCE_KEYS`` →
-        ``_EXT_TARGET_KEYS``, applies score adjustments, and runs Pydantic validation
-        to produce the final ``(pbp, ext)`` tuple.
+        Expands on-ice player-slot columns from ``_EXT_SOURCE_KEYS`` →
+        ``_EXT_TARGET_KEYS``, applies score adjustments, and validates the events to produce
+        the ``(pbp, ext)`` frames. The xG features (``is_rebound``, ``rush_attempt``,
+        ``seconds_since_last``, etc.) are then computed column-wise from the validated
+        play-by-play with ``build_xg_fields``, so the inference API can compute xG values later.
+        The two steps are timed as the ``validate`` and ``xg`` stages.
         """
         fenwick_events = {"GOAL", "SHOT", "MISS"}
-        important_events = {"SHOT", "FAC", "HIT", "BLOCK", "MISS", "GIVE", "TAKE", "GOAL"}
-        prior_event_types = {"SHOT", "MISS", "BLOCK", "GIVE", "TAKE", "HIT"}
-
-        last_xg_ev = None
-        last_face_game_seconds: float | None = None
-        last_change_home_seconds: float | None = None
-        last_change_away_seconds: float | None = None
 
-        for play in events:
-            if play.get("event") == "FAC":
-                last_face_game_seconds = play.get("game_seconds")
-
-            if play.get("event") == "CHANGE":
-                if play.get("is_home") == 1:
-                    last_change_home_seconds = play.get("game_seconds")
-                else:
-                    last_change_away_seconds = play.get("game_seconds")
+        # --- Extended on-ice columns + schema validation ---
+        with self._stage("validate") as stage:
+            final_pbp, final_ext = [], []
+            for play in events:
+                for (src_name, src_eh, src_api, src_pos), col_group in zip(
+                    _EXT_SOURCE_KEYS, _EXT_TARGET_KEYS, strict=True
+                ):
+                    raw_players = play.get(src_name)
+                    raw_eh_ids = play.get(src_eh)
+                    raw_api_ids = play.get(src_api)
+                    raw_positions = play.get(src_pos)
+
+                    if "change" in src_name:
+                        players = (
+                            raw_players
+                            if isinstance(raw_players, list)
+                            else str(raw_players).split(", ")
+                            if raw_players
+                            else []
+                        )
+                        eh_ids = (
+                            raw_eh_ids
+                            if isinstance(raw_eh_ids, list)
+                            else str(raw_eh_ids).split(", ")
+                            if raw_eh_ids
+                            else []
+                        )
+                        api_ids = (
+                            raw_api_ids
+                            if isinstance(raw_api_ids, list)
+                            else str(raw_api_ids).split(", ")
+                            if raw_api_ids
+                            else []
+                        )
+                        positions = (
+                            raw_positions
+                            if isinstance(raw_positions, list)
+                            else str(raw_positions).split(", ")
+                            if raw_positions
+                            else []
+                        )
+                    else:
+                        players = raw_players if isinstance(raw_players, list) else [raw_players] if raw_players else []
+                        eh_ids = raw_eh_ids if isinstance(raw_eh_ids, list) else [raw_eh_ids] if raw_eh_ids else []
+                        api_ids = raw_api_ids if isinstance(raw_api_ids, list) else [raw_api_ids] if raw_api_ids else []
+                        positions = (
+                            raw_positions
+                            if isinstance(raw_positions, list)
+                            else [raw_positions]
+                            if raw_positions
+                            else []
+                        )
+
+                    n = len(players)
+                    for i, (col, col_eh, col_api, col_pos) in enumerate(col_group):
+                        if i < n:
+                            play[col] = players[i]
+                            play[col_eh] = eh_ids[i] if i < len(eh_ids) else None
+                            play[col_api] = api_ids[i] if i < len(api_ids) else None
+                            play[col_pos] = positions[i] if i < len(positions) else None
+                        else:
+                            play[col] = play[col_eh] = play[col_api] = play[col_pos] = None
 
-            cx = float(play.get("coords_x") or 0.0)
-            cy = float(play.get("coords_y") or 0.0)
-            play["abs_y_distance"] = abs(cy)
+                if play["event"] in fenwick_events or play["event"] == "BLOCK":
+                    calculate_score_adjustment(play, self._score_adjustments)
 
-            is_fenwick = play["event"] in fenwick_events
-            has_coords = play.get("coords_x") is not None and play["coords_x"] != ""
+                if self._validation == "pydantic":
+                    final_pbp.append(PBPEvent.model_validate(play).model_dump())
+                    final_ext.append(PBPEventExt.model_construct(**play).model_dump())
 
-            if is_fenwick and has_coords and last_xg_ev and last_xg_ev["period"] == play["period"]:
-                sec_since = play["game_seconds"] - last_xg_ev["game_seconds"]
-                s_tm = play["event_team"] == last_xg_ev["event_team"]
-                l_ev = last_xg_ev["event"]
-                lx = float(last_xg_ev.get("coords_x") or 0.0)
-                ly = float(last_xg_ev.get("coords_y") or 0.0)
-                dist = ((cx - lx) ** 2 + (cy - ly) ** 2) ** 0.5
+            if self._validation == "pydantic":
+                pbp_frame = pl.from_dicts(final_pbp, schema=pbp_polars_schema)
+                ext_frame = pl.from_dicts(final_ext, schema=pbp_ext_polars_schema)
 
-                play["is_rebound"] = int(
-                    l_ev in {"SHOT", "MISS", "BLOCK"} and sec_since <= 3 and s_tm == (l_ev != "BLOCK")
-                )
-                play["is_scramble"] = int(l_ev in {"GIVE", "TAKE"} and 0 < sec_since <= 4)
-                play["rush_attempt"] = int(sec_since <= 4 and last_xg_ev.get("zone") == "NEU")
-                play["prior_face"] = int(l_ev == "FAC")
-                play["seconds_since_last"] = float(sec_since) if sec_since > 0 else None
-                play["distance_from_last"] = dist
-                play["play_speed"] = dist / sec_since if sec_since > 0 else None
-                play["seconds_since_stoppage"] = (
-                    float(play["game_seconds"] - last_face_game_seconds) if last_face_game_seconds is not None else None
+            else:
+                # Columnar validation: one typed frame per game instead of one Pydantic model per event.
+                # PBPEventExt is built with model_construct (no validation), so its columns are only
+                # collected, after the PBPEvent pass has joined list fields in place.
+                pbp_frame = validate_records_columnar(events, PBPEvent, pbp_polars_schema)
+                ext_frame = pl.DataFrame(
+                    {field: [play.get(field, default) for play in events] for field, default in _EXT_DEFAULTS.items()},
+                    schema=pbp_ext_polars_schema,
                 )
 
-                play["prior_event_angle"] = last_xg_ev.get("event_angle")
-                play["prior_event_distance"] = last_xg_ev.get("event_distance")
+            stage["rows"] = pbp_frame.height
 
-                is_home = play.get("is_home")
-                et_secs = last_change_home_seconds if is_home == 1 else last_change_away_seconds
-                opp_secs = last_change_away_seconds if is_home == 1 else last_change_home_seconds
-                play["seconds_since_event_team_change"] = (
-                    float(play["game_seconds"] - et_secs) if et_secs is not None else None
-                )
-                play["seconds_since_opp_team_change"] = (
-                    float(play["game_seconds"] - opp_secs) if opp_secs is not None else None
-                )
+        # --- xG features ---
+        with self._stage("xg") as stage:
+            xg_rows = build_xg_fields(pbp_frame).to_dicts()
 
-                if l_ev in prior_event_types:
-                    if s_tm:
-                        play["prior_event_same"] = l_ev
-                    else:
-                        play["prior_event_opp"] = l_ev
+            if self._validation == "pydantic":
+                xg_rows = [XGFields.model_validate(row).model_dump() for row in xg_rows]
+                xg_frame = pl.from_dicts(xg_rows, schema=xg_polars_schema)
             else:
-                play.setdefault("is_rebound", 0)
-                play.setdefault("is_scramble", 0)
-                play.setdefault("rush_attempt", 0)
-                play.setdefault("prior_face", 0)
-
-            if play["event"] in important_events:
-                last_xg_ev = play
+                xg_frame = validate_records_columnar(xg_rows, XGFields, xg_polars_schema)
 
-        # --- Extended on-ice columns + schema validation ---
-        final_pbp, final_ext, final_xg = [], [], []
-        for play in events:
-            for (src_name, src_eh, src_api, src_pos), col_group in zip(_EXT_SOURCE_KEYS, _EXT_TARGET_KEYS, strict=True):
-                raw_players = play.get(src_name)
-                raw_eh_ids = play.get(src_eh)
-                raw_api_ids = play.get(src_api)
-                raw_positions = play.get(src_pos)
-
-                if "change" in src_name:
-                    players = (
-                        raw_players
-                        if isinstance(raw_players, list)
-                        else str(raw_players).split(", ")
-                        if raw_players
-                        else []
-                    )
-                    eh_ids = (
-                        raw_eh_ids
-                        if isinstance(raw_eh_ids, list)
-                        else str(raw_eh_ids).split(", ")
-                        if raw_eh_ids
-                        else []
-                    )
-                    api_ids = (
-                        raw_api_ids
-                        if isinstance(raw_api_ids, list)
-                        else str(raw_api_ids).split(", ")
-                        if raw_api_ids
-                        else []
-                    )
-                    positions = (
-                        raw_positions
-                        if isinstance(raw_positions, list)
-                        else str(raw_positions).split(", ")
-                        if raw_positions
-                        else []
-                    )
-                else:
-                    players = raw_players if isinstance(raw_players, list) else [raw_players] if raw_players else []
-                    eh_ids = raw_eh_ids if isinstance(raw_eh_ids, list) else [raw_eh_ids] if raw_eh_ids else []
-                    api_ids = raw_api_ids if isinstance(raw_api_ids, list) else [raw_api_ids] if raw_api_ids else []
-                    positions = (
-                        raw_positions if isinstance(raw_positions, list) else [raw_positions] if raw_positions else []
-                    )
-
-                n = len(players)
-                for i, (col, col_eh, col_api, col_pos) in enumerate(col_group):
-                    if i < n:
-                        play[col] = players[i]
-                        play[col_eh] = eh_ids[i] if i < len(eh_ids) else None
-                        play[col_api] = api_ids[i] if i < len(api_ids) else None
-                        play[col_pos] = positions[i] if i < len(positions) else None
-                    else:
-                        play[col] = play[col_eh] = play[col_api] = play[col_pos] = None
-
-            if play["event"] in fenwick_events or play["event"] == "BLOCK":
-                calculate_score_adjustment(play, self._score_adjustments)
-
-            final_pbp.append(PBPEvent.model_validate(play).model_dump())
-            final_ext.append(PBPEventExt.model_construct(**play).model_dump())
-            if play["event"] in fenwick_events:
-                xg_play = {
-                    **play,
-                    "position": _POSITION_COLLAPSE.get(play.get("player_1_position") or "", "F"),
-                    "score_diff": max(-4, min(4, play.get("score_diff") or 0)),
-                }
-                final_xg.append(XGFields.model_validate(xg_play).model_dump())
+            stage["rows"] = xg_frame.height
 
-        return final_pbp, final_ext, final_xg
+        return pbp_frame, ext_frame, xg_frame
 
     @cached_property
-    def _pbp_pipeline(self) -> tuple[list, list, list]:
+    def _pbp_pipeline(self) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
         """Hidden Master Pipeline: Orchestrates merging, state tracking, and xG calculation.
 
-        Caches the result as a tuple to serve PBP, Extended PBP, and xG feature properties instantly.
+        Caches the result as a tuple of Polars frames to serve PBP, Extended PBP, and xG feature
+        properties instantly. The list-of-dict properties are derived from these frames on access.
         """
         prefetch_concurrent(self._fetch_api_data, self._fetch_html_events, self._fetch_html_rosters, self._fetch_shifts)
         api_events = self.api_events
@@ -731,41 +758,62 @@ class _GamePBPMixin(_GameBase):
         actives = {p["team_jersey"]: p for p in self.rosters if p.get("team_jersey") and p.get("status") == "ACTIVE"}
 
         if not html_events or not api_events:
-            return [], [], []
+            return (
+                pl.DataFrame(schema=pbp_polars_schema),
+                pl.DataFrame(schema=pbp_ext_polars_schema),
+                pl.DataFrame(schema=xg_polars_schema),
+            )
 
         # 1. Merge HTML events, API events, and line changes
         try:
-            merged_events = self._merge_pbp_events(html_events, api_events, changes, rosters)
+            with self._stage("merge") as stage:
+                merged_events = self._merge_pbp_events(html_events, api_events, changes, rosters)
+                stage["rows"] = len(merged_events)
         except Exception as exc:
             raise DataMismatchError(f"Game {self.game_id}: failed to merge PBP events") from exc
 
         # 2. Track cumulative game state (score, on-ice, strength, flags)
         try:
-            stateful_events = self._track_pbp_state(merged_events, actives)
+            with self._stage("state") as stage:
+                stateful_events = self._track_pbp_state(merged_events, actives)
+                stage["rows"] = len(stateful_events)
         except Exception as exc:
             raise DataMismatchError(f"Game {self.game_id}: failed to track game state") from exc
 
-        # 3. Calculate xG and validate final schema
+        # 3. Validate final schema and calculate xG
         try:
-            final_pbp, final_ext, final_xg = self._calculate_pbp_xg(stateful_events)
+            return self._calculate_pbp_xg(stateful_events)
         except Exception as exc:
             raise DataMismatchError(f"Game {self.game_id}: failed to calculate xG") from exc
 
-        return final_pbp, final_ext, final_xg
+    @property
+    def _play_by_play_frame(self) -> pl.DataFrame:
+        """Typed Polars frame behind ``play_by_play``."""
+        return self._pbp_pipeline[0]
+
+    @property
+    def _play_by_play_ext_frame(self) -> pl.DataFrame:
+        """Typed Polars frame behind ``play_by_play_ext``."""
+        return self._pbp_pipeline[1]
 
     @property
+    def _xg_fields_frame(self) -> pl.DataFrame:
+        """Typed Polars frame behind ``xg_fields``."""
+        return self._pbp_pipeline[2]
+
+    @cached_property
     @shared_doc(_GAME_PLAY_BY_PLAY_DOC)
     def play_by_play(self) -> list:
         """play_by_play — docstring lives in _docstrings._PLAY_BY_PLAY_DOC."""
-        return self._pbp_pipeline[0]
+        return self._play_by_play_frame.to_dicts()
 
-    @property
+    @cached_property
     @shared_doc(_GAME_PLAY_BY_PLAY_EXT_DOC)
     def play_by_play_ext(self) -> list:
         """play_by_play_ext — docstring lives in _docstrings._GAME_PLAY_BY_PLAY_EXT_DOC."""
-        return self._pbp_pipeline[1]
+        return self._play_by_play_ext_frame.to_dicts()
 
-    @property
+    @cached_property
     def xg_fields(self) -> list:
         """List of XGFields dicts for every fenwick event (GOAL, SHOT, MISS) in this game.
 
@@ -773,7 +821,7 @@ class _GamePBPMixin(_GameBase):
         without any additional feature engineering. Use ``xg_fields_df`` for a typed
         Polars DataFrame.
         """
-        return self._pbp_pipeline[2]
+        return self._xg_fields_frame.to_dicts()
 
     @property
     def xg_fields_df(self) -> pl.DataFrame:
@@ -798,10 +846,10 @@ class _GamePBPMixin(_GameBase):
             X_ctx = apply_fixed_categoricals(xg[CONTEXT_XG_FEATURE_COLUMNS], strength)
             context_xg = context_xg_model.predict_proba(X_ctx, base_margin=logit_bm)[:, 1]
         """
-        return self._finalize_dataframe(data=self.xg_fields, schema=xg_polars_schema)
+        return self._finalize_dataframe(data=self._xg_fields_frame, schema=xg_polars_schema)
 
     @property
     @shared_doc(_GAME_PLAY_BY_PLAY_DF_DOC)
     def play_by_play_df(self) -> pd.DataFrame | pl.DataFrame:
         """play_by_play_df — docstring lives in _docstrings._GAME_PLAY_BY_PLAY_DF_DOC."""
-        return self._finalize_dataframe(data=self.play_by_play, schema=pbp_polars_schema)
+        return self._finalize_dataframe(data=self._play_by_play_frame, schema=pbp_polars_schema)
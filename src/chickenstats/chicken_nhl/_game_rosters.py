@@ -72,10 +72,15 @@ class _GameRostersMixin(_GameBase):
     def rosters(self) -> list:
         """Rosters — docstring lives in _docstrings._GAME_ROSTERS_DOC."""
         prefetch_concurrent(self._fetch_api_data, self._fetch_html_rosters)
-        combined_and_fixed = self._combine_rosters()
+        # Munge both source rosters first, so their stages are timed separately from combining them
+        _ = self.api_rosters, self.html_rosters
 
-        # Pydantic validation
-        final = [RosterPlayer.model_construct(**player).model_dump() for player in combined_and_fixed]
+        with self._stage("munge_rosters") as stage:
+            combined_and_fixed = self._combine_rosters()
+
+            # Pydantic validation
+            final = [RosterPlayer.model_construct(**player).model_dump() for player in combined_and_fixed]
+            stage["rows"] = len(final)
 
         return sorted(final, key=lambda k: (k["team_venue"], k["status"], k["player_name"]))
 
@@ -3,6 +3,12 @@
 Contains:
     load_score_adjustments: Loads the bundled score-adjustment weight table from the package pickle file.
     prefetch_concurrent: Runs two callables in parallel via ThreadPoolExecutor to warm cached properties.
+    PrefetchedSession: Session stand-in that serves already-downloaded responses, used to parse games off-process.
+    is_game_settled: Whether a game's reports are final and can be served from the response cache.
+    season_and_session: Season and session encoded in a game ID.
+    record_stage: Times one stage of the Game pipeline and appends it to a list of stage metrics.
+    lxml_strip_html: lxml / XPath equivalent of ``hs_strip_html`` for the HTML play-by-play report.
+    lxml_shift_cells: lxml / XPath extraction of the team name and player / shift cells of a TH or TV report.
     apply_event_versioning and other event-processing helpers used across _game_api.py, _game_html.py,
     _game_rosters.py, and _game_pbp.py.
 """
@@ -11,15 +17,40 @@ import importlib
 import importlib.resources
 import logging
 import pickle
+import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime as dt, timedelta, timezone
 from functools import lru_cache
-from typing import cast
+
+import requests
+from lxml import etree, html as lxml_html
+from requests.exceptions import RequestException, RetryError
 
 from chickenstats.chicken_nhl.validation_pydantic import APIEvent
 from chickenstats.utilities.enums import FORWARDS
 
 logger = logging.getLogger(__name__)
 
+# Digits 5-6 of the game ID encode the session type:
+#   01 = PR (preseason), 02 = R (regular season), 03 = P (playoffs),
+#   19 = FO (Four Nations Faceoff, international mid-season competition, 2024-25+)
+_GAME_SESSIONS: dict[str, str] = {"01": "PR", "02": "R", "03": "P", "19": "FO"}
+
+
+def season_and_session(game_id: int) -> tuple[int, str]:
+    """Return the eight-digit season and the session code encoded in a game ID.
+
+    Examples:
+        >>> season_and_session(2023020001)
+        (20232024, 'R')
+    """
+    # Season derived from the first four digits of the game ID (the start year)
+    year = int(str(game_id)[0:4])
+
+    return int(f"{year}{year + 1}"), _GAME_SESSIONS[str(game_id)[4:6]]
+
 
 def load_score_adjustments() -> dict:
     """Load the score-adjustment weight table from the package's bundled pickle file.
@@ -162,6 +193,48 @@ def hs_strip_html(td: list) -> list:
     return td
 
 
+def lxml_strip_html(content: bytes) -> list:
+    """Return the text of every ``bborder`` cell in an HTML play-by-play report, parsed with lxml.
+
+    Produces the same cell values as ``BeautifulSoup`` + ``find_all`` + ``hs_strip_html``, without
+    building a BeautifulSoup tree: the report is parsed once by ``lxml.html`` and the cells are
+    selected with a single XPath query. Returns an empty list if the page has no content.
+    """
+    try:
+        root = lxml_html.document_fromstring(content.decode("ISO-8859-1"))
+    except (etree.ParserError, ValueError):
+        return []
+
+    cells = [cell.text_content() for cell in root.xpath('//td[contains(@class, "bborder")]')]
+
+    # Matches hs_strip_html, which trims the fourth cell to the elapsed time
+    if len(cells) > 3:
+        cells[3] = cells[3][: cells[3].find(":") + 3]
+
+    return cells
+
+
+def lxml_shift_cells(content: bytes) -> tuple[str | None, list[str]]:
+    """Return the team heading and the player / shift cell texts of an HTML shifts report, parsed with lxml.
+
+    The cells are returned in document order, matching
+    ``soup.find_all("td", {"class": ["playerHeading + border", "lborder + bborder"]})``.
+    The team heading is ``None`` if the report has no team heading (e.g., an empty page).
+    """
+    try:
+        root = lxml_html.document_fromstring(content.decode("ISO-8859-1"))
+    except (etree.ParserError, ValueError):
+        return None, []
+
+    team_headings = root.xpath('//td[@align="center" and @class="teamHeading + border"]')
+    if not team_headings:
+        return None, []
+
+    cells = root.xpath('//td[@class="playerHeading + border" or @class="lborder + bborder"]')
+
+    return team_headings[0].text_content(), [cell.text_content() for cell in cells]
+
+
 @lru_cache(maxsize=1)
 def _get_score_adjustments() -> dict:
     """Cached wrapper around ``load_score_adjustments`` — loads the table once per process."""
@@ -281,16 +354,25 @@ def map_player_metadata(event_info: dict, rosters: dict) -> dict:
     return event_info
 
 
-def apply_event_versioning(event_list: list) -> list:
-    """Ensures simultaneous events get unique version numbers and validates with Pydantic."""
+def apply_event_versioning(event_list: list, validation: str = "polars") -> list:
+    """Ensures simultaneous events get unique version numbers and validates them against ``APIEvent``.
+
+    Validation is column-wise over the whole game with ``validation="polars"`` (default), or
+    one ``APIEvent.model_validate`` per event with ``validation="pydantic"``.
+    """
     counts = {}
-    final_events = []
     for ev in event_list:
         key = (ev["event"], ev["game_seconds"], ev["period"], ev.get("player_1_api_id"))
         counts[key] = counts.get(key, 0) + 1
         ev["version"] = counts[key]
-        final_events.append(APIEvent.model_validate(ev).model_dump())
-    return final_events
+
+    if validation == "pydantic":
+        return [APIEvent.model_validate(ev).model_dump() for ev in event_list]
+
+    from chickenstats.chicken_nhl._validation_utils import validate_records_columnar
+    from chickenstats.chicken_nhl.validation_polars import api_events_polars_schema
+
+    return validate_records_columnar(event_list, APIEvent, api_events_polars_schema).to_dicts()
 
 
 def parse_time(time_str: str) -> int:
@@ -313,49 +395,67 @@ def aggregate_players(players: list) -> dict:
     and to their specific positional bucket (forwards map to ``"F"``; players
     with unrecognized positions are added to ``"ALL"`` only).
     """
-    forwards_set = FORWARDS
-
-    agg: dict[str, dict[str, int | list]] = {
-        "ALL": {"count": 0, "jerseys": [], "names": [], "eh_ids": [], "api_ids": [], "positions": []},
-        "F": {"count": 0, "jerseys": [], "names": [], "eh_ids": [], "api_ids": [], "positions": []},
-        "D": {"count": 0, "jerseys": [], "names": [], "eh_ids": [], "api_ids": [], "positions": []},
-        "G": {"count": 0, "jerseys": [], "names": [], "eh_ids": [], "api_ids": [], "positions": []},
-    }
+    buckets: dict[str, list[tuple]] = {"ALL": [], "F": [], "D": [], "G": []}
 
     for p in players:
-        team_jersey, name, eh_id = p.get("team_jersey"), p.get("player_name"), p.get("eh_id")
-        api_id, pos = str(p.get("api_id")), p.get("position")
-
-        # Determine specific bucket using O(1) lookups
-        bucket = "F" if pos in forwards_set else pos if pos in {"D", "G"} else None
+        pos = p.get("position")
+        player = (p.get("team_jersey"), p.get("player_name"), p.get("eh_id"), str(p.get("api_id")), pos)
 
         # Always add to ALL, plus the specific positional bucket
-        buckets_to_fill = ["ALL", bucket] if bucket else ["ALL"]
-
-        for b in buckets_to_fill:
-            agg[b]["count"] = cast(int, agg[b]["count"]) + 1
-            cast(list, agg[b]["jerseys"]).append(team_jersey)
-            cast(list, agg[b]["names"]).append(name)
-            cast(list, agg[b]["eh_ids"]).append(eh_id)
-            cast(list, agg[b]["api_ids"]).append(api_id)
-            cast(list, agg[b]["positions"]).append(pos)
-
-    for bucket_name, bucket in agg.items():
-        api_ids: list[str] = cast(list, bucket["api_ids"])
-        if api_ids:
-            positions: list[str] = cast(list, bucket["positions"])
-            if bucket_name == "ALL":
-                order = sorted(
-                    range(len(api_ids)), key=lambda i: (_POSITION_ORDER.get(positions[i], 3), int(api_ids[i]))
-                )  # type: ignore[arg-type]
-            else:
-                order = sorted(range(len(api_ids)), key=lambda i: int(api_ids[i]))  # type: ignore[arg-type]
-            for key in ("jerseys", "names", "eh_ids", "api_ids", "positions"):
-                bucket[key] = [cast(list, bucket[key])[i] for i in order]
+        buckets["ALL"].append(player)
+
+        bucket = "F" if pos in FORWARDS else pos if pos in {"D", "G"} else None
+        if bucket:
+            buckets[bucket].append(player)
+
+    agg: dict[str, dict[str, int | list]] = {}
+
+    for bucket_name, bucket_players in buckets.items():
+        if bucket_name == "ALL":
+            bucket_players.sort(key=lambda player: (_POSITION_ORDER.get(player[4], 3), int(player[3])))
+        else:
+            bucket_players.sort(key=lambda player: int(player[3]))
+
+        jerseys, names, eh_ids, api_ids, positions = (
+            (list(values) for values in zip(*bucket_players, strict=True)) if bucket_players else ([] for _ in range(5))
+        )
+
+        agg[bucket_name] = {
+            "count": len(bucket_players),
+            "jerseys": jerseys,
+            "names": names,
+            "eh_ids": eh_ids,
+            "api_ids": api_ids,
+            "positions": positions,
+        }
 
     return agg
 
 
+@contextmanager
+def record_stage(metrics: list[dict], game_id: int, stage: str) -> Iterator[dict]:
+    """Time one stage of the Game pipeline and append its record to ``metrics``.
+
+    Yields the record so the stage can fill in the ``bytes`` it downloaded and the ``rows`` it
+    produced. The record is appended even if the stage raises, so failed stages are still timed.
+    Appending to a list is thread-safe, so concurrent fetches can share one ``metrics`` list.
+
+    Examples:
+        >>> metrics = []
+        >>> with record_stage(metrics, 2023020001, "fetch_api") as record:
+        ...     response = session.get(url)
+        ...     record["bytes"] = len(response.content)
+    """
+    record = {"game_id": game_id, "stage": stage, "start": time.time(), "seconds": 0.0, "bytes": None, "rows": None}
+    start = time.perf_counter()
+
+    try:
+        yield record
+    finally:
+        record["seconds"] = time.perf_counter() - start
+        metrics.append(record)
+
+
 def prefetch_concurrent(*fetch_tasks) -> None:
     """Run the given fetch tasks concurrently and cache their results.
 
@@ -369,3 +469,63 @@ def prefetch_concurrent(*fetch_tasks) -> None:
                 future.result()
             except Exception:  # noqa: BLE001  # pyright: ignore[reportBroadExceptionCaught]
                 logger.debug("Prefetch task failed", exc_info=True)
+
+
+class PrefetchedSession:
+    """Session stand-in that serves responses downloaded ahead of time.
+
+    Lets a ``Game`` run its full parsing pipeline without network access, e.g., in a worker
+    process of the scraper's parse pool. ``responses`` maps each URL to either a
+    ``(status_code, content)`` tuple or an error string recorded when the download failed.
+    Errors are replayed as ``RetryError`` when the original failure was a ``RetryError``, so
+    the game's existing fallbacks behave exactly as they would against the live endpoint.
+
+    The object is a plain container of bytes and strings, so it pickles cheaply across processes.
+    """
+
+    def __init__(self, responses: dict[str, tuple[int, bytes] | str]):
+        """Store the pre-downloaded responses keyed by URL."""
+        self.responses = responses
+
+    def get(self, url: str, *args, **kwargs) -> requests.Response:
+        """Return the stored response for ``url``, or raise the stored download error."""
+        stored = self.responses.get(url)
+
+        if stored is None:
+            raise RequestException(f"{url} was not downloaded before parsing")
+
+        if isinstance(stored, str):
+            if stored.startswith("RetryError"):
+                raise RetryError(stored)
+            raise RequestException(stored)
+
+        status_code, content = stored
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response._content = content
+
+        return response
+
+
+def is_game_settled(api_response: dict, settle_days: int) -> bool:
+    """Return whether a game is over and old enough that its reports will no longer change.
+
+    A game is settled once the NHL API reports it as ``OFF`` (final and official) and it
+    started at least ``settle_days`` days ago, leaving time for scorer corrections to land.
+
+    Parameters:
+        api_response: Parsed NHL API play-by-play response for the game.
+        settle_days: Number of days after the start time before the game is treated as final.
+    """
+    if api_response.get("gameState") != "OFF" or not api_response.get("startTimeUTC"):
+        return False
+
+    start_time_str = api_response["startTimeUTC"]
+    if "Z" in start_time_str:
+        start_time_str = start_time_str[:-1] + "+00:00"
+
+    start_time = dt.fromisoformat(start_time_str)
+
+    return dt.now(timezone.utc) - start_time >= timedelta(days=settle_days)
@@ -5,9 +5,13 @@ throughout chickenstats (e.g. ``"TJ OSHIE"`` → ``"T.J. OSHIE"``).
 ``correct_api_names_dict`` maps NHL API player IDs to the suffixed Evolving Hockey
 ID for players whose names collide with an existing player (e.g. ``8480222`` →
 ``"SEBASTIAN.AHO2"``).
-``correct_player_name`` applies both tables and handles duplicate-ID disambiguation.
+``correct_player_name`` applies both tables and handles duplicate-ID disambiguation,
+caching each resolved name.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from unidecode import unidecode
 
 correct_names_dict = {
@@ -125,6 +129,22 @@ correct_api_names_dict = {
 }
 
 
+# Base Evolving Hockey IDs shared by two players, mapped to the rule identifying the second
+# player from (season, position, jersey); matching players get a "2" suffix
+_DUPLICATE_RULES: dict[str, Callable[[int, str | None, str | int | None], bool]] = {
+    "SEBASTIAN.AHO": lambda season, position, jersey: position == "D",
+    "COLIN.WHITE": lambda season, position, jersey: season >= 20162017,
+    "SEAN.COLLINS": lambda season, position, jersey: position is not None and position != "D",
+    "ALEX.PICARD": lambda season, position, jersey: position is not None and position != "D",
+    "ERIK.GUSTAFSSON": lambda season, position, jersey: season >= 20152016,
+    "MIKKO.LEHTONEN": lambda season, position, jersey: season >= 20202021,
+    "NATHAN.SMITH": lambda season, position, jersey: season >= 20212022,
+    "DANIIL.TARASOV": lambda season, position, jersey: position == "G",
+    "ELIAS.PETTERSSON": lambda season, position, jersey: position == "D" or jersey == "VAN25" or jersey == 25,
+}
+
+
+@lru_cache(maxsize=8192)
 def correct_player_name(
     player_name: str, season: str | int, player_position: str | None = None, player_jersey: str | int | None = None
 ) -> tuple[str, str]:
@@ -135,6 +155,10 @@ def correct_player_name(
     name, then appends a "2" suffix for players with duplicate IDs based on
     season, position, or jersey number.
 
+    Results are memoized in a bounded LRU cache keyed by the arguments, so a
+    player seen earlier in a scrape resolves with a single lookup. Use
+    ``correct_player_name.cache_info()`` for hit and miss counts.
+
     Parameters:
         player_name: Raw player name in ALL CAPS.
         season: Eight-digit season integer, e.g. 20232024.
@@ -155,27 +179,14 @@ def correct_player_name(
 
     # Correcting Evolving Hockey IDs for duplicates
 
-    season_int = int(season)
-
-    duplicates = {
-        "SEBASTIAN.AHO": player_position == "D",
-        "COLIN.WHITE": season_int >= 20162017,
-        "SEAN.COLLINS": player_position is not None and player_position != "D",
-        "ALEX.PICARD": player_position is not None and player_position != "D",
-        "ERIK.GUSTAFSSON": season_int >= 20152016,
-        "MIKKO.LEHTONEN": season_int >= 20202021,
-        "NATHAN.SMITH": season_int >= 20212022,
-        "DANIIL.TARASOV": player_position == "G",
-        "ELIAS.PETTERSSON": player_position == "D" or player_jersey == "VAN25" or player_jersey == 25,
-    }
+    duplicate_rule = _DUPLICATE_RULES.get(player_eh_id)
 
-    for duplicate_name, condition in duplicates.items():
-        if player_eh_id == duplicate_name and condition:
-            player_eh_id = f"{duplicate_name}2"
+    if duplicate_rule is not None and duplicate_rule(int(season), player_position, player_jersey):
+        player_eh_id = f"{player_eh_id}2"
 
     # Edge case: unidecode produces "COLIN." (trailing dot, no last name token)
     # when the raw name is just "COLIN WHITE" but the split yields an empty suffix.
-    # This cannot be caught by the duplicates dict above, so it is handled here.
+    # This cannot be caught by the duplicate rules above, so it is handled here.
 
     if player_eh_id == "COLIN.":  # Not covered by tests
         player_eh_id = "COLIN.WHITE2"
@@ -0,0 +1,155 @@
+"""On-disk cache of processed single-game results for the Scraper.
+
+Contains:
+    GameResultCache: Persists each game's final frames as Arrow IPC files keyed by ``(game_id, cs_version)``.
+    corrections_digest: Hash of the hand-curated corrections that apply to a single game.
+
+Cached results are invalidated by a package version bump (each version reads and writes its own
+subdirectory) or by a change to any correction in the correction registry that targets the game,
+including corrections merged at runtime with ``load_corrections``.
+Corrections for other games leave the entry untouched.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+from chickenstats.chicken_nhl._corrections import game_corrections
+from chickenstats.chicken_nhl.validation_pydantic import _VERSION
+
+logger = logging.getLogger(__name__)
+
+
+def corrections_digest(game_id: int) -> str:
+    """Return a digest of the corrections that apply to ``game_id``, or ``"none"`` if there are none.
+
+    Examples:
+        >>> corrections_digest(2023020001)
+        'none'
+    """
+    corrections = game_corrections(int(game_id))
+
+    if not corrections:
+        return "none"
+
+    # Event corrections mix integer and "*" keys, which json cannot sort together
+    serializable = {
+        kind: {str(key): value for key, value in entry.items()} if isinstance(entry, dict) else entry
+        for kind, entry in corrections.items()
+    }
+
+    return hashlib.sha256(json.dumps(serializable, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _atomic_write(path: Path, write) -> None:
+    """Call ``write(tmp_path)`` and move the result to ``path``, so readers never see partial files."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(fd)
+
+    try:
+        write(tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class GameResultCache:
+    """Arrow IPC store of each game's processed frames, keyed by ``(game_id, cs_version)``.
+
+    Each game has a directory holding one ``<key>.arrow`` file per frame (e.g., ``play_by_play``,
+    ``shifts``) and a ``manifest.json`` recording the corrections digest the frames were built with.
+    Entries are only returned when every requested frame is present and the digest still matches.
+
+    Parameters:
+        cache_dir (str | Path):
+            Root directory for the cache. Results are stored under a subdirectory named after the
+            installed chickenstats version.
+        cs_version (str):
+            Version used to namespace the cache. Defaults to the installed chickenstats version.
+
+    Examples:
+        >>> cache = GameResultCache("./game_cache")
+        >>> cache.store(2023020001, {"play_by_play": pbp})
+        >>> frames = cache.load(2023020001, ("play_by_play",))
+    """
+
+    def __init__(self, cache_dir: str | Path, cs_version: str = _VERSION):
+        """Create the versioned cache directory if it does not exist."""
+        self.cs_version: str = cs_version
+        self.cache_dir: Path = Path(cache_dir) / cs_version
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _read_manifest(self, game_id: int) -> dict | None:
+        """Return the manifest for ``game_id`` if it exists and matches the current corrections."""
+        try:
+            manifest = json.loads((self.cache_dir / str(game_id) / "manifest.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("corrections") != corrections_digest(game_id):
+            return None
+
+        return manifest
+
+    def load(self, game_id: int, keys: tuple[str, ...]) -> dict | None:
+        """Return ``{"game_id": ..., key: frame | None}`` for every key, or ``None`` on a cache miss.
+
+        Empty frames are returned as ``None``, matching a freshly scraped game.
+        """
+        manifest = self._read_manifest(game_id)
+
+        if manifest is None or not set(keys).issubset(manifest["keys"]):
+            return None
+
+        frames: dict = {"game_id": game_id}
+
+        try:
+            for key in keys:
+                frame = pl.read_ipc((self.cache_dir / str(game_id) / f"{key}.arrow").read_bytes())
+                frames[key] = frame if not frame.is_empty() else None
+        except (OSError, pl.exceptions.PolarsError):
+            logger.debug("Failed to read cached results for game %s", game_id, exc_info=True)
+            return None
+
+        return frames
+
+    def store(self, game_id: int, frames: dict) -> None:
+        """Persist the frames of a single game result.
+
+        ``frames`` maps keys to Polars frames; games without data for a key should pass an empty
+        frame with the key's schema. File-system errors are logged and otherwise ignored, since
+        the cache is an optimisation only.
+        """
+        game_dir = self.cache_dir / str(game_id)
+
+        try:
+            game_dir.mkdir(exist_ok=True)
+
+            manifest = self._read_manifest(game_id) or {"corrections": corrections_digest(game_id), "keys": []}
+
+            for key, frame in frames.items():
+                if key == "game_id":
+                    continue
+
+                _atomic_write(game_dir / f"{key}.arrow", frame.write_ipc)
+
+                if key not in manifest["keys"]:
+                    manifest["keys"].append(key)
+
+            _atomic_write(game_dir / "manifest.json", lambda path: Path(path).write_text(json.dumps(manifest)))
+
+        except OSError:
+            logger.warning("Failed to cache results for game %s", game_id, exc_info=True)
+
+    def discard(self, game_id: int) -> None:
+        """Remove a game's cached frames, e.g., after its source reports changed upstream."""
+        shutil.rmtree(self.cache_dir / str(game_id), ignore_errors=True)
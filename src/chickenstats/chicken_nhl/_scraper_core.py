@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import shutil
+import tempfile
 import warnings
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import narwhals as nw
@@ -11,7 +20,14 @@ if TYPE_CHECKING:
     import pandas as pd
     import pyarrow as pa
 
+from chickenstats.chicken_nhl._corrections import loaded_corrections, replay_corrections
+from chickenstats.chicken_nhl._dataset import write_dataset
+from chickenstats.chicken_nhl._game_core import _DATA_SCHEMAS, _STAGE_METRICS_SCHEMA
+from chickenstats.chicken_nhl._game_utils import PrefetchedSession, is_game_settled, record_stage
+from chickenstats.chicken_nhl._result_cache import GameResultCache
+from chickenstats.chicken_nhl._stats_cache import StatsCache
 from chickenstats.chicken_nhl.game import Game
+from chickenstats.exceptions import InvalidInputError
 from chickenstats.chicken_nhl.validation_polars import (
     api_events_polars_schema,
     api_rosters_polars_schema,
@@ -27,22 +43,145 @@ from chickenstats.chicken_nhl.validation_polars import (
 from chickenstats.utilities.enums import Backend, LinesLevels, StatsLevels, TeamStatsLevels
 from chickenstats.utilities.utilities import ChickenProgress, ChickenSession, _to_backend, convert_to_list
 
-# Map result keys to their polars schemas for incremental DataFrame conversion
-_SCRAPE_SCHEMAS: dict[str, dict] = {
-    "api_events": api_events_polars_schema,
-    "api_rosters": api_rosters_polars_schema,
-    "changes": changes_polars_schema,
-    "html_events": html_events_polars_schema,
-    "html_rosters": html_rosters_polars_schema,
-    "rosters": rosters_polars_schema,
-    "shifts": shifts_polars_schema,
-    "play_by_play": pbp_polars_schema,
-    "play_by_play_ext": pbp_ext_polars_schema,
-    "xg_fields": xg_polars_schema,
+# Game endpoint attributes each scrape type reads — the download stage of the parse pipeline
+# fetches exactly these URLs so the parse stage never needs network access
+_SCRAPE_ENDPOINTS: dict[str, tuple[str, ...]] = {
+    "api_events": ("api_endpoint",),
+    "api_rosters": ("api_endpoint",),
+    "html_rosters": ("html_rosters_endpoint",),
+    "rosters": ("api_endpoint", "html_rosters_endpoint"),
+    "html_events": ("api_endpoint", "html_rosters_endpoint", "html_events_endpoint"),
+    "shifts": ("api_endpoint", "html_rosters_endpoint", "home_shifts_endpoint", "away_shifts_endpoint"),
+    "changes": ("api_endpoint", "html_rosters_endpoint", "home_shifts_endpoint", "away_shifts_endpoint"),
+    "play_by_play": (
+        "api_endpoint",
+        "html_rosters_endpoint",
+        "html_events_endpoint",
+        "home_shifts_endpoint",
+        "away_shifts_endpoint",
+    ),
+}
+
+# Data keys each scrape type produces for a single game, in the order the Game properties are read.
+# api_events and api_rosters share the same HTTP call, as do shifts and changes.
+_SCRAPE_KEYS: dict[str, tuple[str, ...]] = {
+    "api_events": ("api_events", "api_rosters"),
+    "api_rosters": ("api_rosters",),
+    "html_events": ("html_events",),
+    "html_rosters": ("html_rosters",),
+    "rosters": ("rosters",),
+    "shifts": ("shifts", "changes"),
+    "changes": ("changes", "shifts"),
+    "play_by_play": (
+        "play_by_play",
+        "play_by_play_ext",
+        "xg_fields",
+        "api_events",
+        "api_rosters",
+        "html_events",
+        "html_rosters",
+        "rosters",
+        "shifts",
+        "changes",
+    ),
+}
+
+# API game states after the final horn — only these games are written to the processed-game cache,
+# so a game scraped while in progress is never served truncated
+_FINAL_GAME_STATES: frozenset[str] = frozenset({"FINAL", "OFF"})
+
+# Pipeline stage timed while downloading each game endpoint
+_FETCH_STAGES: dict[str, str] = {
+    "api_endpoint": "fetch_api",
+    "html_rosters_endpoint": "fetch_html_rosters",
+    "html_events_endpoint": "fetch_html_events",
+    "home_shifts_endpoint": "fetch_shifts",
+    "away_shifts_endpoint": "fetch_shifts",
 }
 
 logger = logging.getLogger(__name__)
 
+# Per-stage timings of each scraped game are logged here at DEBUG level, with the record as ``stage_metrics``
+metrics_logger = logging.getLogger("chickenstats.chicken_nhl.metrics")
+
+
+def _scrape_type_for(kinds: Iterable[str]) -> str:
+    """Return the scrape type that produces every data key in kinds with the fewest downloads and outputs."""
+    kinds = set(kinds)
+
+    unknown = sorted(kinds - _DATA_SCHEMAS.keys())
+    if unknown or not kinds:
+        raise InvalidInputError(f"kinds must be one or more of {sorted(_DATA_SCHEMAS)}, got {unknown or kinds!r}")
+
+    candidates = [scrape_type for scrape_type, keys in _SCRAPE_KEYS.items() if kinds.issubset(keys)]
+
+    return min(
+        candidates, key=lambda scrape_type: (len(_SCRAPE_ENDPOINTS[scrape_type]), len(_SCRAPE_KEYS[scrape_type]))
+    )
+
+
+def _collect_game_data(game: Game, scrape_type: str) -> dict:
+    """Return a dict with ``game_id`` and a Polars frame for each data key produced by scrape_type."""
+    if scrape_type not in _SCRAPE_KEYS:
+        raise InvalidInputError(f"{scrape_type!r} is not a supported scrape type")
+
+    return {"game_id": game.game_id, **{key: game._frame(key) for key in _SCRAPE_KEYS[scrape_type]}}
+
+
+def _result_to_frames(result: dict) -> dict:
+    """Normalise the frames of a single-game result, turning empty frames into ``None``.
+
+    Empty frames become ``None`` so callers can skip them; results returned by a parse-pool
+    worker have already been normalised and pass through unchanged.
+    """
+    return {
+        key: value if key == "game_id" or value is None or not value.is_empty() else None
+        for key, value in result.items()
+    }
+
+
+def _concat_frames(data: list[pl.DataFrame | Path], schema) -> pl.DataFrame:
+    """Concatenate per-game frames, or the Arrow IPC files they were spilled to.
+
+    Spilled files are read with ``scan_ipc``, which memory-maps the uncompressed files, so only
+    the concatenated result is materialised.
+    """
+    if not data:
+        return pl.DataFrame(schema=schema)
+
+    if isinstance(data[0], Path):
+        return pl.scan_ipc(data).collect()
+
+    return pl.concat(data)
+
+
+def _parse_prefetched_game(
+    game_id: int,
+    scrape_type: str,
+    responses: dict,
+    html_parser: Literal["lxml", "bs4"] = "lxml",
+    validation: Literal["polars", "pydantic"] = "polars",
+) -> tuple[dict | None, list[dict], bool]:
+    """Run the Game pipeline over pre-downloaded responses and return Polars frames.
+
+    Executed in the scraper's parse pool, so it must stay a picklable module-level function.
+    Returns the frames, or ``None`` on failure, mirroring ``_ScraperCore._scrape_single_game``,
+    along with the game's stage metrics and whether the game is final.
+    """
+    game = None
+
+    try:
+        game = Game(game_id, PrefetchedSession(responses), html_parser=html_parser, validation=validation)
+        return (
+            _result_to_frames(_collect_game_data(game, scrape_type)),
+            game.stage_metrics,
+            game.game_state in _FINAL_GAME_STATES,
+        )
+
+    except Exception:  # noqa: BLE001
+        logger.warning("Failed to parse game %s", game_id, exc_info=True)
+        return None, game.stage_metrics if game is not None else [], False
+
 
 class _ScraperBase:
     """Type-checker stub — declares all cross-mixin attributes available on the Scraper object.
@@ -54,21 +193,29 @@ class _ScraperBase:
     if TYPE_CHECKING:
         # Core state (from _ScraperCore.__init__)
         game_ids: list
+        _bad_games: list
         _backend: str
         disable_progress_bar: bool
         transient_progress_bar: bool
-
-        # Raw data caches (from _ScraperCore)
-        _api_events: list[pl.DataFrame]
-        _api_rosters: list[pl.DataFrame]
-        _html_events: list[pl.DataFrame]
-        _html_rosters: list[pl.DataFrame]
-        _rosters: list[pl.DataFrame]
-        _shifts: list[pl.DataFrame]
-        _changes: list[pl.DataFrame]
-        _play_by_play: list[pl.DataFrame]
-        _play_by_play_ext: list[pl.DataFrame]
-        _xg_fields: list[pl.DataFrame]
+        max_workers: int
+        parse_workers: int
+        html_parser: Literal["lxml", "bs4"]
+        validation: Literal["polars", "pydantic"]
+        retain: frozenset[str]
+        _game_cache: GameResultCache | None
+        _spill_dir: Path | None
+
+        # Raw data caches (from _ScraperCore) — frames, or Arrow IPC paths when spilling to disk
+        _api_events: list[pl.DataFrame | Path]
+        _api_rosters: list[pl.DataFrame | Path]
+        _html_events: list[pl.DataFrame | Path]
+        _html_rosters: list[pl.DataFrame | Path]
+        _rosters: list[pl.DataFrame | Path]
+        _shifts: list[pl.DataFrame | Path]
+        _changes: list[pl.DataFrame | Path]
+        _play_by_play: list[pl.DataFrame | Path]
+        _play_by_play_ext: list[pl.DataFrame | Path]
+        _xg_fields: list[pl.DataFrame | Path]
         _scraped_play_by_play: set[int]
 
         # Aggregated stat frames (from _ScraperCore)
@@ -76,10 +223,13 @@ class _ScraperBase:
         _oi_stats: pl.DataFrame
         _stats: pl.DataFrame
         _lines: pl.DataFrame
+        _lines_totals: pl.DataFrame
         _team_stats: pl.DataFrame
+        _team_stats_totals: pl.DataFrame
         _stats_levels: StatsLevels
         _lines_levels: LinesLevels
         _team_stats_levels: TeamStatsLevels
+        _stats_cache: StatsCache
 
         # Cached properties from _ScraperRawMixin
         play_by_play: pl.DataFrame
@@ -88,6 +238,8 @@ class _ScraperBase:
 
         # Methods used across mixin boundaries
         def _is_empty(self, df: pl.DataFrame) -> bool: ...
+        def _check_retained(self, key: str) -> None: ...
+        def _retained_data(self, key: str) -> list[pl.DataFrame | Path]: ...
         def _scrape(
             self,
             scrape_type: Literal[
@@ -100,9 +252,11 @@ class _ScraperBase:
                 "shifts",
                 "rosters",
             ],
+            max_workers: int | None = None,
+            parse_workers: int | None = None,
         ) -> None: ...
         def _finalize_dataframe(
-            self, data: list[pl.DataFrame], schema: object
+            self, data: list[pl.DataFrame | Path], schema: object
         ) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame: ...
 
 
@@ -113,6 +267,17 @@ class _ScraperCore(_ScraperBase):
         disable_progress_bar: bool = False,
         transient_progress_bar: bool = False,
         backend: Backend | Literal["pandas", "polars", "pyarrow", "narwhals"] = "polars",
+        max_workers: int = 1,
+        parse_workers: int = 0,
+        cache_dir: str | Path | None = None,
+        game_cache_dir: str | Path | None = None,
+        html_parser: Literal["lxml", "bs4"] = "lxml",
+        validation: Literal["polars", "pydantic"] = "polars",
+        retain: Iterable[str] | None = None,
+        spill_dir: str | Path | None = None,
+        metrics_hook: Callable[[dict], None] | None = None,
+        stats_cache_size: int = 8,
+        stats_cache_bytes: int | None = 512 * 1024**2,
     ):
         """Instantiate a Scraper for one or more game IDs.
 
@@ -130,18 +295,117 @@ class _ScraperCore(_ScraperBase):
             backend (str):
                 DataFrame backend for all returned data. One of ``"polars"`` (default),
                 ``"pandas"``, ``"pyarrow"``, or ``"narwhals"``.
+            max_workers (int):
+                Maximum number of games scraped concurrently. Each game still issues its own
+                requests in parallel; this controls how many games are in flight at once.
+                Results are always stored in ``game_ids`` order. Default ``1`` (sequential).
+            parse_workers (int):
+                Number of worker processes used to parse downloaded reports. When greater than
+                ``0``, scraping runs as a two-stage pipeline: ``max_workers`` threads only download
+                raw responses, while a process pool runs the HTML / JSON → play-by-play pipeline
+                and returns Polars frames. Scripts using it on macOS or Windows need an
+                ``if __name__ == "__main__":`` guard. Default ``0`` (parse in the scraping threads).
+            cache_dir (str | Path | None):
+                Directory for an on-disk cache of raw API and HTML report responses. Completed
+                games are served from disk without network access; recent games are revalidated
+                with ``ETag`` / ``Last-Modified``. Default ``None`` (no caching).
+            game_cache_dir (str | Path | None):
+                Directory for a cache of each game's processed frames (play-by-play, rosters,
+                shifts, etc.) as Arrow IPC files. Cached games are loaded instead of re-running
+                the parsing pipeline, until the chickenstats version or the game's data
+                corrections change. Games still in progress are not cached. Default ``None``
+                (no caching).
+            html_parser (str):
+                Parser used for the HTML reports. ``"lxml"`` (default) parses with ``lxml.html``
+                and XPath; ``"bs4"`` uses the original BeautifulSoup parser.
+            validation (str):
+                How each game's events are validated. ``"polars"`` (default) validates and coerces
+                whole columns against the Polars schemas; ``"pydantic"`` validates every event with
+                its Pydantic model, which is slower but reports the offending event.
+            retain (Iterable[str] | None):
+                Data kept for each scraped game, e.g., ``{"play_by_play", "play_by_play_ext"}``.
+                Other outputs (raw events, rosters, shifts, etc.) are dropped as soon as a game is
+                scraped, and accessing them raises ``InvalidInputError``. The aggregation methods
+                need ``play_by_play`` and ``play_by_play_ext``. Default ``None`` (keep everything).
+            spill_dir (str | Path | None):
+                Directory where each game's retained frames are written as Arrow IPC files instead
+                of being held in memory. Files are memory-mapped when the data is concatenated and
+                removed when the Scraper is garbage collected. Default ``None`` (keep in memory).
+            metrics_hook (Callable[[dict], None] | None):
+                Called with each stage record added to ``scrape_metrics``, e.g., to export the
+                timings as tracing spans. Records are dicts with the ``scrape_metrics`` columns and
+                may be passed from the scraping threads. Default ``None``.
+            stats_cache_size (int):
+                Number of ``prep_stats``, ``prep_lines``, and ``prep_team_stats`` results kept in memory,
+                keyed by their aggregation parameters, so switching back to an earlier configuration
+                reuses its frames. The least recently used result is evicted first. ``0`` keeps only the
+                current result of each. Default ``8``.
+            stats_cache_bytes (int | None):
+                Memory budget for the cached results, in bytes, as estimated by Polars. Least recently
+                used results are evicted to stay within it. ``None`` for no limit. Default 512 MiB.
+
+        Raises:
+            InvalidInputError: If ``max_workers`` is less than 1, ``parse_workers`` is negative,
+                ``html_parser`` is not ``"lxml"`` or ``"bs4"``, ``validation`` is not
+                ``"polars"`` or ``"pydantic"``, ``retain`` names an unknown data type, or
+                ``stats_cache_size`` or ``stats_cache_bytes`` is negative.
         """
         game_ids = convert_to_list(game_ids, "game ID")
 
+        if max_workers < 1:
+            raise InvalidInputError(f"max_workers must be at least 1, got {max_workers!r}")
+
+        if parse_workers < 0:
+            raise InvalidInputError(f"parse_workers must be 0 or greater, got {parse_workers!r}")
+
+        if html_parser not in ("lxml", "bs4"):
+            raise InvalidInputError(f"html_parser must be 'lxml' or 'bs4', got {html_parser!r}")
+
+        if validation not in ("polars", "pydantic"):
+            raise InvalidInputError(f"validation must be 'polars' or 'pydantic', got {validation!r}")
+
+        if stats_cache_size < 0:
+            raise InvalidInputError(f"stats_cache_size must be 0 or greater, got {stats_cache_size!r}")
+
+        if stats_cache_bytes is not None and stats_cache_bytes < 0:
+            raise InvalidInputError(f"stats_cache_bytes must be 0 or greater, got {stats_cache_bytes!r}")
+
+        if retain is None:
+            retain = frozenset(_DATA_SCHEMAS)
+        else:
+            retain = frozenset([retain] if isinstance(retain, str) else retain)
+
+        unknown = sorted(retain - _DATA_SCHEMAS.keys())
+        if unknown:
+            raise InvalidInputError(f"retain must only contain {sorted(_DATA_SCHEMAS)}, got {unknown!r}")
+
         self._backend: str = backend
+        self.max_workers: int = max_workers
+        self.parse_workers: int = parse_workers
+        self.html_parser: Literal["lxml", "bs4"] = html_parser
+        self.validation: Literal["polars", "pydantic"] = validation
+        self.retain: frozenset[str] = retain
 
         self.disable_progress_bar: bool = disable_progress_bar
         self.transient_progress_bar: bool = transient_progress_bar
 
         self.game_ids: list = game_ids
         self._bad_games: list = []
+        self._game_errors: dict[int, str] = {}
+
+        self.metrics_hook: Callable[[dict], None] | None = metrics_hook
+        self._stage_metrics: list[dict] = []
+
+        self._requests_session: ChickenSession = ChickenSession(cache_dir=cache_dir)
+        self._game_cache: GameResultCache | None = (
+            GameResultCache(game_cache_dir) if game_cache_dir is not None else None
+        )
 
-        self._requests_session: ChickenSession = ChickenSession()
+        self._spill_dir: Path | None = None
+        if spill_dir is not None:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+            self._spill_dir = Path(tempfile.mkdtemp(dir=spill_dir, prefix="scraper-"))
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, ignore_errors=True)
 
         self._api_events: list[pl.DataFrame] = []
         self._scraped_api_events: set[int] = set()
@@ -178,11 +442,15 @@ class _ScraperCore(_ScraperBase):
         self._stats_levels: StatsLevels = StatsLevels()
 
         self._lines: pl.DataFrame = dataframe
+        self._lines_totals: pl.DataFrame = dataframe
         self._lines_levels: LinesLevels = LinesLevels()
 
         self._team_stats: pl.DataFrame = dataframe
+        self._team_stats_totals: pl.DataFrame = dataframe
         self._team_stats_levels: TeamStatsLevels = TeamStatsLevels()
 
+        self._stats_cache: StatsCache = StatsCache(max_entries=stats_cache_size, max_bytes=stats_cache_bytes)
+
     def __repr__(self) -> str:
         """Return a string representation of the Scraper object."""
         base = f"Scraper(game_ids={self.game_ids!r}, backend={self._backend!r})"
@@ -199,21 +467,113 @@ class _ScraperCore(_ScraperBase):
         """Game IDs that failed to scrape."""
         return self._bad_games
 
+    @property
+    def scrape_metrics(self) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame:
+        """Wall time, bytes downloaded, and rows produced by each pipeline stage of every scraped game.
+
+        One row per stage run, with the columns ``game_id``, ``stage``, ``start`` (Unix timestamp),
+        ``seconds``, ``bytes`` (fetch stages only), and ``rows``. Stages are:
+
+        - ``fetch_api``, ``fetch_html_events``, ``fetch_html_rosters``, ``fetch_shifts``: downloads
+        - ``parse_html_events``, ``parse_shifts``: extracting the HTML report cells
+        - ``munge_*``: building each data type's records, e.g., ``munge_shifts``
+        - ``merge``, ``state``, ``validate``, ``xg``: the play-by-play pipeline
+        - ``to_frame``: converting records to DataFrames
+
+        With ``parse_workers``, downloads are timed in the scraping threads and the remaining stages
+        in the parse processes. Games loaded from ``game_cache_dir`` run no stages. Each record is
+        also logged at ``DEBUG`` level to the ``chickenstats.chicken_nhl.metrics`` logger and passed
+        to ``metrics_hook``.
+
+        Examples:
+            Find the slowest stages of a scrape
+            >>> import polars as pl
+            >>> scraper = Scraper(game_ids)
+            >>> scraper.play_by_play
+            >>> scraper.scrape_metrics.group_by("stage").agg(pl.col("seconds").sum()).sort("seconds")
+
+            Export the stages as OpenTelemetry spans
+            >>> def to_span(record):
+            ...     start = int(record["start"] * 1e9)
+            ...     span = tracer.start_span(
+            ...         record["stage"], start_time=start, attributes={"game_id": record["game_id"]}
+            ...     )
+            ...     span.end(end_time=start + int(record["seconds"] * 1e9))
+            >>> scraper = Scraper(game_ids, metrics_hook=to_span)
+        """
+        return _to_backend(pl.from_dicts(self._stage_metrics, schema=_STAGE_METRICS_SCHEMA), self._backend)
+
+    def _record_stage_metrics(self, records: list[dict], replayed: bool = False) -> None:
+        """Add a game's stage records to ``scrape_metrics``, logging each and passing it to ``metrics_hook``.
+
+        With ``replayed``, the records come from a Game parsed from ``_download_game`` responses,
+        whose fetch stages only replayed bytes already downloaded and timed, so they are dropped.
+        """
+        for record in records:
+            if replayed and record["stage"].startswith("fetch_"):
+                continue
+
+            self._stage_metrics.append(record)
+
+            metrics_logger.debug(
+                "Game %s %s: %.4fs, %s bytes, %s rows",
+                record["game_id"],
+                record["stage"],
+                record["seconds"],
+                record["bytes"],
+                record["rows"],
+                extra={"stage_metrics": record},
+            )
+
+            if self.metrics_hook is not None:
+                self.metrics_hook(record)
+
     def _is_empty(self, df) -> bool:
         """Return True if df has no rows."""
         return df.is_empty()
 
+    def _check_retained(self, key: str) -> None:
+        """Raise if the Scraper was told not to retain key, before any games are scraped for it."""
+        if key not in self.retain:
+            raise InvalidInputError(
+                f"{key} is not retained by this Scraper (retain={sorted(self.retain)}); "
+                f"include {key!r} in retain to access it"
+            )
+
+    def _retained_data(self, key: str) -> list[pl.DataFrame | Path]:
+        """Return the stored per-game data for key, raising if the Scraper was told not to retain it."""
+        self._check_retained(key)
+
+        return getattr(self, f"_{key}")
+
+    def _store_frame(self, key: str, game_id: int, frame: pl.DataFrame) -> pl.DataFrame | Path:
+        """Return frame, or the Arrow IPC file it was spilled to when ``spill_dir`` is set."""
+        if self._spill_dir is None:
+            return frame
+
+        key_dir = self._spill_dir / key
+        key_dir.mkdir(exist_ok=True)
+
+        path = key_dir / f"{game_id}.arrow"
+        frame.write_ipc(path, compression="uncompressed")
+
+        return path
+
     def _scrape_single_game(
         self,
         game_id: int,
         scrape_type: Literal[
             "api_events", "api_rosters", "changes", "html_events", "html_rosters", "play_by_play", "shifts", "rosters"
         ],
+        responses: dict | None = None,
     ) -> dict | None:
         """Fetch only the data required for scrape_type for a single game.
 
         Returns a dict with ``game_id`` and the relevant data keys, or ``None`` on
-        failure (the game ID is appended to ``self._bad_games`` by the caller).
+        failure (the game ID is appended to ``self._bad_games`` by the caller, and the
+        error is recorded in ``self._game_errors``). If ``responses`` from ``_download_game``
+        are given, the game is parsed from them instead of being downloaded again. Only
+        final games are written to the processed-game cache.
 
         Note:
             The ``"play_by_play"`` scrape type is a superset fetch: in addition to
@@ -222,55 +582,253 @@ class _ScraperCore(_ScraperBase):
             ``rosters``, ``shifts``, ``changes``), so a single ``play_by_play`` scrape
             populates every raw-data cache at once.
         """
+        if self._game_cache is not None:
+            cached = self._game_cache.load(game_id, _SCRAPE_KEYS[scrape_type])
+            if cached is not None:
+                return cached
+
+        session = self._requests_session if responses is None else PrefetchedSession(responses)
+        game = None
+
         try:
-            game = Game(game_id, self._requests_session)
+            game = Game(game_id, session, html_parser=self.html_parser, validation=self.validation)
+            result = _collect_game_data(game, scrape_type)
 
-            match scrape_type:
-                case "api_events":
-                    # api_events and api_rosters share the same HTTP call
-                    return {"game_id": game_id, "api_events": game.api_events, "api_rosters": game.api_rosters}
-                case "api_rosters":
-                    return {"game_id": game_id, "api_rosters": game.api_rosters}
-                case "html_events":
-                    return {"game_id": game_id, "html_events": game.html_events}
-                case "html_rosters":
-                    return {"game_id": game_id, "html_rosters": game.html_rosters}
-                case "rosters":
-                    return {"game_id": game_id, "rosters": game.rosters}
-                case "shifts":
-                    return {"game_id": game_id, "shifts": game.shifts, "changes": game.changes}
-                case "changes":
-                    return {"game_id": game_id, "changes": game.changes, "shifts": game.shifts}
-                case "play_by_play":
-                    return {
-                        "game_id": game_id,
-                        "play_by_play": game.play_by_play,
-                        "play_by_play_ext": game.play_by_play_ext,
-                        "xg_fields": game.xg_fields,
-                        "api_events": game.api_events,
-                        "api_rosters": game.api_rosters,
-                        "html_events": game.html_events,
-                        "html_rosters": game.html_rosters,
-                        "rosters": game.rosters,
-                        "shifts": game.shifts,
-                        "changes": game.changes,
-                    }
-
-        except Exception:  # noqa: BLE001
+        except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to scrape game %s", game_id, exc_info=True)
+            self._game_errors[game_id] = f"{type(exc).__name__}: {exc}"
             return None
 
+        finally:
+            if game is not None:
+                self._record_stage_metrics(game.stage_metrics, replayed=responses is not None)
+
+        if self._game_cache is not None and game.game_state in _FINAL_GAME_STATES:
+            result = _result_to_frames(result)
+            self._store_game_result(game_id, result)
+
+        return result
+
+    def _store_game_result(self, game_id: int, frames: dict) -> None:
+        """Persist a successfully scraped final game's frames to the processed-game cache."""
+        if self._game_cache is None:
+            return
+
+        self._game_cache.store(
+            game_id,
+            {
+                key: frame if frame is not None or key == "game_id" else pl.DataFrame(schema=_DATA_SCHEMAS[key])
+                for key, frame in frames.items()
+            },
+        )
+
+    def _download_game(self, game_id: int, scrape_type: str) -> dict | None:
+        """Download the raw responses scrape_type needs for a single game, without parsing them.
+
+        Returns a dict mapping each URL to ``(status_code, content)``, or to an error string if
+        that request failed, ready to be replayed by ``PrefetchedSession``. Returns ``None`` if
+        the game ID itself is invalid.
+        """
+        try:
+            game = Game(game_id, self._requests_session)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Failed to scrape game %s", game_id, exc_info=True)
+            self._game_errors[game_id] = f"{type(exc).__name__}: {exc}"
+            return None
+
+        responses: dict[str, tuple[int, bytes] | str] = {}
+        stage_metrics: list[dict] = []
+
+        for endpoint in _SCRAPE_ENDPOINTS[scrape_type]:
+            url = getattr(game, endpoint)
+            try:
+                with record_stage(stage_metrics, game.game_id, _FETCH_STAGES[endpoint]) as stage:
+                    response = self._requests_session.get(url)
+                    stage["bytes"] = len(response.content or b"")
+                responses[url] = (response.status_code, response.content)
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Failed to download %s", url, exc_info=True)
+                responses[url] = f"{type(exc).__name__}: {exc}"
+                continue
+
+            # Parsing happens off-process, so settle completed games in the response cache here
+            if endpoint == "api_endpoint" and self._requests_session.cache_dir is not None and response.ok:
+                try:
+                    settled = is_game_settled(response.json(), self._requests_session.cache_settle_days)
+                except ValueError:
+                    settled = False
+                if settled:
+                    self._requests_session.mark_settled(
+                        getattr(game, name) for name in _SCRAPE_ENDPOINTS["play_by_play"]
+                    )
+
+        self._record_stage_metrics(stage_metrics)
+
+        return responses
+
+    def _load_or_download_game(self, game_id: int, scrape_type: str) -> tuple[dict | None, dict | None]:
+        """Return ``(cached_frames, None)`` on a processed-game cache hit, else ``(None, responses)``."""
+        if self._game_cache is not None:
+            cached = self._game_cache.load(game_id, _SCRAPE_KEYS[scrape_type])
+            if cached is not None:
+                return cached, None
+
+        return None, self._download_game(game_id, scrape_type)
+
+    def _iter_pipelined_results(
+        self, game_ids: list, scrape_type: str, max_workers: int, parse_workers: int
+    ) -> Iterator[tuple[int, dict | None]]:
+        """Yield ``(game_id, frames)`` pairs from a two-stage download → parse pipeline, in input order.
+
+        The download stage runs on ``max_workers`` threads and keeps up to ``2 * max_workers``
+        games in flight; finished downloads are handed, in order, to a ``ProcessPoolExecutor``
+        of ``parse_workers`` processes holding up to ``2 * parse_workers`` games. Downloads of
+        later games therefore overlap with CPU-bound parsing of earlier ones on every core.
+        Games found in the processed-game cache skip the parse stage entirely; parsed games are
+        added to it once they are final.
+        """
+        downloads: deque[tuple[int, Future]] = deque()
+        parses: deque[tuple[int, Future | dict | None]] = deque()
+        game_id_iter = iter(game_ids)
+
+        def submit_download() -> None:
+            next_game_id = next(game_id_iter, None)
+            if next_game_id is not None:
+                downloads.append(
+                    (next_game_id, download_pool.submit(self._load_or_download_game, next_game_id, scrape_type))
+                )
+
+        with (
+            ThreadPoolExecutor(max_workers=max_workers) as download_pool,
+            ProcessPoolExecutor(
+                max_workers=parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=replay_corrections,
+                initargs=(loaded_corrections(),),
+            ) as parse_pool,
+        ):
+            try:
+                for _ in range(max_workers * 2):
+                    submit_download()
+
+                while downloads or parses:
+                    while downloads and len(parses) < parse_workers * 2:
+                        game_id, download = downloads.popleft()
+                        cached, responses = download.result()
+                        submit_download()
+
+                        if responses is None:
+                            parses.append((game_id, cached))
+                        else:
+                            parses.append(
+                                (
+                                    game_id,
+                                    parse_pool.submit(
+                                        _parse_prefetched_game,
+                                        game_id,
+                                        scrape_type,
+                                        responses,
+                                        self.html_parser,
+                                        self.validation,
+                                    ),
+                                )
+                            )
+
+                    game_id, parse = parses.popleft()
+
+                    if not isinstance(parse, Future):
+                        yield game_id, parse
+                        continue
+
+                    result, stage_metrics, final = parse.result()
+                    self._record_stage_metrics(stage_metrics, replayed=True)
+
+                    if result is not None and final:
+                        self._store_game_result(game_id, result)
+
+                    yield game_id, result
+
+            finally:
+                for _, future in (*downloads, *parses):
+                    if isinstance(future, Future):
+                        future.cancel()
+
+    def _iter_scrape_results(
+        self,
+        game_ids: list,
+        scrape_type: Literal[
+            "api_events", "api_rosters", "changes", "html_events", "html_rosters", "play_by_play", "shifts", "rosters"
+        ],
+        max_workers: int = 1,
+        parse_workers: int = 0,
+    ) -> Iterator[tuple[int, dict | None]]:
+        """Yield ``(game_id, result)`` pairs for game_ids, in input order.
+
+        With ``max_workers`` greater than 1, games are scraped on a thread pool with at most
+        ``2 * max_workers`` games in flight, so a long backfill never queues every game at once.
+        With ``parse_workers`` greater than 0, downloading and parsing are split across a thread
+        pool and a process pool (see ``_iter_pipelined_results``) and results hold Polars frames.
+        Results are yielded in the same order as ``game_ids`` regardless of completion order.
+        Pending games are cancelled if the consumer stops iterating early.
+        """
+        if parse_workers > 0:
+            yield from self._iter_pipelined_results(game_ids, scrape_type, max_workers, parse_workers)
+            return
+
+        if max_workers <= 1:
+            for game_id in game_ids:
+                yield game_id, self._scrape_single_game(game_id, scrape_type)
+            return
+
+        pending: deque[tuple[int, Future]] = deque()
+        game_id_iter = iter(game_ids)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for game_id in game_id_iter:
+                    pending.append((game_id, executor.submit(self._scrape_single_game, game_id, scrape_type)))
+                    if len(pending) >= max_workers * 2:
+                        break
+
+                while pending:
+                    game_id, future = pending.popleft()
+                    result = future.result()
+
+                    next_game_id = next(game_id_iter, None)
+                    if next_game_id is not None:
+                        pending.append(
+                            (next_game_id, executor.submit(self._scrape_single_game, next_game_id, scrape_type))
+                        )
+
+                    yield game_id, result
+
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
     def _scrape(
         self,
         scrape_type: Literal[
             "api_events", "api_rosters", "changes", "html_events", "html_rosters", "play_by_play", "shifts", "rosters"
         ],
+        max_workers: int | None = None,
+        parse_workers: int | None = None,
     ) -> None:
         """Scrape only the data needed for scrape_type for unscraped game IDs.
 
         Uses the type-specific _scraped_* list to determine which games still need
         fetching, so previously scraped games are not re-fetched.
 
+        Parameters:
+            scrape_type (str):
+                Data type to scrape, e.g., ``"play_by_play"``
+            max_workers (int | None):
+                Number of games scraped concurrently. Defaults to the ``max_workers`` value
+                set at instantiation.
+            parse_workers (int | None):
+                Number of processes parsing downloaded reports. Defaults to the ``parse_workers``
+                value set at instantiation.
+
         Examples:
             First, instantiate the Scraper object
             >>> game_ids = list(range(2023020001, 2023020011))
@@ -280,6 +838,9 @@ class _ScraperCore(_ScraperBase):
             >>> scraper._scrape("html_events")
             >>> scraper._html_events  # Returns data as a list
             >>> scraper.html_events  # Returns data as a DataFrame
+
+            Scrape eight games at a time
+            >>> scraper._scrape("play_by_play", max_workers=8)
         """
         pbar_stubs = {
             "api_events": "API events",
@@ -325,21 +886,26 @@ class _ScraperCore(_ScraperBase):
 
         prev_failed = set(self._bad_games)
 
+        max_workers = self.max_workers if max_workers is None else max_workers
+        parse_workers = self.parse_workers if parse_workers is None else parse_workers
+
         with self._requests_session:
             with ChickenProgress(disable=self.disable_progress_bar, transient=self.transient_progress_bar) as progress:
                 pbar_stub = pbar_stubs[scrape_type]
                 game_task = progress.add_task(f"Downloading {pbar_stub} for {unscraped[0]}...", total=len(unscraped))
 
-                for idx, game_id in enumerate(unscraped):
-                    result = self._scrape_single_game(game_id, scrape_type)
+                scrape_results = self._iter_scrape_results(
+                    unscraped, scrape_type, max_workers=max_workers, parse_workers=parse_workers
+                )
 
+                for idx, (game_id, result) in enumerate(scrape_results):
                     if result is not None:
-                        for key, value in result.items():
+                        for key, frame in _result_to_frames(result).items():
                             if key == "game_id":
                                 continue
                             data_list, scraped_list = result_targets[key]
-                            if value:
-                                data_list.append(pl.from_dicts(value, schema=_SCRAPE_SCHEMAS[key]))
+                            if frame is not None and key in self.retain:
+                                data_list.append(self._store_frame(key, game_id, frame))
                             scraped_list.add(game_id)
                     else:
                         self._bad_games.append(game_id)
@@ -360,15 +926,240 @@ class _ScraperCore(_ScraperBase):
                 stacklevel=2,
             )
 
+    def _iter_game_frames(
+        self,
+        kinds: Iterable[str],
+        max_workers: int | None = None,
+        parse_workers: int | None = None,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+    ) -> Iterator[tuple[int, dict[str, pl.DataFrame]]]:
+        """Yield ``(game_id, {kind: Polars frame})`` for each successfully scraped game, in order.
+
+        Backs ``iter_games`` and ``to_dataset``; empty data types are empty frames with their schema.
+        """
+        kinds = tuple(dict.fromkeys([kinds] if isinstance(kinds, str) else kinds))
+        scrape_type = _scrape_type_for(kinds)
+
+        max_workers = self.max_workers if max_workers is None else max_workers
+        parse_workers = self.parse_workers if parse_workers is None else parse_workers
+
+        prev_failed = set(self._bad_games)
+
+        with self._requests_session:
+            with ChickenProgress(
+                disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
+                transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
+            ) as progress:
+                game_task = progress.add_task("Scraping games...", total=len(self.game_ids))
+
+                scrape_results = self._iter_scrape_results(
+                    self.game_ids, scrape_type, max_workers=max_workers, parse_workers=parse_workers
+                )
+
+                for game_id, result in scrape_results:
+                    progress.update(game_task, description=f"Scraped {game_id}", advance=1, refresh=True)
+
+                    if result is None:
+                        self._bad_games.append(game_id)
+                        continue
+
+                    frames = _result_to_frames(result)
+
+                    yield (
+                        game_id,
+                        {
+                            kind: frames[kind] if frames[kind] is not None else pl.DataFrame(schema=_DATA_SCHEMAS[kind])
+                            for kind in kinds
+                        },
+                    )
+
+        newly_failed = [g for g in self._bad_games if g not in prev_failed]
+        if newly_failed:
+            warnings.warn(
+                f"Failed to scrape {len(newly_failed)} game(s): {newly_failed}. "
+                "Access scraper.failed_games for the full list.",
+                UserWarning,
+                stacklevel=3,
+            )
+
+    def iter_games(
+        self,
+        kinds: Iterable[str] = ("play_by_play",),
+        max_workers: int | None = None,
+        parse_workers: int | None = None,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+    ) -> Iterator[tuple[int, dict]]:
+        """Yield each game's data as soon as it is scraped, without storing it on the Scraper.
+
+        Games are scraped with the same worker settings as the cached properties and yielded in
+        ``game_ids`` order, so each game can be written to storage while later games are still
+        downloading. Memory use stays constant however many games are scraped. Games that fail
+        are skipped and recorded in ``failed_games``.
+
+        Parameters:
+            kinds (Iterable[str]):
+                Data types to return for each game, e.g., ``("play_by_play", "shifts")``. Only the
+                reports needed for these data types are downloaded. Default ``("play_by_play",)``.
+            max_workers (int | None):
+                Number of games scraped concurrently. Defaults to the ``max_workers`` value
+                set at instantiation.
+            parse_workers (int | None):
+                Number of processes parsing downloaded reports. Defaults to the ``parse_workers``
+                value set at instantiation.
+            disable_progress_bar (bool | None):
+                Suppress the progress bar. Defaults to the value set at instantiation.
+            transient_progress_bar (bool | None):
+                Clear the progress bar when finished. Defaults to the value set at instantiation.
+
+        Yields:
+            tuple[int, dict]:
+                The game ID and a dict mapping each data type in ``kinds`` to a DataFrame in the
+                configured backend. Data types with no rows for the game are empty DataFrames.
+
+        Raises:
+            InvalidInputError: If ``kinds`` is empty or names an unknown data type.
+
+        Examples:
+            Write each game's play-by-play data to its own file
+            >>> scraper = Scraper(game_ids, max_workers=8)
+            >>> for game_id, frames in scraper.iter_games():
+            ...     frames["play_by_play"].write_parquet(f"{game_id}.parquet")
+
+            Stream play-by-play and shifts together
+            >>> for game_id, frames in scraper.iter_games(kinds=("play_by_play", "shifts")):
+            ...     pbp, shifts = frames["play_by_play"], frames["shifts"]
+        """
+        for game_id, frames in self._iter_game_frames(
+            kinds, max_workers, parse_workers, disable_progress_bar, transient_progress_bar
+        ):
+            yield game_id, {kind: _to_backend(frame, self._backend) for kind, frame in frames.items()}
+
+    async def aiter_games(
+        self,
+        kinds: Iterable[str] = ("play_by_play",),
+        max_workers: int | None = None,
+        parse_workers: int | None = None,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+    ) -> AsyncIterator[tuple[int, dict]]:
+        """Async version of ``iter_games``, for use in an event loop.
+
+        Scraping runs in a worker thread, so the event loop stays free while each game downloads
+        and parses. Accepts the same parameters and yields the same ``(game_id, frames)`` pairs
+        as ``iter_games``.
+
+        Examples:
+            Insert each game into a database as it arrives
+            >>> async for game_id, frames in scraper.aiter_games(kinds=("play_by_play",)):
+            ...     await insert_pbp(frames["play_by_play"])
+        """
+        games = self.iter_games(
+            kinds,
+            max_workers=max_workers,
+            parse_workers=parse_workers,
+            disable_progress_bar=disable_progress_bar,
+            transient_progress_bar=transient_progress_bar,
+        )
+        done = object()
+
+        try:
+            while (game := await asyncio.to_thread(next, games, done)) is not done:
+                yield game
+        finally:
+            await asyncio.to_thread(games.close)
+
+    def to_dataset(
+        self,
+        path: str | Path,
+        kinds: Iterable[str] = ("play_by_play",),
+        max_workers: int | None = None,
+        parse_workers: int | None = None,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+    ) -> Path:
+        """Write scraped data to a Parquet dataset partitioned by season, session, and game ID.
+
+        Data types already scraped for every game are written from memory. The rest are scraped
+        and written one game at a time, without being stored on the Scraper, so memory use stays
+        constant however many games are written. Read the data back with ``load_dataset``.
+
+        Parameters:
+            path (str | Path):
+                Root directory of the dataset. Each data type is written to its own subdirectory,
+                with one file per game; rewriting a game replaces its file.
+            kinds (Iterable[str]):
+                Data types to write, e.g., ``("play_by_play", "shifts")``. Default ``("play_by_play",)``.
+            max_workers (int | None):
+                Number of games scraped concurrently. Defaults to the ``max_workers`` value
+                set at instantiation.
+            parse_workers (int | None):
+                Number of processes parsing downloaded reports. Defaults to the ``parse_workers``
+                value set at instantiation.
+            disable_progress_bar (bool | None):
+                Suppress the progress bar. Defaults to the value set at instantiation.
+            transient_progress_bar (bool | None):
+                Clear the progress bar when finished. Defaults to the value set at instantiation.
+
+        Returns:
+            Path:
+                Root directory of the dataset
+
+        Raises:
+            InvalidInputError: If ``kinds`` is empty or names an unknown data type.
+
+        Examples:
+            Write a season's play-by-play data and shifts
+            >>> scraper = Scraper(game_ids, max_workers=8)
+            >>> scraper.to_dataset("./nhl_data", kinds=("play_by_play", "shifts"))
+
+            Then load one team's 5v5 events, reading only that season's files
+            >>> from chickenstats.chicken_nhl import load_dataset
+            >>> pbp = (
+            ...     load_dataset("./nhl_data")
+            ...     .filter(pl.col("season") == 20232024, pl.col("event_team") == "NSH")
+            ...     .filter(pl.col("strength_state") == "5v5")
+            ...     .collect()
+            ... )
+        """
+        kinds = tuple(dict.fromkeys([kinds] if isinstance(kinds, str) else kinds))
+        _scrape_type_for(kinds)
+
+        path = Path(path)
+
+        # play_by_play_ext and xg_fields are produced by, and tracked with, the play-by-play scrape
+        scraped = {
+            kind: getattr(self, f"_scraped_{'play_by_play' if kind in ('play_by_play_ext', 'xg_fields') else kind}")
+            for kind in kinds
+        }
+        expected = {game_id for game_id in self.game_ids if game_id not in self._bad_games}
+        stored = [kind for kind in kinds if kind in self.retain and scraped[kind].issuperset(expected)]
+
+        for kind in stored:
+            for data in self._retained_data(kind):
+                write_dataset(data if isinstance(data, pl.DataFrame) else pl.read_ipc(data), path, kind)
+
+        remaining = [kind for kind in kinds if kind not in stored]
+
+        if remaining:
+            for _, frames in self._iter_game_frames(
+                remaining, max_workers, parse_workers, disable_progress_bar, transient_progress_bar
+            ):
+                for kind, frame in frames.items():
+                    write_dataset(frame, path, kind)
+
+        return path
+
     def _finalize_dataframe(
-        self, data: list[pl.DataFrame], schema
+        self, data: list[pl.DataFrame | Path], schema
     ) -> pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame:
         """Concatenate raw data frames and return in the configured backend format.
 
         Parameters:
-            data (list[pl.DataFrame]):
-                Frames collected across all scraped games for one data type.
-                Empty list returns an empty frame with the given schema.
+            data (list[pl.DataFrame | Path]):
+                Frames collected across all scraped games for one data type, or the Arrow IPC
+                files they were spilled to. Empty list returns an empty frame with the given schema.
             schema:
                 Polars schema used to initialise an empty DataFrame when ``data`` is
                 empty, ensuring callers always receive a consistently-typed result.
@@ -379,12 +1170,16 @@ class _ScraperCore(_ScraperBase):
                 Scraper instantiation (``"polars"``, ``"pandas"``, ``"pyarrow"``,
                 or ``"narwhals"``).
         """
-        df = pl.concat(data) if data else pl.DataFrame(schema=schema)
+        df = _concat_frames(data, schema)
         return _to_backend(df, self._backend)
 
     def add_games(self, game_ids: list[int | str | float] | int) -> None:
         """Method to add games to the Scraper.
 
+        Prepared stats, lines, and team stats are kept. The next ``prep_stats``, ``prep_lines``, or
+        ``prep_team_stats`` call, or access to ``stats``, ``lines``, or ``team_stats``, aggregates only
+        the new games and adds them to the existing results.
+
         Parameters:
             game_ids (list or int or float or str):
                 List-like object of or single 10-digit game identifier, e.g., 2023020001
@@ -403,6 +1198,11 @@ class _ScraperCore(_ScraperBase):
             Scrape some more
             >>> scraper.play_by_play
 
+            Stats prepared before adding games are updated with just the new ones
+            >>> scraper.prep_stats(level="season")
+            >>> scraper.add_games(2023020012)
+            >>> scraper.stats
+
 
         """
         existing = set(self.game_ids)  # Not covered by tests
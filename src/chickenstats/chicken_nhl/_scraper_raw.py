@@ -23,7 +23,6 @@ from chickenstats.chicken_nhl._docstrings import (
     shared_doc,
 )
 from chickenstats.chicken_nhl._scraper_core import _ScraperBase
-from chickenstats.utilities.utilities import _to_backend
 from chickenstats.chicken_nhl.validation_polars import (
     api_events_polars_schema,
     api_rosters_polars_schema,
@@ -149,9 +148,10 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.api_events
 
         """
+        self._check_retained("api_events")
         self._scrape("api_events")
 
-        df = self._finalize_dataframe(data=self._api_events, schema=api_events_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("api_events"), schema=api_events_polars_schema)
 
         return df
 
@@ -197,9 +197,10 @@ class _ScraperRawMixin(_ScraperBase):
             Then you can access the property as a Pandas DataFrame
             >>> scraper.api_rosters
         """
+        self._check_retained("api_rosters")
         self._scrape("api_rosters")
 
-        df = self._finalize_dataframe(data=self._api_rosters, schema=api_rosters_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("api_rosters"), schema=api_rosters_polars_schema)
 
         return df
 
@@ -320,9 +321,10 @@ class _ScraperRawMixin(_ScraperBase):
         """
         # TODO: Add API ID columns to documentation
 
+        self._check_retained("changes")
         self._scrape("changes")
 
-        df = self._finalize_dataframe(data=self._changes, schema=changes_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("changes"), schema=changes_polars_schema)
 
         return df
 
@@ -398,9 +400,10 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.html_events
 
         """
+        self._check_retained("html_events")
         self._scrape("html_events")
 
-        df = self._finalize_dataframe(data=self._html_events, schema=html_events_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("html_events"), schema=html_events_polars_schema)
 
         return df
 
@@ -446,9 +449,10 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.html_rosters
 
         """
+        self._check_retained("html_rosters")
         self._scrape("html_rosters")
 
-        df = self._finalize_dataframe(data=self._html_rosters, schema=html_rosters_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("html_rosters"), schema=html_rosters_polars_schema)
 
         return df
 
@@ -458,12 +462,11 @@ class _ScraperRawMixin(_ScraperBase):
         """play_by_play — docstring lives in _docstrings._SCRAPER_PLAY_BY_PLAY_DOC."""
         # TODO: Add change on / change off API ID columns to documentation
 
+        self._check_retained("play_by_play")
         if set(self.game_ids) != self._scraped_play_by_play:
             self._scrape("play_by_play")
 
-        raw = pl.concat(self._play_by_play) if self._play_by_play else pl.DataFrame(schema=pbp_polars_schema)
-
-        return _to_backend(raw, self._backend)
+        return self._finalize_dataframe(data=self._retained_data("play_by_play"), schema=pbp_polars_schema)
 
     @cached_property
     @shared_doc(_SCRAPER_PLAY_BY_PLAY_EXT_DOC)
@@ -831,10 +834,11 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.play_by_play_ext
 
         """
+        self._check_retained("play_by_play_ext")
         if set(self.game_ids) != self._scraped_play_by_play:
             self._scrape("play_by_play")
 
-        df = self._finalize_dataframe(data=self._play_by_play_ext, schema=pbp_ext_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("play_by_play_ext"), schema=pbp_ext_polars_schema)
 
         return df
 
@@ -850,10 +854,11 @@ class _ScraperRawMixin(_ScraperBase):
             scraper = Scraper(game_ids)
             xg = scraper.xg_fields  # one row per fenwick event
         """
+        self._check_retained("xg_fields")
         if set(self.game_ids) != self._scraped_play_by_play:
             self._scrape("play_by_play")
 
-        return self._finalize_dataframe(data=self._xg_fields, schema=xg_polars_schema)
+        return self._finalize_dataframe(data=self._retained_data("xg_fields"), schema=xg_polars_schema)
 
     @cached_property
     @shared_doc(_SCRAPER_ROSTERS_DOC)
@@ -901,9 +906,10 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.rosters
 
         """
+        self._check_retained("rosters")
         self._scrape("rosters")
 
-        df = self._finalize_dataframe(data=self._rosters, schema=rosters_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("rosters"), schema=rosters_polars_schema)
 
         return df
 
@@ -971,8 +977,9 @@ class _ScraperRawMixin(_ScraperBase):
             >>> scraper.shifts
 
         """
+        self._check_retained("shifts")
         self._scrape("shifts")
 
-        df = self._finalize_dataframe(data=self._shifts, schema=shifts_polars_schema)
+        df = self._finalize_dataframe(data=self._retained_data("shifts"), schema=shifts_polars_schema)
 
         return df
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
@@ -11,7 +10,27 @@ if TYPE_CHECKING:
 import polars as pl
 import narwhals as nw
 
-from chickenstats.chicken_nhl._aggregation import prep_ind, prep_oi, _merge_stats, prep_lines, prep_team_stats
+from chickenstats.chicken_nhl._aggregation import (
+    prep_ind,
+    prep_oi,
+    _merge_stats,
+    _prep_stats_plans,
+    _prep_lines_plan,
+    _prep_team_stats_plan,
+    _join_play_by_play_ext,
+    _collect_engine,
+    _collect_rated,
+    _update_stats,
+    _update_rated,
+    _sorted_levels,
+    _LEVEL_ORDER,
+    _RESUMMED_LEVELS,
+    _TEAM_DERIVED_TOTALS,
+    prep_stats_levels,
+    prep_lines_levels,
+    prep_team_stats_levels,
+    roll_up_stats,
+)
 from chickenstats.chicken_nhl._docstrings import (
     shared_doc,
     _IND_STATS_DOC,
@@ -22,12 +41,28 @@ from chickenstats.chicken_nhl._docstrings import (
     _LINES_DOC,
     _PREP_TEAM_STATS_DOC,
     _TEAM_STATS_DOC,
+    _STATS_BY_LEVEL_DOC,
+    _LINES_BY_LEVEL_DOC,
+    _TEAM_STATS_BY_LEVEL_DOC,
+)
+from chickenstats.chicken_nhl._validation_utils import validate_dataframe
+from chickenstats.chicken_nhl.validation_polars import (
+    ind_stats_pandera_polars,
+    oi_stats_pandera_polars,
+    stats_pandera_polars,
+    line_stats_pandera_polars,
+    team_stats_pandera_polars,
 )
 from chickenstats.chicken_nhl._scraper_core import _ScraperBase
 from chickenstats.utilities.enums import AggLevel
 from chickenstats.utilities.utilities import ChickenProgressIndeterminate, _to_polars, _to_backend
 
 
+def _level_value(level: AggLevel | str) -> str:
+    """Return the plain string for level, so ``AggLevel`` members and strings share stats cache keys."""
+    return level.value if isinstance(level, AggLevel) else level
+
+
 class _ScraperStatsMixin(_ScraperBase):
     def _prep_ind(
         self,
@@ -37,6 +72,7 @@ class _ScraperStatsMixin(_ScraperBase):
         teammates: bool = False,
         opposition: bool = False,
         df: pl.DataFrame | None = None,
+        streaming: bool = False,
     ) -> None:
         """Compute and cache individual stats from play-by-play data.
 
@@ -50,6 +86,7 @@ class _ScraperStatsMixin(_ScraperBase):
             teammates: Whether to split by teammate lineup. Default ``False``
             opposition: Whether to split by opposing lineup. Default ``False``
             df: Pre-fetched play-by-play DataFrame; scrapes if ``None``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
         """
         ind_stats = prep_ind(
             df if df is not None else _to_polars(self.play_by_play),
@@ -58,6 +95,7 @@ class _ScraperStatsMixin(_ScraperBase):
             score=score,
             teammates=teammates,
             opposition=opposition,
+            streaming=streaming,
         )
 
         self._ind_stats = ind_stats
@@ -80,6 +118,7 @@ class _ScraperStatsMixin(_ScraperBase):
         opposition: bool = False,
         df: pl.DataFrame | None = None,
         df_ext: pl.DataFrame | None = None,
+        streaming: bool = False,
     ) -> None:
         """Compute and cache on-ice stats from play-by-play data.
 
@@ -94,6 +133,7 @@ class _ScraperStatsMixin(_ScraperBase):
             opposition: Whether to split by opposing lineup. Default ``False``
             df: Pre-fetched play-by-play DataFrame; scrapes if ``None``
             df_ext: Pre-fetched extended play-by-play DataFrame; scrapes if ``None``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
         """
         oi_stats = prep_oi(
             df=df if df is not None else _to_polars(self.play_by_play),
@@ -103,6 +143,7 @@ class _ScraperStatsMixin(_ScraperBase):
             score=score,
             teammates=teammates,
             opposition=opposition,
+            streaming=streaming,
         )
 
         self._oi_stats = oi_stats
@@ -123,11 +164,14 @@ class _ScraperStatsMixin(_ScraperBase):
         score: bool = False,
         teammates: bool = False,
         opposition: bool = False,
+        streaming: bool = False,
     ) -> None:
         """Compute and cache individual + on-ice stats from play-by-play data.
 
-        Internal method called by ``prep_stats``. Runs ``_prep_ind`` and ``_prep_oi``
-        concurrently via ``ThreadPoolExecutor``. See ``stats`` for full field descriptions.
+        Internal method called by ``prep_stats``. When neither ``ind_stats`` nor ``oi_stats``
+        is cached, the individual, on-ice, and merged stats are built as lazy plans over one
+        shared play-by-play join and collected together with ``pl.collect_all``. Otherwise only
+        the missing frame is computed before merging. See ``stats`` for full field descriptions.
 
         Parameters:
             level: Aggregation level — one of ``'period'``, ``'game'``, ``'session'``, ``'season'``
@@ -135,21 +179,31 @@ class _ScraperStatsMixin(_ScraperBase):
             score: Whether to split by score state. Default ``False``
             teammates: Whether to split by teammate lineup. Default ``False``
             opposition: Whether to split by opposing lineup. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
         """
         ind_empty = self._is_empty(self._ind_stats)
         oi_empty = self._is_empty(self._oi_stats)
 
         if ind_empty and oi_empty:
-            pbp = _to_polars(self.play_by_play)
-            pbp_ext = _to_polars(self.play_by_play_ext)
-            with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = [
-                    executor.submit(self._prep_ind, level, strength_state, score, teammates, opposition, pbp),
-                    executor.submit(self._prep_oi, level, strength_state, score, teammates, opposition, pbp, pbp_ext),
-                ]
-                for future in as_completed(futures):
-                    future.result()
-        elif ind_empty:
+            plans = _prep_stats_plans(
+                _to_polars(self.play_by_play),
+                df_ext=_to_polars(self.play_by_play_ext),
+                level=level,
+                strength_state=strength_state,
+                score=score,
+                teammates=teammates,
+                opposition=opposition,
+            )
+
+            ind_stats, oi_stats, stats = pl.collect_all(plans, engine=_collect_engine(streaming))
+
+            self._ind_stats = validate_dataframe(ind_stats, ind_stats_pandera_polars)
+            self._oi_stats = validate_dataframe(oi_stats, oi_stats_pandera_polars)
+            self._stats = validate_dataframe(stats, stats_pandera_polars)
+
+            return
+
+        if ind_empty:
             pbp = _to_polars(self.play_by_play)
             self._prep_ind(
                 level=level,
@@ -158,6 +212,7 @@ class _ScraperStatsMixin(_ScraperBase):
                 teammates=teammates,
                 opposition=opposition,
                 df=pbp,
+                streaming=streaming,
             )
         elif oi_empty:
             pbp = _to_polars(self.play_by_play)
@@ -170,6 +225,7 @@ class _ScraperStatsMixin(_ScraperBase):
                 opposition=opposition,
                 df=pbp,
                 df_ext=pbp_ext,
+                streaming=streaming,
             )
 
         stats = _merge_stats(ind_stats_df=self._ind_stats, oi_stats_df=self._oi_stats)
@@ -186,8 +242,10 @@ class _ScraperStatsMixin(_ScraperBase):
         opposition: bool = False,
         disable_progress_bar: bool | None = None,
         transient_progress_bar: bool | None = None,
+        streaming: bool = False,
     ) -> Self:
         """prep_stats — docstring lives in _docstrings._PREP_STATS_DOC."""
+        cache_key = ("stats", _level_value(level), strength_state, score, teammates, opposition)
         levels = self._stats_levels
 
         if (
@@ -203,10 +261,18 @@ class _ScraperStatsMixin(_ScraperBase):
             self._stats_levels.score = score
             self._stats_levels.teammates = teammates
             self._stats_levels.opposition = opposition
+            self._stats_levels.game_ids = frozenset()
+
+            cached = self._stats_cache.get(cache_key)
+
+            if cached is not None:
+                self._ind_stats, self._oi_stats, self._stats = cached.frames
+                self._stats_levels.game_ids = cached.game_ids
 
         empty_stats = self._is_empty(self._stats)
+        new_games = self._stats_game_ids() - self._stats_levels.game_ids
 
-        if empty_stats:
+        if empty_stats or new_games:
             with ChickenProgressIndeterminate(
                 disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
                 transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
@@ -217,8 +283,30 @@ class _ScraperStatsMixin(_ScraperBase):
                 progress.start_task(progress_task)
                 progress.update(progress_task, total=1, description=pbar_message, refresh=True)
 
-                self._prep_stats(
-                    level=level, strength_state=strength_state, score=score, teammates=teammates, opposition=opposition
+                if empty_stats:
+                    self._prep_stats(
+                        level=level,
+                        strength_state=strength_state,
+                        score=score,
+                        teammates=teammates,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                else:
+                    self._add_stats_games(
+                        new_games,
+                        level=level,
+                        strength_state=strength_state,
+                        score=score,
+                        teammates=teammates,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                self._stats_levels.game_ids = self._stats_game_ids()
+                self._stats_cache.put(
+                    cache_key, (self._ind_stats, self._oi_stats, self._stats), self._stats_levels.game_ids
                 )
 
                 progress.update(
@@ -238,6 +326,16 @@ class _ScraperStatsMixin(_ScraperBase):
         if self._is_empty(self._stats):
             self.prep_stats()
 
+        elif self._stats_game_ids() - self._stats_levels.game_ids:
+            levels = self._stats_levels
+            self.prep_stats(
+                level=levels.level,
+                strength_state=levels.strength_state,
+                score=levels.score,
+                teammates=levels.teammates,
+                opposition=levels.opposition,
+            )
+
         return _to_backend(self._stats, self._backend)
 
     def _clear_stats(self):
@@ -246,6 +344,91 @@ class _ScraperStatsMixin(_ScraperBase):
         self._oi_stats = pl.DataFrame()
         self._ind_stats = pl.DataFrame()
 
+    def _stats_game_ids(self) -> frozenset[int]:
+        """Return the games aggregated stats should cover: every tracked game that has not failed to scrape."""
+        return frozenset(game_id for game_id in self.game_ids if game_id not in self._bad_games)
+
+    def _games_play_by_play(self, game_ids: frozenset[int]) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """Return the play-by-play of game_ids, scraping any new games first, and the extended play-by-play."""
+        pbp = _to_polars(self.play_by_play)
+
+        return pbp.filter(pl.col("game_id").is_in(list(game_ids))), _to_polars(self.play_by_play_ext)
+
+    def _add_stats_games(
+        self,
+        game_ids: frozenset[int],
+        level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+        strength_state: bool = True,
+        score: bool = False,
+        teammates: bool = False,
+        opposition: bool = False,
+        streaming: bool = False,
+    ) -> None:
+        """Aggregate only the play-by-play of game_ids and add it to the cached stats.
+
+        Internal method called by ``prep_stats`` for games added with ``add_games``. Totals for
+        the new games are summed into ``ind_stats`` and ``oi_stats``, and only the ``stats`` rows
+        they touch are merged again. See ``_update_stats``.
+
+        Parameters:
+            game_ids: Games added since the cached stats were prepared
+            level: Aggregation level — one of ``'period'``, ``'game'``, ``'session'``, ``'season'``
+            strength_state: Whether to split by strength state. Default ``True``
+            score: Whether to split by score state. Default ``False``
+            teammates: Whether to split by teammate lineup. Default ``False``
+            opposition: Whether to split by opposing lineup. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
+        """
+        pbp, pbp_ext = self._games_play_by_play(game_ids)
+
+        if pbp.is_empty():
+            return
+
+        self._ind_stats, self._oi_stats, self._stats = _update_stats(
+            self._ind_stats,
+            self._oi_stats,
+            self._stats,
+            pbp,
+            df_ext=pbp_ext,
+            level=level,
+            strength_state=strength_state,
+            score=score,
+            teammates=teammates,
+            opposition=opposition,
+            streaming=streaming,
+        )
+
+    def _cached_player_stats(
+        self,
+        level: str,
+        strength_state: bool,
+        score: bool,
+        teammates: bool,
+        opposition: bool,
+    ) -> tuple[pl.DataFrame, pl.DataFrame] | None:
+        """Return cached individual and on-ice stats with the same splits and games at level or a finer one, if any."""
+        cached = self._stats_levels
+        game_ids = self._stats_game_ids()
+
+        if (
+            not self._is_empty(self._ind_stats)
+            and not self._is_empty(self._oi_stats)
+            and cached.level in _LEVEL_ORDER
+            and _LEVEL_ORDER.index(cached.level) <= _LEVEL_ORDER.index(level)
+            and (cached.strength_state, cached.score, cached.teammates, cached.opposition)
+            == (strength_state, score, teammates, opposition)
+            and cached.game_ids == game_ids
+        ):
+            return self._ind_stats, self._oi_stats
+
+        for finer_level in _LEVEL_ORDER[: _LEVEL_ORDER.index(level) + 1]:
+            entry = self._stats_cache.get(("stats", finer_level, strength_state, score, teammates, opposition))
+
+            if entry is not None and entry.game_ids == game_ids:
+                return entry.frames[0], entry.frames[1]
+
+        return None
+
     def _prep_lines(
         self,
         position: Literal["f", "d"] = "f",
@@ -254,6 +437,7 @@ class _ScraperStatsMixin(_ScraperBase):
         score: bool = False,
         teammates: bool = False,
         opposition: bool = False,
+        streaming: bool = False,
     ) -> None:
         """Compute and cache line-level stats from play-by-play data.
 
@@ -267,21 +451,75 @@ class _ScraperStatsMixin(_ScraperBase):
             score: Whether to split by score state. Default ``False``
             teammates: Whether to split by teammate lineup. Default ``False``
             opposition: Whether to split by opposing lineup. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
         """
         pbp = _to_polars(self.play_by_play)
         pbp_ext = _to_polars(self.play_by_play_ext)
-        lines = prep_lines(
-            df=pbp,
-            df_ext=pbp_ext,
+        totals = _prep_lines_plan(
+            _join_play_by_play_ext(pbp, pbp_ext),
             position=position,
             level=level,
             strength_state=strength_state,
             score=score,
             teammates=teammates,
             opposition=opposition,
+            rates=False,
+        )
+
+        # Session and season totals are kept so games added later can be summed into them
+        self._lines, self._lines_totals = _collect_rated(
+            totals, line_stats_pandera_polars, keep_totals=level in _RESUMMED_LEVELS, streaming=streaming
         )
 
-        self._lines = lines
+    def _add_lines_games(
+        self,
+        game_ids: frozenset[int],
+        position: Literal["f", "d"] = "f",
+        level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+        strength_state: bool = True,
+        score: bool = False,
+        teammates: bool = False,
+        opposition: bool = False,
+        streaming: bool = False,
+    ) -> None:
+        """Aggregate only the play-by-play of game_ids and add it to the cached line stats.
+
+        Internal method called by ``prep_lines`` for games added with ``add_games``. See ``_update_rated``.
+
+        Parameters:
+            game_ids: Games added since the cached line stats were prepared
+            position: Position group — ``'f'`` for forwards, ``'d'`` for defense. Default ``'f'``
+            level: Aggregation level — one of ``'period'``, ``'game'``, ``'session'``, ``'season'``
+            strength_state: Whether to split by strength state. Default ``True``
+            score: Whether to split by score state. Default ``False``
+            teammates: Whether to split by teammate lineup. Default ``False``
+            opposition: Whether to split by opposing lineup. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
+        """
+        pbp, pbp_ext = self._games_play_by_play(game_ids)
+
+        if pbp.is_empty():
+            return
+
+        new_totals = _prep_lines_plan(
+            _join_play_by_play_ext(pbp, pbp_ext),
+            position=position,
+            level=level,
+            strength_state=strength_state,
+            score=score,
+            teammates=teammates,
+            opposition=opposition,
+            rates=False,
+        ).collect(engine=_collect_engine(streaming))
+
+        self._lines, self._lines_totals = _update_rated(
+            self._lines,
+            self._lines_totals,
+            new_totals,
+            level=level,
+            schema=line_stats_pandera_polars,
+            streaming=streaming,
+        )
 
     @shared_doc(_PREP_LINES_DOC)
     def prep_lines(
@@ -294,8 +532,10 @@ class _ScraperStatsMixin(_ScraperBase):
         opposition: bool = False,
         disable_progress_bar: bool | None = None,
         transient_progress_bar: bool | None = None,
+        streaming: bool = False,
     ) -> Self:
         """prep_lines — docstring lives in _docstrings._PREP_LINES_DOC."""
+        cache_key = ("lines", position, _level_value(level), strength_state, score, teammates, opposition)
         levels = self._lines_levels
 
         if (
@@ -307,16 +547,25 @@ class _ScraperStatsMixin(_ScraperBase):
             or levels.opposition != opposition
         ):
             self._lines = pl.DataFrame()
+            self._lines_totals = pl.DataFrame()
             self._lines_levels.position = position
             self._lines_levels.level = level
             self._lines_levels.strength_state = strength_state
             self._lines_levels.score = score
             self._lines_levels.teammates = teammates
             self._lines_levels.opposition = opposition
+            self._lines_levels.game_ids = frozenset()
+
+            cached = self._stats_cache.get(cache_key)
+
+            if cached is not None:
+                self._lines, self._lines_totals = cached.frames
+                self._lines_levels.game_ids = cached.game_ids
 
         empty_lines = self._is_empty(self._lines)
+        new_games = self._stats_game_ids() - self._lines_levels.game_ids
 
-        if empty_lines:
+        if empty_lines or new_games:
             with ChickenProgressIndeterminate(
                 disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
                 transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
@@ -327,14 +576,31 @@ class _ScraperStatsMixin(_ScraperBase):
                 progress.start_task(progress_task)
                 progress.update(progress_task, total=1, description=pbar_message, refresh=True)
 
-                self._prep_lines(
-                    level=level,
-                    position=position,
-                    strength_state=strength_state,
-                    score=score,
-                    teammates=teammates,
-                    opposition=opposition,
-                )
+                if empty_lines:
+                    self._prep_lines(
+                        level=level,
+                        position=position,
+                        strength_state=strength_state,
+                        score=score,
+                        teammates=teammates,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                else:
+                    self._add_lines_games(
+                        new_games,
+                        level=level,
+                        position=position,
+                        strength_state=strength_state,
+                        score=score,
+                        teammates=teammates,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                self._lines_levels.game_ids = self._stats_game_ids()
+                self._stats_cache.put(cache_key, (self._lines, self._lines_totals), self._lines_levels.game_ids)
 
                 progress.update(
                     progress_task,
@@ -353,6 +619,17 @@ class _ScraperStatsMixin(_ScraperBase):
         if self._is_empty(self._lines):
             self.prep_lines()
 
+        elif self._stats_game_ids() - self._lines_levels.game_ids:
+            levels = self._lines_levels
+            self.prep_lines(
+                position=levels.position,
+                level=levels.level,
+                strength_state=levels.strength_state,
+                score=levels.score,
+                teammates=levels.teammates,
+                opposition=levels.opposition,
+            )
+
         return _to_backend(self._lines, self._backend)
 
     def _prep_team_stats(
@@ -361,6 +638,7 @@ class _ScraperStatsMixin(_ScraperBase):
         strength_state: bool = True,
         opposition: bool = False,
         score: bool = False,
+        streaming: bool = False,
     ) -> None:
         """Compute and cache team-level stats from play-by-play data.
 
@@ -372,14 +650,80 @@ class _ScraperStatsMixin(_ScraperBase):
             strength_state: Whether to split by strength state. Default ``True``
             opposition: Whether to split by opposing lineup. Default ``False``
             score: Whether to split by score state. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
         """
         pbp = _to_polars(self.play_by_play)
         pbp_ext = _to_polars(self.play_by_play_ext)
-        team_stats = prep_team_stats(
-            df=pbp, df_ext=pbp_ext, level=level, strength_state=strength_state, opposition=opposition, score=score
+        totals = _prep_team_stats_plan(
+            _join_play_by_play_ext(pbp, pbp_ext),
+            level=level,
+            strength_state=strength_state,
+            opposition=opposition,
+            score=score,
+            rates=False,
         )
 
-        self._team_stats = team_stats
+        # Session and season totals are kept so games added later can be summed into them. With opposition,
+        # those levels keep game-level "for" rows and are aggregated again instead (see _add_team_stats_games)
+        self._team_stats, self._team_stats_totals = _collect_rated(
+            totals,
+            team_stats_pandera_polars,
+            keep_totals=level in _RESUMMED_LEVELS and not opposition,
+            streaming=streaming,
+        )
+
+    def _add_team_stats_games(
+        self,
+        game_ids: frozenset[int],
+        level: AggLevel | Literal["period", "game", "session", "season"] = "game",
+        strength_state: bool = True,
+        opposition: bool = False,
+        score: bool = False,
+        streaming: bool = False,
+    ) -> None:
+        """Aggregate only the play-by-play of game_ids and add it to the cached team stats.
+
+        Internal method called by ``prep_team_stats`` for games added with ``add_games``. See
+        ``_update_rated``. Session and season team stats split by opposition cannot be summed
+        again, so they are aggregated from every game instead.
+
+        Parameters:
+            game_ids: Games added since the cached team stats were prepared
+            level: Aggregation level — one of ``'period'``, ``'game'``, ``'session'``, ``'season'``
+            strength_state: Whether to split by strength state. Default ``True``
+            opposition: Whether to split by opposing lineup. Default ``False``
+            score: Whether to split by score state. Default ``False``
+            streaming: Whether to collect with Polars' streaming engine. Default ``False``
+        """
+        if opposition and level in _RESUMMED_LEVELS:
+            self._prep_team_stats(
+                level=level, strength_state=strength_state, opposition=opposition, score=score, streaming=streaming
+            )
+            return
+
+        pbp, pbp_ext = self._games_play_by_play(game_ids)
+
+        if pbp.is_empty():
+            return
+
+        new_totals = _prep_team_stats_plan(
+            _join_play_by_play_ext(pbp, pbp_ext),
+            level=level,
+            strength_state=strength_state,
+            opposition=opposition,
+            score=score,
+            rates=False,
+        ).collect(engine=_collect_engine(streaming))
+
+        self._team_stats, self._team_stats_totals = _update_rated(
+            self._team_stats,
+            self._team_stats_totals,
+            new_totals,
+            level=level,
+            schema=team_stats_pandera_polars,
+            derived=_TEAM_DERIVED_TOTALS,
+            streaming=streaming,
+        )
 
     @shared_doc(_PREP_TEAM_STATS_DOC)
     def prep_team_stats(
@@ -390,8 +734,10 @@ class _ScraperStatsMixin(_ScraperBase):
         score: bool = False,
         disable_progress_bar: bool | None = None,
         transient_progress_bar: bool | None = None,
+        streaming: bool = False,
     ) -> Self:
         """prep_team_stats — docstring lives in _docstrings._PREP_TEAM_STATS_DOC."""
+        cache_key = ("team_stats", _level_value(level), strength_state, score, opposition)
         levels = self._team_stats_levels
 
         if (
@@ -401,14 +747,23 @@ class _ScraperStatsMixin(_ScraperBase):
             or levels.opposition != opposition
         ):
             self._team_stats = pl.DataFrame()
+            self._team_stats_totals = pl.DataFrame()
             self._team_stats_levels.level = level
             self._team_stats_levels.score = score
             self._team_stats_levels.strength_state = strength_state
             self._team_stats_levels.opposition = opposition
+            self._team_stats_levels.game_ids = frozenset()
+
+            cached = self._stats_cache.get(cache_key)
+
+            if cached is not None:
+                self._team_stats, self._team_stats_totals = cached.frames
+                self._team_stats_levels.game_ids = cached.game_ids
 
         empty_team_stats = self._is_empty(self._team_stats)
+        new_games = self._stats_game_ids() - self._team_stats_levels.game_ids
 
-        if empty_team_stats:
+        if empty_team_stats or new_games:
             with ChickenProgressIndeterminate(
                 disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
                 transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
@@ -419,7 +774,29 @@ class _ScraperStatsMixin(_ScraperBase):
                 progress.start_task(progress_task)
                 progress.update(progress_task, total=1, description=pbar_message, refresh=True)
 
-                self._prep_team_stats(level=level, score=score, strength_state=strength_state, opposition=opposition)
+                if empty_team_stats:
+                    self._prep_team_stats(
+                        level=level,
+                        score=score,
+                        strength_state=strength_state,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                else:
+                    self._add_team_stats_games(
+                        new_games,
+                        level=level,
+                        score=score,
+                        strength_state=strength_state,
+                        opposition=opposition,
+                        streaming=streaming,
+                    )
+
+                self._team_stats_levels.game_ids = self._stats_game_ids()
+                self._stats_cache.put(
+                    cache_key, (self._team_stats, self._team_stats_totals), self._team_stats_levels.game_ids
+                )
 
                 progress.update(
                     progress_task,
@@ -438,4 +815,155 @@ class _ScraperStatsMixin(_ScraperBase):
         if self._is_empty(self._team_stats):
             self.prep_team_stats()
 
+        elif self._stats_game_ids() - self._team_stats_levels.game_ids:
+            levels = self._team_stats_levels
+            self.prep_team_stats(
+                level=levels.level,
+                strength_state=levels.strength_state,
+                opposition=levels.opposition,
+                score=levels.score,
+            )
+
         return _to_backend(self._team_stats, self._backend)
+
+    @shared_doc(_STATS_BY_LEVEL_DOC)
+    def stats_by_level(
+        self,
+        levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+        strength_state: bool = True,
+        score: bool = False,
+        teammates: bool = False,
+        opposition: bool = False,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+        streaming: bool = False,
+    ) -> dict[str, pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame]:
+        """stats_by_level — docstring lives in _docstrings._STATS_BY_LEVEL_DOC."""
+        levels = _sorted_levels(levels or ["game", "season"])
+
+        # Cached individual and on-ice stats with the same splits at a fine enough level can be rolled up directly
+        cached = self._cached_player_stats(levels[0], strength_state, score, teammates, opposition)
+
+        with ChickenProgressIndeterminate(
+            disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
+            transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
+        ) as progress:
+            pbar_message = "Prepping stats data..."
+            progress_task = progress.add_task(pbar_message, total=None, refresh=True)
+
+            progress.start_task(progress_task)
+            progress.update(progress_task, total=1, description=pbar_message, refresh=True)
+
+            if cached is not None:
+                ind_stats, oi_stats = cached
+                stats = roll_up_stats(ind_stats, oi_stats, levels=levels, opposition=opposition, streaming=streaming)
+
+            else:
+                stats = prep_stats_levels(
+                    _to_polars(self.play_by_play),
+                    df_ext=_to_polars(self.play_by_play_ext),
+                    levels=levels,
+                    strength_state=strength_state,
+                    score=score,
+                    teammates=teammates,
+                    opposition=opposition,
+                    streaming=streaming,
+                )
+
+            progress.update(
+                progress_task,
+                description="Finished prepping stats data",
+                completed=True,
+                advance=True,
+                refresh=True,
+            )
+
+        return {level: _to_backend(frame, self._backend) for level, frame in stats.items()}
+
+    @shared_doc(_LINES_BY_LEVEL_DOC)
+    def lines_by_level(
+        self,
+        position: Literal["f", "d"] = "f",
+        levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+        strength_state: bool = True,
+        score: bool = False,
+        teammates: bool = False,
+        opposition: bool = False,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+        streaming: bool = False,
+    ) -> dict[str, pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame]:
+        """lines_by_level — docstring lives in _docstrings._LINES_BY_LEVEL_DOC."""
+        with ChickenProgressIndeterminate(
+            disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
+            transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
+        ) as progress:
+            pbar_message = "Prepping lines data..."
+            progress_task = progress.add_task(pbar_message, total=None, refresh=True)
+
+            progress.start_task(progress_task)
+            progress.update(progress_task, total=1, description=pbar_message, refresh=True)
+
+            lines = prep_lines_levels(
+                _to_polars(self.play_by_play),
+                df_ext=_to_polars(self.play_by_play_ext),
+                position=position,
+                levels=levels,
+                strength_state=strength_state,
+                score=score,
+                teammates=teammates,
+                opposition=opposition,
+                streaming=streaming,
+            )
+
+            progress.update(
+                progress_task,
+                description="Finished prepping lines data",
+                completed=True,
+                advance=True,
+                refresh=True,
+            )
+
+        return {level: _to_backend(frame, self._backend) for level, frame in lines.items()}
+
+    @shared_doc(_TEAM_STATS_BY_LEVEL_DOC)
+    def team_stats_by_level(
+        self,
+        levels: list[AggLevel | Literal["period", "game", "session", "season"]] | None = None,
+        strength_state: bool = True,
+        opposition: bool = False,
+        score: bool = False,
+        disable_progress_bar: bool | None = None,
+        transient_progress_bar: bool | None = None,
+        streaming: bool = False,
+    ) -> dict[str, pl.DataFrame | pd.DataFrame | pa.Table | nw.DataFrame]:
+        """team_stats_by_level — docstring lives in _docstrings._TEAM_STATS_BY_LEVEL_DOC."""
+        with ChickenProgressIndeterminate(
+            disable=self.disable_progress_bar if disable_progress_bar is None else disable_progress_bar,
+            transient=self.transient_progress_bar if transient_progress_bar is None else transient_progress_bar,
+        ) as progress:
+            pbar_message = "Prepping team stats data..."
+            progress_task = progress.add_task(pbar_message, total=None, refresh=True)
+
+            progress.start_task(progress_task)
+            progress.update(progress_task, total=1, description=pbar_message, refresh=True)
+
+            team_stats = prep_team_stats_levels(
+                _to_polars(self.play_by_play),
+                df_ext=_to_polars(self.play_by_play_ext),
+                levels=levels,
+                strength_state=strength_state,
+                opposition=opposition,
+                score=score,
+                streaming=streaming,
+            )
+
+            progress.update(
+                progress_task,
+                description="Finished prepping team stats data",
+                completed=True,
+                advance=True,
+                refresh=True,
+            )
+
+        return {level: _to_backend(frame, self._backend) for level, frame in team_stats.items()}
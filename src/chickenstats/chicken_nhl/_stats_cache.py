@@ -0,0 +1,106 @@
+"""In-memory cache of aggregated stats frames for the Scraper.
+
+Contains:
+    StatsCache: Bounded LRU store of aggregated frames keyed by the aggregation parameters.
+    StatsCacheEntry: Cached frames along with the games they were aggregated from.
+
+Entries are evicted least recently used first once the cache holds more than ``max_entries``
+entries or its frames exceed ``max_bytes``, as measured by Polars' ``estimated_size``.
+Each entry records its games, so the Scraper can add games passed to ``add_games`` to it.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+import polars as pl
+
+
+@dataclass(frozen=True)
+class StatsCacheEntry:
+    """Frames cached by ``StatsCache``, the games they were aggregated from, and their estimated size in bytes."""
+
+    frames: tuple[pl.DataFrame, ...]
+    game_ids: frozenset[int]
+    nbytes: int
+
+
+class StatsCache:
+    """LRU store of aggregated stats frames, keyed by the parameters they were aggregated with.
+
+    Keys are tuples such as ``("stats", level, strength_state, score, teammates, opposition)``;
+    values are tuples of Polars frames and the games they cover. Frames are stored by reference,
+    so the Scraper's current frames are not held twice.
+
+    Parameters:
+        max_entries (int):
+            Maximum number of entries kept. ``0`` disables caching.
+        max_bytes (int | None):
+            Maximum estimated size of all cached frames, in bytes. Entries larger than the whole
+            budget are not stored. ``None`` for no limit.
+
+    Examples:
+        >>> cache = StatsCache(max_entries=4, max_bytes=256 * 1024**2)
+        >>> cache.put(("team_stats", "game", True, False, False), (team_stats,), frozenset({2023020001}))
+        >>> cache.get(("team_stats", "game", True, False, False)).frames
+    """
+
+    def __init__(self, max_entries: int = 8, max_bytes: int | None = None):
+        """Create an empty cache with the given bounds."""
+        self.max_entries: int = max_entries
+        self.max_bytes: int | None = max_bytes
+        self.nbytes: int = 0
+
+        self._entries: OrderedDict[Hashable, StatsCacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if key is cached, without marking it as recently used."""
+        return key in self._entries
+
+    def get(self, key: Hashable) -> StatsCacheEntry | None:
+        """Return the entry cached for key and mark it as most recently used, or ``None`` on a miss."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key: Hashable, frames: tuple[pl.DataFrame, ...], game_ids: frozenset[int] = frozenset()) -> None:
+        """Cache frames aggregated from game_ids under key as the most recently used entry.
+
+        Older entries are evicted to stay in bounds.
+        """
+        self.discard(key)
+
+        entry = StatsCacheEntry(frames, game_ids, sum(frame.estimated_size() for frame in frames))
+
+        if self.max_entries < 1 or (self.max_bytes is not None and entry.nbytes > self.max_bytes):
+            return
+
+        self._entries[key] = entry
+        self.nbytes += entry.nbytes
+
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def discard(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self.nbytes = 0
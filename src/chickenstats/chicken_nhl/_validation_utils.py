@@ -6,6 +6,7 @@ Includes:
     * convert_pydantic_models
     * build_pandera_schema
     * pydantic_to_native_polars
+    * validate_records_columnar
 """
 
 from __future__ import annotations
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
 from pydantic import BaseModel
 import polars as pl
 
+from chickenstats.chicken_nhl.validation_pydantic import _annotation_has_list, _join_list
+
 from chickenstats.exceptions import UnsupportedBackendError
 
 
@@ -367,3 +370,116 @@ def pydantic_to_native_polars(model: type[BaseModel], dtype_map: dict) -> dict[s
         polars_schema[field_name] = dtype_map.get(base_type, pl.String)
 
     return polars_schema
+
+
+_MISSING = object()
+
+
+def _float_matches_int(series: pl.Series, coerced: pl.Series) -> bool:
+    """Return whether every non-null float in ``series`` was an exact integer before casting to ``coerced``."""
+    return bool((series.drop_nulls() == coerced.drop_nulls().cast(series.dtype)).all())
+
+
+def validate_records_columnar(records: list[dict], model: type[BaseModel], schema: dict) -> pl.DataFrame:
+    """Validate and coerce a list of record dicts column-wise, mirroring ``model.model_validate``.
+
+    Builds one Polars Series per model field instead of one Pydantic model per record. The
+    model's own behaviour is reproduced for each column:
+
+    * a ``fix_lists`` model validator joins list-typed fields into comma-separated strings,
+      updating ``records`` in place exactly as the validator does,
+    * ``mode="before"`` field validators (including ``"*"`` validators) are applied to each
+      value in the column, in the same order Pydantic applies them,
+    * missing keys take the field default, without running validators; a missing required
+      field raises ``ValueError``,
+    * values are coerced to the schema dtype; a value that cannot be coerced (e.g., an int
+      for a ``str`` field or ``3.5`` for an ``int`` field), a null in a required non-nullable
+      field, or a string that fails a field ``pattern`` raises ``ValueError``.
+
+    Parameters:
+        records (list[dict]):
+            Raw records, e.g., play-by-play events. Keys that are not model fields are ignored.
+        model (type[BaseModel]):
+            Pydantic model whose fields, defaults, and validators define the columns.
+        schema (dict):
+            Native Polars schema for ``model``, e.g., ``pbp_polars_schema``.
+
+    Returns:
+        pl.DataFrame:
+            One column per model field, in model field order, typed according to ``schema``.
+
+    Examples:
+        >>> from chickenstats.chicken_nhl.validation_pydantic import XGFields
+        >>> from chickenstats.chicken_nhl.validation_polars import xg_polars_schema
+        >>> xg = validate_records_columnar(xg_plays, XGFields, xg_polars_schema)
+    """
+    decorators = model.__pydantic_decorators__
+
+    join_lists = "fix_lists" in decorators.model_validators
+    before_validators = [
+        decorator
+        for decorator in reversed(list(decorators.field_validators.values()))
+        if decorator.info.mode == "before"
+    ]
+
+    columns = []
+
+    for field_name, field_info in model.model_fields.items():
+        dtype = schema[field_name]
+        base_type, is_nullable = _get_base_type_and_nullable(field_info.annotation)
+
+        values = [record.get(field_name, _MISSING) for record in records]
+
+        if join_lists and _annotation_has_list(field_info.annotation):
+            values = [v if v is _MISSING else _join_list(v) for v in values]
+
+            # fix_lists rewrites the input dict in place; records shared with other outputs rely on it
+            for record, value in zip(records, values, strict=True):
+                if value is not _MISSING:
+                    record[field_name] = value
+
+        for decorator in before_validators:
+            if field_name in decorator.info.fields or "*" in decorator.info.fields:
+                func = decorator.func
+                values = [v if v is _MISSING else func(v) for v in values]
+
+        if _MISSING in values:
+            if field_info.is_required():
+                raise ValueError(f"{model.__name__}.{field_name}: required field missing from a record")
+
+            default = field_info.get_default(call_default_factory=True)
+            values = [default if v is _MISSING else v for v in values]
+
+        try:
+            series = pl.Series(field_name, values, dtype=dtype)
+
+        except (TypeError, pl.exceptions.PolarsError):
+            inferred = pl.Series(field_name, values, strict=False)
+
+            if dtype == pl.String and inferred.dtype != pl.String:
+                raise ValueError(f"{model.__name__}.{field_name}: expected strings, got {inferred.dtype}") from None
+
+            try:
+                series = inferred.cast(dtype)
+            except pl.exceptions.PolarsError as exc:
+                raise ValueError(f"{model.__name__}.{field_name}: cannot coerce values to {dtype}") from exc
+
+            if inferred.dtype.is_float() and dtype.is_integer() and not _float_matches_int(inferred, series):
+                raise ValueError(f"{model.__name__}.{field_name}: fractional values for an integer field") from None
+
+            if series.null_count() != sum(v is None for v in values):
+                raise ValueError(f"{model.__name__}.{field_name}: cannot coerce values to {dtype}") from None
+
+        if not is_nullable and series.null_count():
+            raise ValueError(
+                f"{model.__name__}.{field_name}: {series.null_count()} missing value(s) in a required field"
+            )
+
+        for metadata in field_info.metadata:
+            pattern = getattr(metadata, "pattern", None)
+            if pattern is not None and not series.drop_nulls().str.contains(pattern).all():
+                raise ValueError(f"{model.__name__}.{field_name}: values do not match pattern {pattern!r}")
+
+        columns.append(series)
+
+    return pl.DataFrame(columns)
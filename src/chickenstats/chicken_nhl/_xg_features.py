@@ -0,0 +1,178 @@
+"""Columnar construction of the xG model features from play-by-play data.
+
+Contains:
+    build_xg_fields: Builds the ``xg_fields`` feature frame (one row per fenwick event) from play-by-play data.
+
+The features describe each unblocked shot attempt relative to the events before it (rebounds,
+rush attempts, time since the last faceoff or line change, etc.). They only depend on columns
+that are stored in ``Scraper.play_by_play``, so features for previously scraped games can be
+rebuilt without re-running the game pipeline.
+"""
+
+from __future__ import annotations
+
+from typing import overload
+
+import polars as pl
+
+from chickenstats.chicken_nhl.validation_polars import xg_polars_schema
+
+# Collapse raw NHL position codes to the F/D/G encoding used in xG model training.
+# Forwards (C, L, R, LW, RW, W) → "F"; defensemen → "D"; goalies → "G".
+_POSITION_COLLAPSE: dict[str, str] = {"C": "F", "L": "F", "R": "F", "LW": "F", "RW": "F", "W": "F", "D": "D", "G": "G"}
+
+_FENWICK_EVENTS = ["GOAL", "SHOT", "MISS"]
+
+# Events that become the "prior event" of the next fenwick attempt
+_IMPORTANT_EVENTS = ["SHOT", "FAC", "HIT", "BLOCK", "MISS", "GIVE", "TAKE", "GOAL"]
+
+# Prior events reported in the prior_event_same / prior_event_opp features
+_PRIOR_EVENT_TYPES = ["SHOT", "MISS", "BLOCK", "GIVE", "TAKE", "HIT"]
+
+# Columns of the prior important event joined onto each row
+_PRIOR_COLUMNS = (
+    "event",
+    "event_team",
+    "period",
+    "game_seconds",
+    "coords_x",
+    "coords_y",
+    "zone",
+    "event_angle",
+    "event_distance",
+)
+
+
+@overload
+def build_xg_fields(play_by_play: pl.DataFrame) -> pl.DataFrame: ...
+
+
+@overload
+def build_xg_fields(play_by_play: pl.LazyFrame) -> pl.LazyFrame: ...
+
+
+def build_xg_fields(play_by_play: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame | pl.LazyFrame:
+    """Build the xG feature frame from play-by-play data, one row per fenwick event.
+
+    Every feature is a lookup of the last matching event within the same game, computed with
+    forward fills and a join rather than a per-event loop, so one call handles a single game
+    or many seasons of concatenated play-by-play. Events are ordered by ``game_id`` and
+    ``event_idx`` before the features are computed.
+
+    Context features (``is_rebound``, ``rush_attempt``, ``seconds_since_last``, etc.) are only
+    populated for attempts with coordinates that follow an earlier shot, faceoff, hit, block,
+    miss, giveaway, or takeaway in the same period; otherwise the flags are ``0`` and the
+    remaining features are null. ``seconds_since_stoppage`` measures the time since the last
+    faceoff, and ``seconds_since_event_team_change`` / ``seconds_since_opp_team_change`` the
+    time since each team's last line change.
+
+    Parameters:
+        play_by_play (pl.DataFrame | pl.LazyFrame):
+            Play-by-play data with the columns of ``Scraper.play_by_play``, e.g., the output
+            of a previous scrape read back from parquet.
+
+    Returns:
+        pl.DataFrame | pl.LazyFrame:
+            Frame with the ``xg_fields`` schema, of the same kind as ``play_by_play``.
+
+    Examples:
+        Rebuild xG features from stored play-by-play data
+        >>> import polars as pl
+        >>> from chickenstats.chicken_nhl import build_xg_fields
+        >>> xg_fields = build_xg_fields(pl.read_parquet("play_by_play.parquet"))
+
+        Or lazily, across many files
+        >>> xg_fields = build_xg_fields(pl.scan_parquet("pbp/*.parquet")).collect()
+    """
+    is_lazy = isinstance(play_by_play, pl.LazyFrame)
+
+    event = pl.col("event")
+    game_seconds = pl.col("game_seconds")
+    is_home = pl.col("is_home").fill_null(0) == 1
+
+    lf = (
+        play_by_play.lazy()
+        .sort(["game_id", "event_idx"], maintain_order=True)
+        .with_row_index("_row")
+        .with_columns(
+            pl.when(event.is_in(_IMPORTANT_EVENTS))
+            .then(pl.col("_row"))
+            .shift(1)
+            .forward_fill()
+            .over("game_id")
+            .alias("_prior_row"),
+            pl.when(event == "FAC").then(game_seconds).forward_fill().over("game_id").alias("_last_face"),
+            pl.when((event == "CHANGE") & is_home)
+            .then(game_seconds)
+            .forward_fill()
+            .over("game_id")
+            .alias("_last_home_change"),
+            pl.when((event == "CHANGE") & ~is_home)
+            .then(game_seconds)
+            .forward_fill()
+            .over("game_id")
+            .alias("_last_away_change"),
+        )
+    )
+
+    prior = lf.select(
+        pl.col("_row").alias("_prior_row"), *[pl.col(column).alias(f"_prior_{column}") for column in _PRIOR_COLUMNS]
+    )
+
+    lf = lf.join(prior, on="_prior_row", how="left", maintain_order="left").filter(event.is_in(_FENWICK_EVENTS))
+
+    prior_event = pl.col("_prior_event")
+    seconds_since = (game_seconds - pl.col("_prior_game_seconds")).cast(pl.Float64)
+    same_team = pl.col("event_team").eq_missing(pl.col("_prior_event_team"))
+    distance = (
+        (pl.col("coords_x").fill_null(0) - pl.col("_prior_coords_x").fill_null(0)).cast(pl.Float64).pow(2)
+        + (pl.col("coords_y").fill_null(0) - pl.col("_prior_coords_y").fill_null(0)).cast(pl.Float64).pow(2)
+    ).sqrt()
+
+    has_context = (
+        pl.col("coords_x").is_not_null()
+        & pl.col("_prior_row").is_not_null()
+        & (pl.col("_prior_period") == pl.col("period"))
+    )
+
+    def context(expr: pl.Expr) -> pl.Expr:
+        """Populate a feature only for attempts with a prior event in the same period."""
+        return pl.when(has_context).then(expr)
+
+    def context_flag(expr: pl.Expr) -> pl.Expr:
+        """Populate a binary feature for attempts with context, else ``0``."""
+        return context(expr).fill_null(False).cast(pl.Int64)
+
+    is_prior_type = prior_event.is_in(_PRIOR_EVENT_TYPES)
+    team_change = pl.when(is_home).then(pl.col("_last_home_change")).otherwise(pl.col("_last_away_change"))
+    opp_change = pl.when(is_home).then(pl.col("_last_away_change")).otherwise(pl.col("_last_home_change"))
+
+    lf = lf.with_columns(
+        context_flag(
+            prior_event.is_in(["SHOT", "MISS", "BLOCK"])
+            & (seconds_since <= 3)
+            & (same_team == (prior_event != "BLOCK"))
+        ).alias("is_rebound"),
+        context_flag(prior_event.is_in(["GIVE", "TAKE"]) & (seconds_since > 0) & (seconds_since <= 4)).alias(
+            "is_scramble"
+        ),
+        context_flag((seconds_since <= 4) & (pl.col("_prior_zone") == "NEU")).alias("rush_attempt"),
+        context_flag(prior_event == "FAC").alias("prior_face"),
+        context(pl.when(seconds_since > 0).then(seconds_since)).alias("seconds_since_last"),
+        context(distance).alias("distance_from_last"),
+        context(pl.when(seconds_since > 0).then(distance / seconds_since)).alias("play_speed"),
+        context(game_seconds - pl.col("_last_face")).alias("seconds_since_stoppage"),
+        context(pl.col("_prior_event_angle")).alias("prior_event_angle"),
+        context(pl.col("_prior_event_distance")).alias("prior_event_distance"),
+        context(game_seconds - team_change).alias("seconds_since_event_team_change"),
+        context(game_seconds - opp_change).alias("seconds_since_opp_team_change"),
+        context(pl.when(is_prior_type & same_team).then(prior_event)).alias("prior_event_same"),
+        context(pl.when(is_prior_type & ~same_team).then(prior_event)).alias("prior_event_opp"),
+        pl.col("coords_y").fill_null(0).abs().alias("abs_y_distance"),
+        pl.col("player_1_position").replace_strict(_POSITION_COLLAPSE, default="F").alias("position"),
+        pl.col("score_diff").fill_null(0).clip(-4, 4).alias("score_diff"),
+    )
+
+    lf = lf.select([pl.col(column).cast(dtype) for column, dtype in xg_polars_schema.items()])
+
+    return lf if is_lazy else lf.collect()
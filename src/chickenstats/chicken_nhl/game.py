@@ -16,9 +16,14 @@ class Game(_GameCore, _GameAPIMixin, _GameHTMLMixin, _GameRostersMixin, _GamePBP
             scraping multiple games. A new session is created if not provided.
         backend: DataFrame library to use for ``_df`` properties. One of ``"polars"``
             (default), ``"pandas"``, ``"pyarrow"``, or ``"narwhals"``.
+        html_parser: Parser used for the HTML reports. ``"lxml"`` (default) parses with
+            ``lxml.html`` and XPath; ``"bs4"`` uses the original BeautifulSoup parser.
+        validation: ``"polars"`` (default) validates each game column-wise against the Polars
+            schemas; ``"pydantic"`` validates every event with its Pydantic model (slower, for debugging).
 
     Raises:
         InvalidGameIDError: If ``game_id`` is not a 10-digit integer string.
+        InvalidInputError: If ``html_parser`` or ``validation`` is not a supported value.
 
     Note:
         You can return any of the properties as a polars, pandas, pyarrow, or narwhals
@@ -43,6 +48,9 @@ class Game(_GameCore, _GameAPIMixin, _GameHTMLMixin, _GameRostersMixin, _GamePBP
         >>> pbp_df = game.play_by_play_df
         >>> shifts_df = game.shifts_df
 
+        See how long each stage of the pipeline took
+        >>> game.stage_metrics_df
+
         Use a different DataFrame backend
         >>> game = Game(2019020684, backend="pandas")
         >>> pbp_df = game.play_by_play_df  # pandas DataFrame
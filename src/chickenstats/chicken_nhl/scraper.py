@@ -22,12 +22,55 @@ class Scraper(_ScraperCore, _ScraperRawMixin, _ScraperStatsMixin):
         backend (str):
             DataFrame backend for all returned data. One of ``"polars"`` (default),
             ``"pandas"``, ``"pyarrow"``, or ``"narwhals"``.
+        max_workers (int):
+            Maximum number of games scraped concurrently. Results are always stored in
+            ``game_ids`` order. Default ``1`` (sequential).
+        parse_workers (int):
+            Number of worker processes that parse downloaded reports. When greater than ``0``,
+            the ``max_workers`` threads only download, and parsing runs in a process pool so
+            large backfills use every core. Scripts using it on macOS or Windows need an
+            ``if __name__ == "__main__":`` guard. Default ``0`` (parse in the scraping threads).
+        cache_dir (str | Path | None):
+            Directory for an on-disk cache of raw API and HTML report responses. Completed games
+            are served from disk without network access, so re-scraping historical seasons only
+            costs local reads. Default ``None`` (no caching).
+        game_cache_dir (str | Path | None):
+            Directory for a cache of each game's processed frames as Arrow IPC files. Cached games
+            skip the parsing pipeline until the chickenstats version or the game's data corrections
+            change. Games still in progress are not cached. Default ``None`` (no caching).
+        html_parser (str):
+            Parser used for the HTML reports. ``"lxml"`` (default) parses with ``lxml.html`` and
+            XPath; ``"bs4"`` uses the original BeautifulSoup parser. Both produce identical output.
+        validation (str):
+            How each game's events are validated. ``"polars"`` (default) validates whole columns
+            against the Polars schemas; ``"pydantic"`` validates every event with its Pydantic
+            model, which is slower but useful for debugging. Both produce identical output.
+        retain (Iterable[str] | None):
+            Data kept for each scraped game, e.g., ``{"play_by_play", "play_by_play_ext"}``. Other
+            outputs are dropped as soon as each game is scraped, which bounds memory use on long
+            backfills; accessing them raises ``InvalidInputError``. Aggregating stats needs
+            ``play_by_play`` and ``play_by_play_ext``. Default ``None`` (keep everything).
+        spill_dir (str | Path | None):
+            Directory where each game's retained frames are written as Arrow IPC files rather than
+            held in memory. The files are memory-mapped when the data is concatenated and removed
+            when the Scraper is garbage collected. Default ``None`` (keep in memory).
+        metrics_hook (Callable[[dict], None] | None):
+            Called with each stage record added to ``scrape_metrics``, e.g., to export the timings
+            as tracing spans. Default ``None``.
+        stats_cache_size (int):
+            Number of ``prep_stats``, ``prep_lines``, and ``prep_team_stats`` results kept in memory,
+            so toggling between aggregation levels or splits reuses earlier results instead of
+            re-aggregating. The least recently used result is evicted first. Default ``8``.
+        stats_cache_bytes (int | None):
+            Memory budget for those cached results, in bytes. ``None`` for no limit. Default 512 MiB.
 
     Attributes:
         game_ids (list):
             Game IDs tracked by this Scraper, e.g., ``[2023020001, 2023020002, 2023020003]``
         failed_games (list):
             Game IDs that failed to scrape, e.g., ``[2023020005]``
+        scrape_metrics (pl.DataFrame):
+            Wall time, bytes downloaded, and rows produced by each pipeline stage of every scraped game
 
     Examples:
         First, instantiate the Scraper object
@@ -49,6 +92,31 @@ class Scraper(_ScraperCore, _ScraperRawMixin, _ScraperStatsMixin):
         >>> html_events = scraper.html_events
         >>> html_rosters = scraper.html_rosters
 
+        Scrape a full season several games at a time
+        >>> scraper = Scraper(game_ids, max_workers=8)
+        >>> pbp = scraper.play_by_play
+
+        Download with eight threads while four processes parse
+        >>> scraper = Scraper(game_ids, max_workers=8, parse_workers=4)
+        >>> pbp = scraper.play_by_play
+
+        Cache raw responses on disk so later runs skip the network
+        >>> scraper = Scraper(game_ids, cache_dir="./nhl_cache")
+
+        Cache processed games too, skipping parsing on later runs
+        >>> scraper = Scraper(game_ids, cache_dir="./nhl_cache", game_cache_dir="./game_cache")
+
+        Keep only play-by-play data, spilled to disk, for a backfill in limited memory
+        >>> scraper = Scraper(game_ids, retain={"play_by_play", "play_by_play_ext"}, spill_dir="./spill")
+        >>> pbp = scraper.play_by_play
+
+        Stream one game at a time, e.g., to write each game to storage as it finishes
+        >>> for game_id, frames in scraper.iter_games(kinds=("play_by_play", "shifts")):
+        ...     frames["play_by_play"].write_parquet(f"pbp/{game_id}.parquet")
+
+        See which pipeline stages the scrape spent its time in
+        >>> scraper.scrape_metrics.group_by("stage").agg(pl.col("seconds").sum())
+
         Add more game IDs after construction and scrape again
         >>> scraper.add_games(2023020011)
         >>> pbp = scraper.play_by_play  # now includes the new game
@@ -72,4 +140,7 @@ class Scraper(_ScraperCore, _ScraperRawMixin, _ScraperStatsMixin):
         >>> lines = scraper.prep_lines(position="d", level="season").lines
         >>> team_stats = scraper.prep_team_stats(level="season").team_stats
 
+        Keep more aggregation results cached when toggling between many views
+        >>> scraper = Scraper(game_ids, stats_cache_size=32, stats_cache_bytes=2 * 1024**3)
+
     """
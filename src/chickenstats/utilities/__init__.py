@@ -6,7 +6,7 @@ After import, ``plt.style.use('chickenstats')`` works without any further calls.
 
 Exports:
     Progress bars: ChickenProgress, ChickenProgressIndeterminate, ScrapeSpeedColumn, track
-    HTTP session:  ChickenSession
+    HTTP session:  ChickenSession, RateLimiter
     Enums:         AggLevel, Backend, Position, Zone, FORWARDS
     Type alias:    DataFrameT
     Input helpers: convert_to_list
@@ -18,6 +18,7 @@ from chickenstats.utilities.utilities import (
     ChickenProgress,
     ChickenProgressIndeterminate,
     ChickenSession,
+    RateLimiter,
     ScrapeSpeedColumn,
     convert_to_list,
     track,
@@ -43,6 +44,7 @@ __all__ = [
     "ChickenProgress",
     "ChickenProgressIndeterminate",
     "ChickenSession",
+    "RateLimiter",
     "ScrapeSpeedColumn",
     "convert_to_list",
     "FORWARDS",
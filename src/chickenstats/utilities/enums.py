@@ -63,11 +63,11 @@ class Zone(str, Enum):
 
 @dataclass
 class StatsLevels:
-    """Tracks the aggregation parameters used for the cached ``stats`` DataFrame.
+    """Tracks the aggregation parameters and games used for the cached ``stats`` DataFrame.
 
     Compared against the requested parameters on each ``Scraper.stats`` access
-    to decide whether to recompute. Not intended for direct instantiation by
-    external users.
+    to decide whether to recompute, and against the Scraper's games to find games
+    added since. Not intended for direct instantiation by external users.
     """
 
     level: str | None = None
@@ -75,15 +75,16 @@ class StatsLevels:
     score: bool | None = None
     teammates: bool | None = None
     opposition: bool | None = None
+    game_ids: frozenset[int] = frozenset()
 
 
 @dataclass
 class LinesLevels:
-    """Tracks the aggregation parameters used for the cached ``lines`` DataFrame.
+    """Tracks the aggregation parameters and games used for the cached ``lines`` DataFrame.
 
     Compared against the requested parameters on each ``Scraper.lines`` access
-    to decide whether to recompute. Not intended for direct instantiation by
-    external users.
+    to decide whether to recompute, and against the Scraper's games to find games
+    added since. Not intended for direct instantiation by external users.
     """
 
     position: str | None = None
@@ -92,18 +93,20 @@ class LinesLevels:
     score: bool | None = None
     teammates: bool | None = None
     opposition: bool | None = None
+    game_ids: frozenset[int] = frozenset()
 
 
 @dataclass
 class TeamStatsLevels:
-    """Tracks the aggregation parameters used for the cached ``team_stats`` DataFrame.
+    """Tracks the aggregation parameters and games used for the cached ``team_stats`` DataFrame.
 
     Compared against the requested parameters on each ``Scraper.team_stats`` access
-    to decide whether to recompute. Not intended for direct instantiation by
-    external users.
+    to decide whether to recompute, and against the Scraper's games to find games
+    added since. Not intended for direct instantiation by external users.
     """
 
     level: str | None = None
     strength_state: bool | None = None
     score: bool | None = None
     opposition: bool | None = None
+    game_ids: frozenset[int] = frozenset()
@@ -3,7 +3,9 @@
 Classes:
     ChickenProgress: Rich progress bar with spinner, bar, %, elapsed/remaining time, M-of-N counts, and scrape speed.
     ChickenProgressIndeterminate: Simplified progress bar for operations where the total count is unknown.
-    ChickenSession: Requests session pre-configured with retries, timeouts, and connection pooling.
+    ChickenSession: Requests session pre-configured with retries, timeouts, connection pooling, rate limiting,
+        and an optional on-disk response cache.
+    RateLimiter: Per-host token bucket that adapts its request rate and concurrency to the host (AIMD).
 
 Functions:
     norm_coords: Normalize shot coordinates so all shots for a reference team travel in the same direction.
@@ -19,7 +21,16 @@ Private helpers (used internally, not part of the public API):
 from __future__ import annotations
 
 import datetime
+import gzip
+import hashlib
 import importlib.resources
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, cast
 
@@ -52,21 +63,307 @@ from rich.progress import (
 )
 from rich.text import Text
 
+logger = logging.getLogger(__name__)
+
+
+class _HostLimit:
+    """Token bucket, concurrency limit, and latency tracking for a single host."""
+
+    def __init__(self, rate: float, concurrency: float):
+        """Start the host with a full bucket at the initial rate and concurrency."""
+        self.condition = threading.Condition()
+
+        self.rate: float = rate
+        self.tokens: float = max(1.0, rate)
+        self.refilled_at: float = time.monotonic()
+        self.concurrency: float = concurrency
+        self.in_flight: int = 0
+        self.blocked_until: float = 0.0
+
+        self.latency: float | None = None
+        self.baseline_latency: float | None = None
+        self.last_increase: float = 0.0
+        self.last_decrease: float = 0.0
+
+        self.requests: int = 0
+        self.throttled: int = 0
+        self.server_errors: int = 0
+        self.decreases: int = 0
+        self.wait_seconds: float = 0.0
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill, holding at most one second of requests."""
+        self.tokens = min(max(1.0, self.rate), self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+
+class RateLimiter:
+    """Per-host token bucket with additive-increase / multiplicative-decrease (AIMD) control.
+
+    Each host gets its own token bucket, which caps the request rate, and a concurrency limit,
+    which caps the requests in flight. Both start low and grow while the host responds quickly
+    and successfully: the rate by ``rate_increase`` requests per second each second, and the
+    concurrency by one slot for every ``concurrency`` successful responses. A ``429``, a ``5xx``,
+    a failed connection, or latency above ``latency_tolerance`` times the host's baseline cuts
+    both by ``decrease_factor``, at most once per ``cooldown`` seconds, and a ``Retry-After``
+    header pauses the host entirely. The limiter therefore settles near the highest rate the
+    host sustains rather than a guessed one.
+
+    One limiter is shared by every ``ChickenSession`` by default, so concurrent scrapers are
+    throttled together. Hosts not listed in ``hosts`` are never throttled.
+
+    Parameters:
+        hosts (Iterable[str]):
+            Hostnames to throttle. Default ``("api-web.nhle.com", "www.nhl.com")``.
+        initial_rate (float):
+            Requests per second allowed to each host at the start. Default ``10.0``.
+        min_rate (float):
+            Floor for the request rate after decreases. Default ``0.5``.
+        max_rate (float):
+            Ceiling for the request rate. Default ``100.0``.
+        rate_increase (float):
+            Requests per second added each second without congestion. Default ``1.0``.
+        initial_concurrency (int):
+            Requests allowed in flight to each host at the start. Default ``8``.
+        max_concurrency (int):
+            Ceiling for the concurrency limit. Default ``64``.
+        decrease_factor (float):
+            Factor applied to the rate and concurrency on congestion. Default ``0.5``.
+        latency_tolerance (float):
+            Multiple of the baseline latency treated as congestion. Default ``3.0``.
+        cooldown (float):
+            Minimum seconds between decreases, so one burst of errors only backs off once.
+            Default ``1.0``.
+
+    Raises:
+        InvalidInputError: If a rate or concurrency bound is not positive, the bounds are out of
+            order, or ``decrease_factor`` is not between 0 and 1.
+
+    Examples:
+        Start slower and never exceed five requests per second to each host
+        >>> from chickenstats.utilities import ChickenSession, RateLimiter
+        >>> limiter = RateLimiter(initial_rate=2.0, max_rate=5.0)
+        >>> session = ChickenSession(rate_limiter=limiter)
+
+        Check how the controller has adapted
+        >>> limiter.metrics()
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str] = ("api-web.nhle.com", "www.nhl.com"),
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        rate_increase: float = 1.0,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 3.0,
+        cooldown: float = 1.0,
+    ):
+        """Validate the controller settings and start every host at the initial limits."""
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise InvalidInputError(
+                f"Rates must satisfy 0 < min_rate <= initial_rate <= max_rate, "
+                f"got {min_rate!r}, {initial_rate!r}, {max_rate!r}"
+            )
+
+        if not 1 <= initial_concurrency <= max_concurrency:
+            raise InvalidInputError(
+                f"Concurrency must satisfy 1 <= initial_concurrency <= max_concurrency, "
+                f"got {initial_concurrency!r}, {max_concurrency!r}"
+            )
+
+        if not 0 < decrease_factor < 1:
+            raise InvalidInputError(f"decrease_factor must be between 0 and 1, got {decrease_factor!r}")
+
+        self.min_rate: float = min_rate
+        self.max_rate: float = max_rate
+        self.rate_increase: float = rate_increase
+        self.max_concurrency: int = max_concurrency
+        self.decrease_factor: float = decrease_factor
+        self.latency_tolerance: float = latency_tolerance
+        self.cooldown: float = cooldown
+
+        self._hosts: dict[str, _HostLimit] = {
+            host: _HostLimit(initial_rate, float(initial_concurrency)) for host in hosts
+        }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the RateLimiter object."""
+        return f"RateLimiter(hosts={list(self._hosts)!r})"
+
+    def throttles(self, host: str | None) -> bool:
+        """Return whether requests to ``host`` are throttled."""
+        return host in self._hosts
+
+    def acquire(self, host: str) -> None:
+        """Block until ``host`` has a free concurrency slot and a token, then take both."""
+        limit = self._hosts[host]
+        start = time.monotonic()
+
+        with limit.condition:
+            while True:
+                now = time.monotonic()
+                limit.refill(now)
+
+                has_slot = limit.in_flight < int(limit.concurrency)
+
+                if has_slot and limit.tokens >= 1 and now >= limit.blocked_until:
+                    limit.tokens -= 1
+                    limit.in_flight += 1
+                    limit.wait_seconds += now - start
+                    return
+
+                # Without a slot, wait for a release; otherwise wait for the next token or the pause to end
+                timeout = None if not has_slot else max(limit.blocked_until - now, (1 - limit.tokens) / limit.rate)
+                limit.condition.wait(timeout)
+
+    def release(
+        self, host: str, statuses: Iterable[int], latency: float, failed: bool = False, retry_after: float | None = None
+    ) -> None:
+        """Return a slot for ``host`` and adapt its limits to the outcome of the request.
+
+        Parameters:
+            host (str):
+                Host the request was sent to
+            statuses (Iterable[int]):
+                Status codes of every attempt at the request, including retries
+            latency (float):
+                Seconds taken by the request, including retries
+            failed (bool):
+                Whether the request raised, e.g., on a timeout or refused connection
+            retry_after (float | None):
+                Seconds the host asked clients to wait, from a ``Retry-After`` header
+        """
+        limit = self._hosts[host]
+        statuses = list(statuses)
+
+        with limit.condition:
+            now = time.monotonic()
+
+            limit.in_flight -= 1
+            limit.requests += 1
+            limit.throttled += sum(status == 429 for status in statuses)
+            limit.server_errors += sum(status >= 500 for status in statuses)
+
+            if retry_after:
+                limit.blocked_until = max(limit.blocked_until, now + retry_after)
+
+            # The baseline follows the smoothed latency down immediately and up slowly
+            limit.latency = latency if limit.latency is None else 0.8 * limit.latency + 0.2 * latency
+            if limit.baseline_latency is None or limit.latency < limit.baseline_latency:
+                limit.baseline_latency = limit.latency
+            else:
+                limit.baseline_latency += 0.01 * (limit.latency - limit.baseline_latency)
+
+            congested = (
+                failed
+                or any(status == 429 or status >= 500 for status in statuses)
+                or limit.latency > self.latency_tolerance * limit.baseline_latency
+            )
+
+            if congested:
+                if now - limit.last_decrease >= self.cooldown:
+                    limit.rate = max(self.min_rate, limit.rate * self.decrease_factor)
+                    limit.concurrency = max(1.0, limit.concurrency * self.decrease_factor)
+                    limit.tokens = min(limit.tokens, max(1.0, limit.rate))
+                    limit.last_decrease = now
+                    limit.decreases += 1
+
+            else:
+                limit.concurrency = min(float(self.max_concurrency), limit.concurrency + 1 / limit.concurrency)
+
+                if now - limit.last_increase >= 1:
+                    limit.rate = min(self.max_rate, limit.rate + self.rate_increase)
+                    limit.last_increase = now
+
+            limit.condition.notify_all()
+
+    def metrics(self) -> dict[str, dict]:
+        """Return the current limits and counters of each host.
+
+        Returns:
+            dict[str, dict]:
+                For each host: ``rate`` (requests per second), ``concurrency`` (requests allowed
+                in flight), ``in_flight``, ``requests``, ``throttled`` (``429`` responses),
+                ``server_errors`` (``5xx`` responses), ``decreases`` (times the limits were cut),
+                ``latency`` (smoothed seconds per request), and ``wait_seconds`` (total time
+                requests spent waiting for the limiter)
+
+        Examples:
+            >>> RateLimiter().metrics()["www.nhl.com"]["rate"]
+            10.0
+        """
+        metrics = {}
+
+        for host, limit in self._hosts.items():
+            with limit.condition:
+                metrics[host] = {
+                    "rate": limit.rate,
+                    "concurrency": int(limit.concurrency),
+                    "in_flight": limit.in_flight,
+                    "requests": limit.requests,
+                    "throttled": limit.throttled,
+                    "server_errors": limit.server_errors,
+                    "decreases": limit.decreases,
+                    "latency": limit.latency,
+                    "wait_seconds": limit.wait_seconds,
+                }
+
+        return metrics
+
+
+# Limiter shared by every ChickenSession created with the default ``rate_limiter=True``
+_SHARED_RATE_LIMITER = RateLimiter()
+
 
 class ChickenHTTPAdapter(HTTPAdapter):
-    """Modified HTTPAdapter for managing requests timeouts and connection pooling."""
+    """Modified HTTPAdapter for managing requests timeouts, connection pooling, and rate limits."""
 
     def __init__(self, *args, **kwargs):
         """Initializes HTTPAdapter for managing requests timeouts."""
         self.timeout = kwargs.pop("timeout", 5)
+        self.rate_limiter: RateLimiter | None = kwargs.pop("rate_limiter", None)
 
         super().__init__(*args, **kwargs)
 
     def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
-        """Modifies the HTTPAdapter's send method to manage requests timeouts."""
+        """Modifies the HTTPAdapter's send method to manage requests timeouts and rate limits."""
         if timeout is None:
             timeout = self.timeout
-        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        host = urllib.parse.urlsplit(request.url).hostname if self.rate_limiter is not None else None
+
+        if self.rate_limiter is None or not self.rate_limiter.throttles(host):
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        self.rate_limiter.acquire(host)
+        start = time.monotonic()
+        statuses: list[int] = []
+        retry_after = None
+        failed = True
+
+        try:
+            response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+            failed = False
+
+            # urllib3 retries 429s and 5xx responses internally, so read their statuses from its history
+            retries = getattr(response.raw, "retries", None)
+            statuses = [attempt.status for attempt in getattr(retries, "history", ()) if attempt.status]
+            statuses.append(response.status_code)
+
+            if response.status_code == 429:
+                try:
+                    retry_after = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    retry_after = None
+
+            return response
+
+        finally:
+            self.rate_limiter.release(host, statuses, time.monotonic() - start, failed=failed, retry_after=retry_after)
 
 
 class ChickenSession(requests.Session):
@@ -87,10 +384,35 @@ class ChickenSession(requests.Session):
         10 pool connections, 150 pool maxsize — suitable for concurrent
         scraping across multiple threads.
 
+    Rate limiting:
+        Requests to ``api-web.nhle.com`` and ``www.nhl.com`` pass through a ``RateLimiter``,
+        which raises the request rate and concurrency while the host keeps up and backs off
+        on ``429``/``5xx`` responses or rising latency. By default every session shares one
+        limiter, so concurrent scrapers stay within the same budget.
+
     Headers:
         Chrome-compatible ``User-Agent``, ``Accept``, ``Accept-Encoding``,
         and ``Connection: keep-alive`` set by default.
 
+    Response cache (opt-in):
+        When ``cache_dir`` is set, successful ``GET`` responses are stored on disk as
+        gzip-compressed bodies keyed by a hash of the URL, alongside their ``ETag`` and
+        ``Last-Modified`` headers. Cached URLs are revalidated with a conditional request
+        and served from disk on ``304 Not Modified``. URLs marked as settled with
+        ``mark_settled`` (the ``Game`` object does this for games that ended more than
+        ``cache_settle_days`` ago) are served from disk without touching the network.
+
+    Parameters:
+        cache_dir (str | Path | None):
+            Directory for the on-disk response cache. Created if it does not exist.
+            Default ``None`` (no caching).
+        cache_settle_days (int):
+            Number of days after a game's start before its reports are treated as final
+            and served from the cache without revalidation. Default ``7``.
+        rate_limiter (RateLimiter | bool):
+            Limiter for requests to NHL hosts. ``True`` (default) uses the limiter shared by all
+            sessions, ``False`` disables rate limiting, and a ``RateLimiter`` uses its settings.
+
     Examples:
         >>> from chickenstats.utilities import ChickenSession
         >>> with ChickenSession() as session:
@@ -100,12 +422,21 @@ class ChickenSession(requests.Session):
 
         >>> session = ChickenSession()
         >>> session.update_headers({"Accept-Language": "en-US"})
+
+        Cache responses on disk between runs:
+
+        >>> session = ChickenSession(cache_dir="./nhl_cache")
     """
 
-    def __init__(self):
+    def __init__(
+        self, cache_dir: str | Path | None = None, cache_settle_days: int = 7, rate_limiter: RateLimiter | bool = True
+    ):
         """Initializes Requests Session object."""
         super().__init__()
 
+        if cache_settle_days < 0:
+            raise InvalidInputError(f"cache_settle_days must be 0 or greater, got {cache_settle_days!r}")
+
         retry = urllib3.Retry(
             total=5,
             backoff_factor=1,
@@ -117,8 +448,17 @@ class ChickenSession(requests.Session):
         connect_timeout = 3.05
         read_timeout = 15
 
+        if rate_limiter is True:
+            rate_limiter = _SHARED_RATE_LIMITER
+
+        self.rate_limiter: RateLimiter | None = rate_limiter or None
+
         adapter = ChickenHTTPAdapter(
-            max_retries=retry, timeout=(connect_timeout, read_timeout), pool_connections=10, pool_maxsize=150
+            max_retries=retry,
+            timeout=(connect_timeout, read_timeout),
+            pool_connections=10,
+            pool_maxsize=150,
+            rate_limiter=self.rate_limiter,
         )
 
         self.mount("http://", adapter)
@@ -133,10 +473,136 @@ class ChickenSession(requests.Session):
             }
         )
 
+        self.cache_dir: Path | None = Path(cache_dir) if cache_dir is not None else None
+        self.cache_settle_days: int = cache_settle_days
+        self._settled_urls: set[str] = set()
+
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
     def update_headers(self, headers: dict) -> None:
         """Updates session headers dynamically."""
         self.headers.update(headers)
 
+    def get(self, url, params=None, **kwargs) -> requests.Response:
+        """Sends a GET request, serving and storing the response through the on-disk cache if enabled."""
+        if self.cache_dir is None or kwargs.get("stream"):
+            return super().get(url, params=params, **kwargs)
+
+        if params:
+            url = cast(str, requests.Request("GET", url, params=params).prepare().url)
+
+        meta_path, body_path = self._cache_paths(url)
+        meta = self._read_cache_meta(meta_path, body_path)
+
+        if meta is not None and (meta["settled"] or url in self._settled_urls):
+            return self._cached_response(url, meta, body_path)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = super().get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta is not None:
+            return self._cached_response(url, meta, body_path)
+
+        if response.status_code == 200:
+            self._write_cache(url, response, meta_path, body_path)
+
+        return response
+
+    def mark_settled(self, urls: Iterable[str]) -> None:
+        """Mark cached URLs as final, so they are served from disk without revalidation.
+
+        URLs that are not cached yet are remembered for the life of the session and stored
+        as settled once downloaded.
+
+        Parameters:
+            urls (Iterable[str]):
+                URLs whose content will no longer change, e.g., reports for a completed game.
+        """
+        if self.cache_dir is None:
+            return
+
+        for url in urls:
+            self._settled_urls.add(url)
+
+            meta_path, body_path = self._cache_paths(url)
+            meta = self._read_cache_meta(meta_path, body_path)
+
+            if meta is not None and not meta["settled"]:
+                meta["settled"] = True
+                self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        """Return the metadata and body paths for ``url`` inside the cache directory."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        directory = cast(Path, self.cache_dir) / key[:2]
+
+        return directory / f"{key}.json", directory / f"{key}.gz"
+
+    @staticmethod
+    def _read_cache_meta(meta_path: Path, body_path: Path) -> dict | None:
+        """Return the stored metadata for a cache entry, or None if it is missing or unreadable."""
+        if not body_path.exists():
+            return None
+
+        try:
+            return json.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _cached_response(url: str, meta: dict, body_path: Path) -> requests.Response:
+        """Rebuild a ``requests.Response`` from a cache entry."""
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200
+        response.encoding = meta.get("encoding")
+        response._content = gzip.decompress(body_path.read_bytes())
+
+        if meta.get("content_type"):
+            response.headers["Content-Type"] = meta["content_type"]
+
+        return response
+
+    def _write_cache(self, url: str, response: requests.Response, meta_path: Path, body_path: Path) -> None:
+        """Store a successful response in the cache, logging and skipping on file-system errors."""
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "encoding": response.encoding,
+            "fetched_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "settled": url in self._settled_urls,
+        }
+
+        try:
+            meta_path.parent.mkdir(exist_ok=True)
+            self._atomic_write(body_path, gzip.compress(response.content, compresslevel=6))
+            self._atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+        except OSError:
+            logger.warning("Failed to cache response for %s", url, exc_info=True)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        """Write ``data`` to ``path`` via a temporary file, so concurrent readers never see partial files."""
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
 
 class ScrapeSpeedColumn(ProgressColumn):
     """Rich progress column that renders scrape throughput.
@@ -0,0 +1,73 @@
+"""Season-scale benchmark for ``prep_oi``, the on-ice stats aggregation.
+
+Scrapes the offline mock game once, then replicates its play-by-play and extended
+play-by-play into a full regular season of distinct game IDs before timing ``prep_oi``
+with the split options used by ``Scraper.prep_stats``.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_prep_oi.py --games 1312 --repeat 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "tests_chicken_nhl"))
+
+from test_mock_scraper import mock_session_get  # noqa: E402
+
+from chickenstats.chicken_nhl import Scraper  # noqa: E402
+from chickenstats.chicken_nhl._aggregation import prep_oi  # noqa: E402
+
+CASES = {
+    "game": {"level": "game"},
+    "game, score": {"level": "game", "score": True},
+    "season, teammates + opposition": {"level": "season", "teammates": True, "opposition": True},
+}
+
+
+def season_frames(games: int) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Return play-by-play and extended play-by-play for ``games`` copies of the mock game."""
+    with patch("requests.Session.get", mock_session_get):
+        scraper = Scraper(2023020001, disable_progress_bar=True)
+        pbp, ext = scraper.play_by_play, scraper.play_by_play_ext
+
+    offsets = pl.DataFrame({"offset": range(games)}, schema={"offset": pl.Int64})
+
+    pbp = (
+        offsets.join(pbp, how="cross")
+        .with_columns(game_id=pl.col("game_id") + pl.col("offset"), id=pl.col("id") + pl.col("offset") * 10_000)
+        .drop("offset")
+    )
+    ext = offsets.join(ext, how="cross").with_columns(id=pl.col("id") + pl.col("offset") * 10_000).drop("offset")
+
+    return pbp, ext
+
+
+def main() -> None:
+    """Time each case and print the best of ``--repeat`` runs."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1312, help="number of games in the synthetic season")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the fastest is reported")
+    args = parser.parse_args()
+
+    pbp, ext = season_frames(args.games)
+    print(f"{args.games} games, {pbp.height:,} events")
+
+    for name, options in CASES.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            oi_stats = prep_oi(pbp, ext, **options)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{name:<34} {min(timings):8.3f}s  {oi_stats.height:>9,} rows")
+
+
+if __name__ == "__main__":
+    main()
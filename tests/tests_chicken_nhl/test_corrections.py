@@ -1,5 +1,9 @@
+import copy
+import json
+
 import pytest
 
+from chickenstats.chicken_nhl import _corrections
 from chickenstats.chicken_nhl._corrections import (
     api_events_fixes,
     api_rosters_fixes,
@@ -7,8 +11,10 @@ from chickenstats.chicken_nhl._corrections import (
     html_rosters_fixes,
     html_shifts_fixes,
     individual_shifts_fixes,
+    load_corrections,
     rosters_fixes,
 )
+from chickenstats.exceptions import InvalidInputError
 
 
 # ---------------------------------------------------------------------------
@@ -522,3 +528,90 @@ class TestHtmlShiftsFixes:
         result = html_shifts_fixes(2020020860, 20202021, "R", existing, actives, {})
         assert result[0]["player_name"] == "EXISTING"
         assert len(result) > 1
+
+
+# ---------------------------------------------------------------------------
+# corrections_digest
+# ---------------------------------------------------------------------------
+
+
+class TestCorrectionsDigest:
+    def test_uncorrected_game_has_no_digest(self):
+        from chickenstats.chicken_nhl._result_cache import corrections_digest
+
+        assert corrections_digest(2023020001) == "none"
+
+    def test_corrected_games_have_distinct_digests(self):
+        from chickenstats.chicken_nhl._result_cache import corrections_digest
+
+        digests = {corrections_digest(game_id) for game_id in (2010021176, 2019020665, 2020020860)}
+        assert "none" not in digests
+        assert len(digests) == 3
+
+    def test_digest_with_all_events_and_indexed_corrections(self, isolated_registry):
+        from chickenstats.chicken_nhl._result_cache import corrections_digest
+
+        before = corrections_digest(2012020660)
+        load_corrections({"html_events": {"2012020660": {"*": [["replace", "time", "-1", "1"]]}}})
+        assert corrections_digest(2012020660) not in ("none", before)
+
+
+# ---------------------------------------------------------------------------
+# load_corrections
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Restore the correction registry after tests that merge corrections."""
+    monkeypatch.setattr(_corrections, "_REGISTRY", copy.deepcopy(_corrections._REGISTRY))
+    monkeypatch.setattr(_corrections, "_LOADED_CORRECTIONS", [])
+
+
+class TestLoadCorrections:
+    def test_new_game_corrections_applied(self, isolated_registry):
+        load_corrections({"api_events": {"2023020001": {"12": [["set", "player_1_api_id", 8478402]]}}})
+        event = api_events_fixes(2023020001, {"event_idx": 12, "player_1_api_id": 1})
+        assert event["player_1_api_id"] == 8478402
+
+    def test_merge_keeps_other_events_of_game(self, isolated_registry):
+        load_corrections({"api_events": {"2014020120": {"661": [["set", "player_3_api_id", 1]]}}})
+        assert api_events_fixes(2014020120, {"event_idx": 661})["player_3_api_id"] == 1
+        assert api_events_fixes(2014020120, {"event_idx": 720, "player_1_api_id": 5})["player_3_api_id"] == 5
+
+    def test_load_from_file(self, isolated_registry, tmp_path):
+        path = tmp_path / "corrections.json"
+        path.write_text(json.dumps({"rosters": {"2023020001": {"NSH9": [["set", "api_id", 8475798]]}}}))
+        load_corrections(path)
+        assert rosters_fixes(2023020001, {"team_jersey": "NSH9", "api_id": None})["api_id"] == 8475798
+        assert _corrections.loaded_corrections() == (json.loads(path.read_text()),)
+
+    def test_loaded_corrections_change_digest(self, isolated_registry):
+        from chickenstats.chicken_nhl._result_cache import corrections_digest
+
+        load_corrections({"html_rosters": {"2023020001": {"ROMAN JOSI": [["set", "status", "SCRATCH"]]}}})
+        assert corrections_digest(2023020001) != "none"
+
+    def test_match_skips_remaining_operations(self, isolated_registry):
+        load_corrections(
+            {"individual_shifts": {"2023020001": {"A B": [["match", "period", "2"], ["set", "period", "1"]]}}}
+        )
+        assert individual_shifts_fixes(2023020001, "A B", {"period": "3"})["period"] == "3"
+        assert individual_shifts_fixes(2023020001, "A B", {"period": "2"})["period"] == "1"
+
+    @pytest.mark.parametrize(
+        "corrections",
+        [
+            {"player_events": {"2023020001": {}}},
+            {"api_events": {"not-a-game": {}}},
+            {"api_events": {"2023020001": {"1": [["rename", "a", "b"]]}}},
+            {"api_events": {"2023020001": {"1": [["set", "a"]]}}},
+            {"api_events": {"2023020001": {"1": ["set", "a", 1]}}},
+        ],
+    )
+    def test_invalid_corrections_raise(self, isolated_registry, corrections):
+        with pytest.raises(InvalidInputError):
+            load_corrections(corrections)
+
+    def test_packaged_registry_matches_kinds(self):
+        assert set(_corrections._REGISTRY) == {*_corrections._RECORD_KINDS, *_corrections._ADDITION_KINDS}
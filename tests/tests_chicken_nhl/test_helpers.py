@@ -5,10 +5,17 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from chickenstats.chicken_nhl._game_pbp import _D1_VERTICES, _D2_VERTICES, _points_in_polygon
 from chickenstats.chicken_nhl._game_utils import (
+    _get_score_adjustments,
     _return_name_html as return_name_html,
+    aggregate_players,
     calculate_score_adjustment,
+    hs_strip_html,
     load_score_adjustments,
+    lxml_shift_cells,
+    lxml_strip_html,
+    season_and_session,
 )
 from chickenstats.utilities.utilities import convert_to_list
 from chickenstats.utilities.utilities import charts_directory, data_directory, norm_coords
@@ -54,6 +61,94 @@ def test_return_name_html():
     assert isinstance(name, str) is True
 
 
+def test_lxml_strip_html_matches_beautifulsoup():
+    import re
+
+    from bs4 import BeautifulSoup
+
+    content = Path("./tests/tests_chicken_nhl/mock_data/events.html").read_bytes()
+    soup = BeautifulSoup(content.decode("ISO-8859-1"), "lxml")
+
+    expected = hs_strip_html(soup.find_all("td", {"class": re.compile(".*bborder.*")}))
+
+    assert lxml_strip_html(content) == expected
+
+
+def test_lxml_strip_html_empty_page():
+    assert lxml_strip_html(b"") == []
+
+
+def test_get_score_adjustments_loads_once():
+    assert _get_score_adjustments() is _get_score_adjustments()
+    assert not hasattr(lxml_strip_html, "cache_info")
+
+
+@pytest.mark.parametrize("report", ["shifts_home.html", "shifts_away.html"])
+def test_lxml_shift_cells_matches_beautifulsoup(report):
+    from bs4 import BeautifulSoup
+
+    content = Path(f"./tests/tests_chicken_nhl/mock_data/{report}").read_bytes()
+    soup = BeautifulSoup(content.decode("ISO-8859-1"), "lxml", multi_valued_attributes=None)
+
+    team_name = soup.find("td", {"align": "center", "class": "teamHeading + border"}).get_text()
+    cells = [td.get_text() for td in soup.find_all("td", {"class": ["playerHeading + border", "lborder + bborder"]})]
+
+    assert lxml_shift_cells(content) == (team_name, cells)
+
+
+def test_lxml_shift_cells_empty_page():
+    assert lxml_shift_cells(b"") == (None, [])
+
+
+# ---------------------------------------------------------------------------
+# aggregate_players / _points_in_polygon
+# ---------------------------------------------------------------------------
+
+
+def test_aggregate_players_buckets_and_order():
+    """Players are bucketed by position; ALL is ordered D, G, other positions, then by API ID."""
+    players = [
+        {"team_jersey": "NSH35", "player_name": "GOALIE", "eh_id": "G", "api_id": 3, "position": "G"},
+        {"team_jersey": "NSH59", "player_name": "DMAN", "eh_id": "D", "api_id": 1, "position": "D"},
+        {"team_jersey": "NSH9", "player_name": "WINGER", "eh_id": "W", "api_id": 5, "position": "L"},
+        {"team_jersey": "NSH14", "player_name": "CENTER", "eh_id": "C", "api_id": 2, "position": "C"},
+    ]
+
+    agg = aggregate_players(players)
+
+    assert agg["ALL"]["names"] == ["DMAN", "GOALIE", "CENTER", "WINGER"]
+    assert agg["ALL"]["api_ids"] == ["1", "3", "2", "5"]
+    assert agg["F"]["count"] == 2
+    assert agg["F"]["jerseys"] == ["NSH14", "NSH9"]
+    assert agg["G"]["names"] == ["GOALIE"]
+
+
+def test_aggregate_players_empty():
+    """An empty ice state yields empty buckets."""
+    agg = aggregate_players([])
+
+    assert set(agg) == {"ALL", "F", "D", "G"}
+    assert all(bucket["count"] == 0 and bucket["names"] == [] for bucket in agg.values())
+
+
+def test_points_in_polygon_danger_zones():
+    """The vectorized ray cast flags points inside either danger polygon."""
+    px = np.array([60, -60, 0, 80, 60])
+    py = np.array([15, -15, 0, 30, 0])
+
+    inside = _points_in_polygon(px, py, _D1_VERTICES) | _points_in_polygon(px, py, _D2_VERTICES)
+
+    assert inside.tolist() == [True, True, False, False, True]
+
+
+@pytest.mark.parametrize(
+    "game_id, expected", [(2023020001, (20232024, "R")), (2023030411, (20232024, "P")), (2010010005, (20102011, "PR"))]
+)
+def test_season_and_session(game_id, expected):
+    """The season and session are read from the game ID."""
+    assert season_and_session(game_id) == expected
+
+
 # ---------------------------------------------------------------------------
 # calculate_score_adjustment
 # ---------------------------------------------------------------------------
@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 from unittest.mock import patch
@@ -95,6 +96,228 @@ class TestMockScraper:
         assert isinstance(team_stats, pl.DataFrame)
         assert len(team_stats) > 0
 
+    def test_mock_scraper_single_plan_stats_match(self):
+        """Stats collected from one query plan, eagerly or streamed, match the step-by-step merge."""
+        from polars.testing import assert_frame_equal
+
+        from chickenstats.chicken_nhl import prep_ind, prep_oi, prep_stats
+        from chickenstats.chicken_nhl._aggregation import _merge_stats
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pbp, ext = scraper.play_by_play, scraper.play_by_play_ext
+        options = {"level": "game", "score": True, "teammates": True, "opposition": True}
+
+        expected = _merge_stats(prep_ind(pbp, **options), prep_oi(pbp, ext, **options))
+
+        assert_frame_equal(prep_stats(pbp, ext, **options), expected, check_row_order=False)
+        assert_frame_equal(prep_stats(pbp, ext, streaming=True, **options), expected, check_row_order=False)
+        assert_frame_equal(scraper.prep_stats(**options).stats, expected, check_row_order=False)
+        assert_frame_equal(scraper.ind_stats, prep_ind(pbp, **options), check_row_order=False)
+        assert_frame_equal(scraper.oi_stats, prep_oi(pbp, ext, **options), check_row_order=False)
+
+    @pytest.mark.parametrize("opposition", [False, True])
+    def test_mock_scraper_rolled_up_levels_match(self, opposition):
+        """Stats rolled up from the finest level match stats aggregated directly at each level."""
+        from polars.testing import assert_frame_equal
+
+        from chickenstats.chicken_nhl import prep_lines, prep_stats, prep_team_stats
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pbp, ext = scraper.play_by_play, scraper.play_by_play_ext
+        levels = ["period", "game", "session", "season"]
+
+        stats = scraper.stats_by_level(levels=levels, score=True, opposition=opposition)
+        lines = scraper.lines_by_level(position="d", levels=levels, opposition=opposition)
+        team_stats = scraper.team_stats_by_level(levels=levels, score=True, opposition=opposition)
+
+        for level in levels:
+            expected = prep_stats(pbp, ext, level=level, score=True, opposition=opposition)
+            assert_frame_equal(stats[level], expected, check_row_order=False)
+
+            expected = prep_lines(pbp, ext, position="d", level=level, opposition=opposition)
+            assert_frame_equal(lines[level], expected, check_row_order=False)
+
+            expected = prep_team_stats(pbp, ext, level=level, score=True, opposition=opposition)
+            assert_frame_equal(team_stats[level], expected, check_row_order=False)
+
+        # Cached period-level ind_stats and oi_stats are rolled up without re-aggregating the play-by-play
+        scraper.prep_stats(level="period", score=True, opposition=opposition)
+        with patch("chickenstats.chicken_nhl._scraper_stats.prep_stats_levels") as prep_stats_levels:
+            rolled_up = scraper.stats_by_level(levels=["game", "season"], score=True, opposition=opposition)
+
+        prep_stats_levels.assert_not_called()
+        assert_frame_equal(rolled_up["season"], stats["season"], check_row_order=False)
+
+    def test_mock_scraper_stats_by_level_invalid_levels(self):
+        """Unknown aggregation levels are rejected."""
+        from chickenstats.chicken_nhl import prep_stats_levels
+        from chickenstats.exceptions import InvalidInputError
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+
+        with pytest.raises(InvalidInputError):
+            scraper.stats_by_level(levels=["week"])
+
+        with pytest.raises(InvalidInputError):
+            prep_stats_levels(scraper.play_by_play, levels=["game", "week"])
+
+    def test_mock_scraper_stats_cache_reuses_configurations(self):
+        """Switching back to an earlier aggregation reuses its cached frames until add_games."""
+        from chickenstats.utilities.enums import AggLevel
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+
+        game_stats = scraper.prep_stats(level="game").stats
+        scraper.prep_stats(level="season", score=True)
+        game_lines = scraper.prep_lines(position="f").lines
+        scraper.prep_lines(position="d")
+        game_team_stats = scraper.prep_team_stats(level="game").team_stats
+        scraper.prep_team_stats(level="season")
+
+        with (
+            patch.object(Scraper, "_prep_stats") as prep_stats,
+            patch.object(Scraper, "_prep_lines") as prep_lines,
+            patch.object(Scraper, "_prep_team_stats") as prep_team_stats,
+        ):
+            assert scraper.prep_stats(level=AggLevel.GAME).stats is game_stats
+            assert scraper.prep_lines(position="f").lines is game_lines
+            assert scraper.prep_team_stats(level="game").team_stats is game_team_stats
+
+        prep_stats.assert_not_called()
+        prep_lines.assert_not_called()
+        prep_team_stats.assert_not_called()
+        assert len(scraper._stats_cache) == 6
+
+        # Cached game-level stats are rolled up to season level without re-aggregating the play-by-play
+        with patch("chickenstats.chicken_nhl._scraper_stats.prep_stats_levels") as prep_stats_levels:
+            scraper.prep_stats(level="season", score=True)
+            scraper.stats_by_level(levels=["season"])
+
+        prep_stats_levels.assert_not_called()
+
+    def test_mock_scraper_add_games_keeps_stats(self):
+        """Stats prepared before add_games are kept, and only the added games are aggregated."""
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+
+        stats = scraper.prep_stats(level="season").stats
+        lines = scraper.prep_lines(level="season").lines
+        team_stats = scraper.prep_team_stats(level="season").team_stats
+
+        scraper.add_games(2023020002)
+
+        # The added game fails to scrape, so there is nothing new to aggregate
+        with (
+            pytest.warns(UserWarning),
+            patch.object(Scraper, "_prep_stats") as prep_stats,
+            patch("chickenstats.chicken_nhl._scraper_stats._update_stats") as update_stats,
+        ):
+            assert scraper.stats is stats
+
+        prep_stats.assert_not_called()
+        update_stats.assert_not_called()
+        assert scraper._stats_levels.game_ids == frozenset({2023020001})
+
+        with patch.object(Scraper, "_prep_lines") as prep_lines, patch.object(Scraper, "_prep_team_stats") as prep_team:
+            assert scraper.lines is lines
+            assert scraper.team_stats is team_stats
+
+        prep_lines.assert_not_called()
+        prep_team.assert_not_called()
+
+    @pytest.mark.parametrize("level", ["period", "game", "session", "season"])
+    @pytest.mark.parametrize("opposition", [False, True])
+    def test_mock_scraper_incremental_stats_match(self, level, opposition):
+        """Adding play-by-play to existing stats matches aggregating all of it at once."""
+        from polars.testing import assert_frame_equal
+
+        from chickenstats.chicken_nhl import prep_ind, prep_lines, prep_oi, prep_stats, prep_team_stats
+        from chickenstats.chicken_nhl._aggregation import (
+            _RESUMMED_LEVELS,
+            _TEAM_DERIVED_TOTALS,
+            _collect_rated,
+            _join_play_by_play_ext,
+            _prep_lines_plan,
+            _prep_team_stats_plan,
+            _update_rated,
+            _update_stats,
+        )
+        from chickenstats.chicken_nhl.validation_polars import line_stats_pandera_polars, team_stats_pandera_polars
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pbp, ext = scraper.play_by_play, scraper.play_by_play_ext
+
+        # Later periods stand in for games added after the earlier ones were aggregated
+        old, new = pbp.filter(pl.col("period") < 3), pbp.filter(pl.col("period") >= 3)
+        options = {"level": level, "score": True, "opposition": opposition}
+
+        ind_stats, oi_stats, stats = _update_stats(
+            prep_ind(old, **options), prep_oi(old, ext, **options), prep_stats(old, ext, **options), new, ext, **options
+        )
+
+        assert_frame_equal(ind_stats, prep_ind(pbp, **options), check_row_order=False)
+        assert_frame_equal(oi_stats, prep_oi(pbp, ext, **options), check_row_order=False)
+        assert_frame_equal(stats, prep_stats(pbp, ext, **options), check_row_order=False)
+
+        # Game-level line and team rows are appended for new games, which periods of one game cannot stand in for
+        if level == "game":
+            return
+
+        def lines_totals(df):
+            return _prep_lines_plan(_join_play_by_play_ext(df, ext), position="d", rates=False, **options)
+
+        lines, totals = _collect_rated(lines_totals(old), line_stats_pandera_polars, keep_totals=True)
+        lines, _ = _update_rated(lines, totals, lines_totals(new).collect(), level, line_stats_pandera_polars)
+
+        assert_frame_equal(lines, prep_lines(pbp, ext, position="d", **options), check_row_order=False)
+
+        # Team stats split by opposition are aggregated again at the session and season levels
+        if opposition and level in _RESUMMED_LEVELS:
+            return
+
+        def team_totals(df):
+            return _prep_team_stats_plan(_join_play_by_play_ext(df, ext), rates=False, **options)
+
+        team_stats, totals = _collect_rated(team_totals(old), team_stats_pandera_polars, keep_totals=True)
+        team_stats, _ = _update_rated(
+            team_stats, totals, team_totals(new).collect(), level, team_stats_pandera_polars, _TEAM_DERIVED_TOTALS
+        )
+
+        assert_frame_equal(team_stats, prep_team_stats(pbp, ext, **options), check_row_order=False)
+
+    def test_mock_scraper_stats_cache_eviction(self):
+        """The stats cache evicts least recently used entries beyond its entry and memory bounds."""
+        from chickenstats.chicken_nhl._stats_cache import StatsCache
+        from chickenstats.exceptions import InvalidInputError
+
+        frame = pl.DataFrame({"toi": [1.0] * 100})
+        size = frame.estimated_size()
+
+        cache = StatsCache(max_entries=2)
+        cache.put("a", (frame,))
+        cache.put("b", (frame,))
+        cache.get("a")
+        cache.put("c", (frame,))
+
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.nbytes == 2 * size
+
+        cache = StatsCache(max_entries=8, max_bytes=2 * size)
+        cache.put("a", (frame,))
+        cache.put("b", (frame, frame))
+
+        assert "a" not in cache and "b" in cache
+
+        cache.put("c", (frame, frame, frame))
+
+        assert "c" not in cache and "b" in cache
+
+        cache.clear()
+
+        assert len(cache) == 0 and cache.nbytes == 0
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], stats_cache_size=-1)
+
     @pytest.mark.skipif(not HAS_PANDAS, reason="pandas not installed")
     def test_mock_scraper_pandas_backend(self):
         """Test Scraper with pandas backend."""
@@ -111,3 +334,500 @@ class TestMockScraper:
 
         assert len(pbp) == 0
         assert 9999999999 in scraper.failed_games
+
+    def test_mock_scraper_concurrent_matches_sequential(self):
+        """Scraping with a thread pool stores the same data, in the same order, as a sequential scrape."""
+        game_ids = [2023020001, 9999999999]
+
+        sequential = Scraper(game_ids=game_ids, disable_progress_bar=True)
+        concurrent = Scraper(game_ids=game_ids, disable_progress_bar=True, max_workers=4)
+
+        assert concurrent.play_by_play.equals(sequential.play_by_play)
+        assert concurrent.shifts.equals(sequential.shifts)
+        assert concurrent.failed_games == sequential.failed_games
+        assert 9999999999 in concurrent.failed_games
+
+    def test_mock_scraper_concurrent_preserves_order(self):
+        """Results are yielded in game_ids order even when later games finish first."""
+        import time
+
+        game_ids = [2023020001, 2023020002, 2023020003, 2023020004, 2023020005]
+        scraper = Scraper(game_ids=game_ids, disable_progress_bar=True, max_workers=3)
+
+        def fake_scrape_single_game(game_id, scrape_type):
+            time.sleep((game_ids[-1] - game_id) * 0.01)
+            return {"game_id": game_id}
+
+        with patch.object(scraper, "_scrape_single_game", side_effect=fake_scrape_single_game):
+            results = list(scraper._iter_scrape_results(game_ids, "api_events", max_workers=3))
+
+        assert [game_id for game_id, _ in results] == game_ids
+
+    def test_mock_scraper_invalid_max_workers(self):
+        """max_workers below 1 is rejected at instantiation."""
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], max_workers=0)
+
+    def test_mock_scraper_parse_workers_matches_sequential(self):
+        """Downloading on threads and parsing in a process pool stores the same data as a sequential scrape."""
+        game_ids = [2023020001, 9999999999]
+
+        sequential = Scraper(game_ids=game_ids, disable_progress_bar=True)
+        pipelined = Scraper(game_ids=game_ids, disable_progress_bar=True, max_workers=2, parse_workers=1)
+
+        assert pipelined.play_by_play.equals(sequential.play_by_play)
+        assert pipelined.shifts.equals(sequential.shifts)
+        assert pipelined.failed_games == sequential.failed_games
+
+    def test_mock_scraper_invalid_parse_workers(self):
+        """Negative parse_workers is rejected at instantiation."""
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], parse_workers=-1)
+
+    def test_mock_scraper_scrape_metrics_records_stages(self):
+        """Each Game pipeline stage is timed, with bytes for downloads and rows for the records produced."""
+        records = []
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, metrics_hook=records.append)
+        pbp = scraper.play_by_play
+
+        metrics = scraper.scrape_metrics
+        stages = set(metrics["stage"])
+
+        assert {"fetch_api", "fetch_html_events", "fetch_shifts", "merge", "state", "validate", "xg"} <= stages
+        assert {"munge_html_events", "munge_shifts", "munge_changes", "to_frame"} <= stages
+        assert metrics.filter(pl.col("stage").str.starts_with("fetch_"))["bytes"].min() > 0
+        assert metrics.filter(pl.col("stage") == "validate")["rows"].item() == pbp.height
+        assert (metrics["seconds"] >= 0).all()
+        assert len(records) == metrics.height
+
+    def test_mock_game_prebuilt_frames_record_no_to_frame_stage(self):
+        """Returning an already-built frame adds no stage records, however often it is accessed."""
+        from chickenstats.chicken_nhl import Game
+
+        game = Game(2023020001)
+        _ = game.play_by_play_df
+        recorded = len(game.stage_metrics)
+
+        _ = game.play_by_play_df
+        _ = game.xg_fields_df
+
+        assert len(game.stage_metrics) == recorded
+
+        _ = game.shifts_df
+        assert [record["stage"] for record in game.stage_metrics[recorded:]].count("to_frame") == 1
+
+    def test_mock_scraper_scrape_metrics_parse_workers(self, caplog):
+        """Downloads are timed once by the scraping threads, and parse stages come back from the process pool."""
+        with caplog.at_level("DEBUG", logger="chickenstats.chicken_nhl.metrics"):
+            scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, parse_workers=1)
+            _ = scraper.play_by_play
+
+        metrics = scraper.scrape_metrics
+
+        assert metrics.filter(pl.col("stage") == "fetch_api").height == 1
+        assert metrics.filter(pl.col("stage") == "fetch_shifts").height == 2
+        assert {"merge", "state", "validate", "xg"} <= set(metrics["stage"])
+        assert len([r for r in caplog.records if hasattr(r, "stage_metrics")]) == metrics.height
+
+    def test_mock_scraper_cache_dir_serves_completed_games_offline(self, tmp_path):
+        """A completed game cached by one Scraper is re-scraped by another without network access."""
+        first = Scraper(game_ids=[2023020001], disable_progress_bar=True, cache_dir=tmp_path)
+        pbp = first.play_by_play
+
+        with patch("requests.Session.get", side_effect=AssertionError("network used")):
+            second = Scraper(game_ids=[2023020001], disable_progress_bar=True, cache_dir=tmp_path)
+            assert second.play_by_play.equals(pbp)
+
+    def test_mock_scraper_game_cache_dir_skips_parsing(self, tmp_path):
+        """Processed frames cached by one Scraper are loaded by another without re-running the Game pipeline."""
+        first = Scraper(game_ids=[2023020001], disable_progress_bar=True, game_cache_dir=tmp_path)
+        pbp = first.play_by_play
+
+        with patch("chickenstats.chicken_nhl._scraper_core.Game", side_effect=AssertionError("game parsed")):
+            second = Scraper(game_ids=[2023020001], disable_progress_bar=True, game_cache_dir=tmp_path)
+            assert second.play_by_play.equals(pbp)
+            assert second.shifts.equals(first.shifts)
+
+    @pytest.mark.parametrize("parse_workers", [0, 1])
+    def test_mock_scraper_game_cache_skips_live_games(self, tmp_path, parse_workers):
+        """Games still in progress are scraped but not written to the processed-game cache."""
+        from chickenstats.chicken_nhl._result_cache import GameResultCache
+
+        def mock_live_session_get(self, url, *args, **kwargs):
+            response = mock_session_get(self, url, *args, **kwargs)
+            if "play-by-play" in url:
+                response._content = response._content.replace(b'"gameState":"OFF"', b'"gameState":"LIVE"')
+            return response
+
+        with patch("requests.Session.get", mock_live_session_get):
+            scraper = Scraper(
+                game_ids=[2023020001], disable_progress_bar=True, game_cache_dir=tmp_path, parse_workers=parse_workers
+            )
+            assert not scraper.play_by_play.is_empty()
+
+        assert GameResultCache(tmp_path).load(2023020001, ("play_by_play",)) is None
+
+    def test_mock_scraper_game_cache_invalidated_by_corrections(self, tmp_path):
+        """A change to a game's corrections invalidates its cached frames."""
+        from chickenstats.chicken_nhl._result_cache import GameResultCache
+
+        _ = Scraper(game_ids=[2023020001], disable_progress_bar=True, game_cache_dir=tmp_path).play_by_play
+
+        cache = GameResultCache(tmp_path)
+        assert cache.load(2023020001, ("play_by_play", "shifts")) is not None
+
+        with patch("chickenstats.chicken_nhl._result_cache.corrections_digest", return_value="changed"):
+            assert cache.load(2023020001, ("play_by_play",)) is None
+
+    def test_mock_scraper_html_parsers_match(self):
+        """The lxml and BeautifulSoup HTML parsers produce identical data."""
+        lxml_scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        bs4_scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, html_parser="bs4")
+
+        assert lxml_scraper.html_events.equals(bs4_scraper.html_events)
+        assert lxml_scraper.shifts.equals(bs4_scraper.shifts)
+        assert lxml_scraper.play_by_play.equals(bs4_scraper.play_by_play)
+
+    def test_mock_scraper_invalid_html_parser(self):
+        """Unknown html_parser values are rejected at instantiation."""
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], html_parser="html5lib")
+
+    def test_mock_scraper_validation_modes_match(self):
+        """Columnar Polars validation produces the same data as per-event Pydantic validation."""
+        polars_scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pydantic_scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, validation="pydantic")
+
+        assert polars_scraper.api_events.equals(pydantic_scraper.api_events)
+        assert polars_scraper.play_by_play.equals(pydantic_scraper.play_by_play)
+        assert polars_scraper.play_by_play_ext.equals(pydantic_scraper.play_by_play_ext)
+
+    def test_mock_scraper_invalid_validation(self):
+        """Unknown validation values are rejected at instantiation."""
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], validation="pandera")
+
+    def test_mock_scraper_build_xg_fields_matches(self):
+        """build_xg_fields rebuilds xg_fields from stored play-by-play, eagerly or lazily."""
+        from chickenstats.chicken_nhl import build_xg_fields
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pbp = scraper.play_by_play
+
+        assert build_xg_fields(pbp).equals(scraper.xg_fields)
+        assert build_xg_fields(pbp.lazy()).collect().equals(scraper.xg_fields)
+
+    def test_mock_scraper_build_xg_fields_multiple_games(self):
+        """Features never look back across games, whatever the input row order."""
+        from chickenstats.chicken_nhl import build_xg_fields
+
+        pbp = Scraper(game_ids=[2023020001], disable_progress_bar=True).play_by_play
+        second_game = pbp.with_columns(pl.col("game_id") + 1)
+
+        combined = build_xg_fields(pl.concat([second_game, pbp]).reverse())
+
+        assert combined.filter(pl.col("game_id") == 2023020001).equals(build_xg_fields(pbp))
+        assert (
+            combined.filter(pl.col("game_id") == 2023020002)
+            .drop("game_id")
+            .equals(build_xg_fields(pbp).drop("game_id"))
+        )
+
+    def test_mock_game_dict_views_match_frames(self):
+        """The list-of-dict properties are views of the same frames the Scraper collects."""
+        from chickenstats.chicken_nhl import Game
+        from chickenstats.chicken_nhl.validation_polars import (
+            pbp_ext_polars_schema,
+            pbp_polars_schema,
+            xg_polars_schema,
+        )
+
+        game = Game(2023020001)
+
+        assert pl.from_dicts(game.play_by_play, schema=pbp_polars_schema).equals(game.play_by_play_df)
+        assert pl.from_dicts(game.play_by_play_ext, schema=pbp_ext_polars_schema).equals(
+            game._frame("play_by_play_ext")
+        )
+        assert pl.from_dicts(game.xg_fields, schema=xg_polars_schema).equals(game.xg_fields_df)
+        assert game.play_by_play is game.play_by_play
+
+    def test_mock_scraper_retain_drops_other_outputs(self):
+        """Only retained outputs are stored; the rest raise instead of returning partial data."""
+        from chickenstats.exceptions import InvalidInputError
+
+        full = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        retained = Scraper(
+            game_ids=[2023020001], disable_progress_bar=True, retain={"play_by_play", "play_by_play_ext"}
+        )
+
+        assert retained.play_by_play.equals(full.play_by_play)
+        assert retained._shifts == [] and retained._api_events == []
+
+        with pytest.raises(InvalidInputError):
+            _ = retained.shifts
+
+        retained.prep_stats()
+        assert retained.stats.equals(full.prep_stats().stats)
+
+    def test_mock_scraper_invalid_retain(self):
+        """Unknown data types in retain are rejected at instantiation."""
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Scraper(game_ids=[2023020001], retain={"play_by_play", "box_score"})
+
+    def test_mock_scraper_unretained_output_raises_before_scraping(self):
+        """Reading an output that is not retained raises without downloading or parsing any game."""
+        from chickenstats.exceptions import InvalidInputError
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, retain={"play_by_play"})
+
+        with patch.object(Scraper, "_scrape", side_effect=AssertionError("games scraped")):
+            with pytest.raises(InvalidInputError):
+                _ = scraper.shifts
+
+            with pytest.raises(InvalidInputError):
+                _ = scraper.play_by_play_ext
+
+    def test_mock_scraper_spill_dir_matches_in_memory(self, tmp_path):
+        """Frames spilled to Arrow IPC files concatenate to the same data as in-memory frames."""
+        in_memory = Scraper(game_ids=[2023020001, 9999999999], disable_progress_bar=True)
+        spilled = Scraper(game_ids=[2023020001, 9999999999], disable_progress_bar=True, spill_dir=tmp_path)
+
+        assert spilled.play_by_play.equals(in_memory.play_by_play)
+        assert spilled.shifts.equals(in_memory.shifts)
+        assert all(path.exists() for path in spilled._play_by_play)
+        assert spilled.failed_games == in_memory.failed_games
+
+    def test_mock_scraper_spill_dir_removed_with_scraper(self, tmp_path):
+        """Spilled files are deleted once the Scraper is garbage collected."""
+        import gc
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True, spill_dir=tmp_path)
+        _ = scraper.play_by_play
+        spill_dir = scraper._spill_dir
+
+        del scraper, _
+        gc.collect()
+
+        assert not spill_dir.exists()
+
+    def test_mock_scraper_iter_games_matches_properties(self):
+        """iter_games yields each game's frames without storing them on the Scraper."""
+        full = Scraper(game_ids=[2023020001, 9999999999], disable_progress_bar=True)
+        streaming = Scraper(game_ids=[2023020001, 9999999999], disable_progress_bar=True)
+
+        with pytest.warns(UserWarning, match="Failed to scrape 1 game"):
+            games = list(streaming.iter_games(kinds=("play_by_play", "shifts")))
+
+        assert [game_id for game_id, _ in games] == [2023020001]
+        assert set(games[0][1]) == {"play_by_play", "shifts"}
+        assert games[0][1]["play_by_play"].equals(full.play_by_play)
+        assert games[0][1]["shifts"].equals(full.shifts)
+        assert streaming._play_by_play == [] and streaming._shifts == []
+        assert streaming.failed_games == [9999999999]
+
+    def test_mock_scraper_iter_games_invalid_kinds(self):
+        """Unknown or empty kinds are rejected before anything is scraped."""
+        from chickenstats.exceptions import InvalidInputError
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+
+        for kinds in (("play_by_play", "box_score"), ()):
+            with pytest.raises(InvalidInputError):
+                next(scraper.iter_games(kinds=kinds))
+
+    def test_mock_scraper_aiter_games_matches_iter_games(self):
+        """The async iterator yields the same games and frames as iter_games."""
+        import asyncio
+
+        scraper = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+
+        async def collect():
+            return [game async for game in scraper.aiter_games(kinds="shifts")]
+
+        games = asyncio.run(collect())
+        expected = list(scraper.iter_games(kinds="shifts"))
+
+        assert [game_id for game_id, _ in games] == [2023020001]
+        assert games[0][1]["shifts"].equals(expected[0][1]["shifts"])
+
+    def test_scrape_type_for_picks_fewest_downloads(self):
+        """The smallest scrape type that produces every requested kind is used."""
+        from chickenstats.chicken_nhl._scraper_core import _scrape_type_for
+
+        assert _scrape_type_for(["shifts"]) == "shifts"
+        assert _scrape_type_for(["api_rosters"]) == "api_rosters"
+        assert _scrape_type_for(["api_events", "api_rosters"]) == "api_events"
+        assert _scrape_type_for(["changes", "shifts"]) == "shifts"
+        assert _scrape_type_for(["play_by_play", "shifts"]) == "play_by_play"
+
+    def test_mock_scraper_to_dataset_round_trip(self, tmp_path):
+        """Data written with to_dataset loads back unchanged, whether streamed or already scraped."""
+        from chickenstats.chicken_nhl import load_dataset
+
+        streamed = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        streamed.to_dataset(tmp_path / "streamed", kinds=("play_by_play", "play_by_play_ext", "shifts"))
+        assert streamed._play_by_play == []
+
+        scraped = Scraper(game_ids=[2023020001], disable_progress_bar=True)
+        pbp = scraped.play_by_play
+        scraped.to_dataset(tmp_path / "scraped", kinds=("play_by_play", "play_by_play_ext", "shifts"))
+
+        assert (tmp_path / "scraped/play_by_play/season=20232024/session=R/game_id=2023020001/0.parquet").exists()
+
+        for root in ("streamed", "scraped"):
+            assert load_dataset(tmp_path / root).collect().equals(pbp)
+            assert load_dataset(tmp_path / root, "shifts").collect().equals(scraped.shifts)
+            ext = load_dataset(tmp_path / root, "play_by_play_ext").collect()
+            assert ext.drop("season", "session", "game_id").equals(scraped.play_by_play_ext)
+            assert ext["game_id"].unique().to_list() == [2023020001]
+
+    def test_mock_load_dataset_prunes_partitions(self, tmp_path):
+        """Filters on partition columns skip other games, and empty datasets load as empty frames."""
+        from chickenstats.chicken_nhl import load_dataset, write_dataset
+
+        pbp = Scraper(game_ids=[2023020001], disable_progress_bar=True).play_by_play
+        write_dataset(pbp, tmp_path)
+        write_dataset(pbp, tmp_path)  # rewriting a game replaces its file
+
+        assert load_dataset(tmp_path).collect().height == pbp.height
+        assert load_dataset(tmp_path).filter(pl.col("season") == 20222023).collect().is_empty()
+        assert load_dataset(tmp_path, "shifts").collect().is_empty()
+
+    def test_mock_write_dataset_invalid_input(self, tmp_path):
+        """Unknown data types and frames missing their columns are rejected."""
+        from chickenstats.chicken_nhl import load_dataset, write_dataset
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            write_dataset(pl.DataFrame({"game_id": [2023020001]}), tmp_path)
+
+        with pytest.raises(InvalidInputError):
+            load_dataset(tmp_path, "box_score")
+
+
+class TestMockBackfill:
+    @pytest.fixture
+    def schedule(self, monkeypatch):
+        """Season schedule with one scrapeable game, one game the mock API cannot serve, and one future game."""
+        from chickenstats.chicken_nhl.season import Season
+
+        schedule = pl.DataFrame({"game_id": [2023020001, 2023020002, 2023020003], "game_state": ["OFF", "OFF", "FUT"]})
+        monkeypatch.setattr(Season, "schedule", lambda self, *args, **kwargs: schedule)
+
+    def test_mock_backfill_writes_manifest_and_dataset(self, schedule, tmp_path):
+        """Completed games are written and recorded; failures are recorded with their error."""
+        from chickenstats.chicken_nhl import Backfill, load_dataset
+
+        backfill = Backfill(tmp_path, 2023, kinds=("play_by_play", "shifts"), disable_progress_bar=True)
+        manifest = backfill.run()
+
+        assert manifest["game_id"].to_list() == [2023020001, 2023020002]
+        assert manifest["status"].to_list() == ["complete", "failed"]
+        assert manifest["season"].to_list() == [20232024, 20232024]
+        assert manifest["error"][1] is not None
+        assert set(json.loads(manifest["hashes"][0])) == {"play_by_play", "shifts"}
+
+        assert backfill.completed_games == [2023020001]
+        assert backfill.failed_games == [2023020002]
+        assert load_dataset(tmp_path).collect().equals(Scraper(2023020001, disable_progress_bar=True).play_by_play)
+
+    def test_mock_backfill_resumes_from_manifest(self, schedule, tmp_path):
+        """A new run skips complete games, and retry_failed only retries failed ones."""
+        from chickenstats.chicken_nhl import Backfill
+
+        Backfill(tmp_path, 2023, disable_progress_bar=True).run()
+
+        # A run killed mid-write leaves a partial last line, which is ignored
+        with (tmp_path / "manifest.jsonl").open("a") as manifest:
+            manifest.write('{"game_id": 20230')
+
+        backfill = Backfill(tmp_path, [20232024], disable_progress_bar=True)
+        assert backfill.completed_games == [2023020001]
+
+        with patch.object(Scraper, "_scrape_single_game", return_value=None) as scrape:
+            backfill.retry_failed()
+
+        assert [call.args[0] for call in scrape.call_args_list] == [2023020002]
+        assert backfill.failed_games == [2023020002]
+
+    def test_mock_backfill_syncs_new_games_and_stats(self, schedule, tmp_path):
+        """Games already in the dataset are skipped, and game-level stats are written for new games."""
+        from chickenstats.chicken_nhl import Backfill, dataset_game_ids, load_dataset
+
+        scraper = Scraper(2023020001, disable_progress_bar=True)
+        scraper.to_dataset(tmp_path)
+        assert dataset_game_ids(tmp_path) == {2023020001}
+
+        with patch.object(Scraper, "_scrape_single_game", return_value=None) as scrape:
+            Backfill(tmp_path, 2023, disable_progress_bar=True).run()
+
+        assert [call.args[0] for call in scrape.call_args_list] == [2023020002]
+
+        backfill = Backfill(tmp_path, 2023, kinds=("play_by_play", "stats", "team_stats"), disable_progress_bar=True)
+        backfill.run()
+
+        assert backfill.completed_games == [2023020001]
+        assert dataset_game_ids(tmp_path, "stats") == {2023020001}
+        assert load_dataset(tmp_path, "stats").collect().equals(scraper.stats)
+
+        team_stats = load_dataset(tmp_path, "team_stats").collect()
+        assert team_stats.sort("team", "strength_state").equals(scraper.team_stats.sort("team", "strength_state"))
+
+    def test_mock_backfill_refresh_reprocesses_changed_games(self, schedule, tmp_path):
+        """Only games whose reports changed since they were written are re-processed."""
+        from chickenstats.chicken_nhl import Backfill
+        from chickenstats.exceptions import InvalidInputError
+
+        backfill = Backfill(tmp_path, 2023, game_cache_dir=tmp_path / "cache", disable_progress_bar=True)
+        backfill.run()
+
+        manifest = backfill.manifest
+        assert manifest["game_date"][0] == "2023-10-10"
+        assert json.loads(manifest["sources"][0]).keys() == {
+            "api_endpoint",
+            "html_rosters_endpoint",
+            "html_events_endpoint",
+            "home_shifts_endpoint",
+            "away_shifts_endpoint",
+        }
+
+        # Outside the window, or unchanged upstream
+        assert backfill.refresh(window_days=0) == []
+        assert backfill.refresh(window_days=100_000) == []
+
+        def edited_get(session, url, *args, **kwargs):
+            response = mock_session_get(session, url, *args, **kwargs)
+            if "PL020001" in url:
+                response._content = response._content.replace(b"</body>", b"<!-- edited --></body>")
+            return response
+
+        with patch("requests.Session.get", edited_get):
+            assert backfill.refresh(window_days=100_000) == [2023020001]
+
+        assert backfill.completed_games == [2023020001]
+        assert backfill.manifest["sources"][0] != manifest["sources"][0]
+        assert backfill.manifest["hashes"][0] == manifest["hashes"][0]
+
+        with pytest.raises(InvalidInputError):
+            backfill.refresh(window_days=-1)
+
+    def test_mock_backfill_invalid_input(self, tmp_path):
+        """Unknown data types and worker counts below 1 are rejected."""
+        from chickenstats.chicken_nhl import Backfill
+        from chickenstats.exceptions import InvalidInputError
+
+        with pytest.raises(InvalidInputError):
+            Backfill(tmp_path, 2023, kinds="box_score")
+
+        with pytest.raises(InvalidInputError):
+            Backfill(tmp_path, 2023, season_workers=0)
@@ -132,6 +132,27 @@ class TestCorrectPlayerName:
         assert len(result) == 2
         assert all(isinstance(x, str) for x in result)
 
+    # ------------------------------------------------------------------
+    # Memoization
+    # ------------------------------------------------------------------
+
+    def test_repeated_name_is_cache_hit(self):
+        correct_player_name.cache_clear()
+        first = correct_player_name("ROMAN JOSI", season=20232024, player_position="D", player_jersey="NSH59")
+        second = correct_player_name("ROMAN JOSI", season=20232024, player_position="D", player_jersey="NSH59")
+        assert first == second == ("ROMAN JOSI", "ROMAN.JOSI")
+        info = correct_player_name.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_duplicate_rule_uses_arguments_of_each_call(self):
+        _, forward = correct_player_name(
+            "ELIAS PETTERSSON", season=20232024, player_position="C", player_jersey="VAN40"
+        )
+        _, defender = correct_player_name(
+            "ELIAS PETTERSSON", season=20232024, player_position="D", player_jersey="VAN25"
+        )
+        assert (forward, defender) == ("ELIAS.PETTERSSON", "ELIAS.PETTERSSON2")
+
 
 # ---------------------------------------------------------------------------
 # Player class (network) — one fixture, shared across all tests
@@ -19,6 +19,7 @@ from chickenstats.chicken_nhl._validation_utils import (
     pydantic_to_pandera,
     pydantic_to_native_polars,
     validate_dataframe,
+    validate_records_columnar,
 )
 from chickenstats.exceptions import UnsupportedBackendError
 from chickenstats.chicken_nhl._validation_schema import (
@@ -28,7 +29,8 @@ from chickenstats.chicken_nhl._validation_schema import (
     polars_pandera_options,
     pandas_pandera_options,
 )
-from chickenstats.chicken_nhl.validation_pydantic import APIEvent, ChangeEvent, PBPEvent
+from chickenstats.chicken_nhl.validation_pydantic import APIEvent, ChangeEvent, PBPEvent, XGFields
+from chickenstats.chicken_nhl.validation_polars import xg_polars_schema
 
 _skip_no_pandas = pytest.mark.skipif(not HAS_PANDAS, reason="pandas not installed")
 
@@ -376,3 +378,60 @@ class TestValidateDataframe:
         assert isinstance(result, pl.DataFrame)
         assert "x" in result.columns
         assert "extra" not in result.columns
+
+
+# ---------------------------------------------------------------------------
+# validate_records_columnar
+# ---------------------------------------------------------------------------
+
+
+class TestValidateRecordsColumnar:
+    @pytest.fixture
+    def record(self) -> dict:
+        return {
+            "game_id": 2023020001,
+            "event_idx": 10,
+            "period": 1,
+            "period_seconds": 120,
+            "score_diff": 0,
+            "danger": 0,
+            "high_danger": 0,
+            "position": "F",
+            "shot_type": "WRIST",
+            "strength_state": "5v5",
+            "event_distance": 30.0,
+            "event_angle": 15.0,
+            "coords_x": 60.0,
+            "coords_y": -8.0,
+            "is_rebound": 0,
+            "rush_attempt": 0,
+            "is_scramble": 0,
+            "is_home": 1,
+            "abs_y_distance": 8.0,
+            "prior_face": 0,
+            "event": "SHOT",
+        }
+
+    def test_matches_pydantic(self, record: dict) -> None:
+        records = [record, {**record, "event_distance": 12, "strength_state": "5v4", "seconds_since_last": 4}]
+        result = validate_records_columnar(records, XGFields, xg_polars_schema)
+        assert result.columns == list(XGFields.model_fields)
+        assert result.to_dicts() == [XGFields.model_validate(r).model_dump() for r in records]
+
+    def test_empty_records(self) -> None:
+        result = validate_records_columnar([], XGFields, xg_polars_schema)
+        assert result.height == 0
+        assert result.columns == list(XGFields.model_fields)
+
+    def test_fractional_int_raises(self, record: dict) -> None:
+        with pytest.raises(ValueError):
+            validate_records_columnar([{**record, "period": 1.5}], XGFields, xg_polars_schema)
+
+    def test_int_for_str_raises(self, record: dict) -> None:
+        with pytest.raises(ValueError):
+            validate_records_columnar([{**record, "shot_type": 5}], XGFields, xg_polars_schema)
+
+    def test_missing_required_raises(self, record: dict) -> None:
+        del record["coords_x"]
+        with pytest.raises(ValueError):
+            validate_records_columnar([record], XGFields, xg_polars_schema)
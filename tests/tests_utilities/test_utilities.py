@@ -32,6 +32,7 @@ from chickenstats.utilities.utilities import (
     ChickenHTTPAdapter,
     ChickenProgress,
     ChickenSession,
+    RateLimiter,
     ScrapeSpeedColumn,
     _detect_backend,
     _to_polars,
@@ -65,6 +66,65 @@ def test_update_headers():
     assert session.headers["X-Custom"] == "test-value"
 
 
+def _fake_response(status_code, content=b"", headers=None):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+def test_session_cache_revalidates_with_etag(tmp_path):
+    """Cached URLs are revalidated with If-None-Match and served from disk on 304."""
+    session = ChickenSession(cache_dir=tmp_path)
+    url = "https://www.nhl.com/scores/htmlreports/20232024/PL020001.HTM"
+
+    fresh = _fake_response(200, b"<html>events</html>", {"ETag": '"abc"'})
+    with patch("requests.Session.get", return_value=fresh) as mock_get:
+        assert session.get(url).content == b"<html>events</html>"
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+    with patch("requests.Session.get", return_value=_fake_response(304)) as mock_get:
+        response = session.get(url)
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+    assert response.status_code == 200
+    assert response.content == b"<html>events</html>"
+
+
+def test_session_cache_serves_settled_urls_offline(tmp_path):
+    """Settled URLs are read from disk, including by a new session, without any request."""
+    url = "https://api-web.nhle.com/v1/gamecenter/2023020001/play-by-play"
+
+    session = ChickenSession(cache_dir=tmp_path)
+    session.mark_settled([url])
+    with patch("requests.Session.get", return_value=_fake_response(200, b'{"id": 1}')):
+        session.get(url)
+
+    new_session = ChickenSession(cache_dir=tmp_path)
+    with patch("requests.Session.get", side_effect=AssertionError("network used")):
+        assert new_session.get(url).json() == {"id": 1}
+
+
+def test_session_cache_skips_errors(tmp_path):
+    """Unsuccessful responses are not cached."""
+    session = ChickenSession(cache_dir=tmp_path)
+    url = "https://www.nhl.com/scores/htmlreports/20232024/RO029999.HTM"
+
+    with patch("requests.Session.get", return_value=_fake_response(404)):
+        session.get(url)
+
+    assert not list(tmp_path.rglob("*.gz"))
+
+
+def test_session_mark_settled_without_cache_is_noop():
+    session = ChickenSession()
+    session.mark_settled(["https://example.com"])
+    assert session.cache_dir is None
+    assert session._settled_urls == set()
+
+
 # ---------------------------------------------------------------------------
 # ChickenHTTPAdapter
 # ---------------------------------------------------------------------------
@@ -100,6 +160,111 @@ def test_adapter_send_passes_explicit_timeout():
         assert mock_send.call_args.kwargs["timeout"] == 30
 
 
+# ---------------------------------------------------------------------------
+# RateLimiter
+# ---------------------------------------------------------------------------
+
+HOST = "www.nhl.com"
+
+
+def test_session_shares_default_rate_limiter():
+    limiter = RateLimiter()
+
+    assert ChickenSession().rate_limiter is ChickenSession().rate_limiter
+    assert ChickenSession(rate_limiter=False).rate_limiter is None
+    assert ChickenSession(rate_limiter=limiter).get_adapter("https://www.nhl.com").rate_limiter is limiter
+
+
+def test_rate_limiter_increases_while_host_keeps_up():
+    limiter = RateLimiter(initial_rate=10.0, initial_concurrency=2)
+
+    for _ in range(4):
+        limiter.acquire(HOST)
+        limiter.release(HOST, [200], latency=0.1)
+
+    metrics = limiter.metrics()[HOST]
+    assert metrics["requests"] == 4
+    assert metrics["concurrency"] == 3
+    assert metrics["rate"] == 11.0
+    assert metrics["in_flight"] == 0
+
+
+def test_rate_limiter_backs_off_once_per_burst_of_congestion():
+    limiter = RateLimiter(initial_rate=10.0, initial_concurrency=8)
+
+    for statuses in ([429], [503, 200]):
+        limiter.acquire(HOST)
+        limiter.release(HOST, statuses, latency=0.1)
+
+    metrics = limiter.metrics()[HOST]
+    assert (metrics["rate"], metrics["concurrency"]) == (5.0, 4)
+    assert (metrics["throttled"], metrics["server_errors"], metrics["decreases"]) == (1, 1, 1)
+
+
+def test_rate_limiter_backs_off_on_rising_latency():
+    limiter = RateLimiter(initial_concurrency=8, latency_tolerance=2.0, cooldown=0.0)
+
+    limiter.acquire(HOST)
+    limiter.release(HOST, [200], latency=0.1)
+    limiter.acquire(HOST)
+    limiter.release(HOST, [200], latency=5.0)
+
+    assert limiter.metrics()[HOST]["decreases"] == 1
+
+
+def test_rate_limiter_blocks_beyond_concurrency_limit():
+    import threading
+
+    limiter = RateLimiter(initial_concurrency=1)
+    limiter.acquire(HOST)
+
+    acquired = threading.Event()
+    waiter = threading.Thread(target=lambda: (limiter.acquire(HOST), acquired.set()))
+    waiter.start()
+
+    assert not acquired.wait(0.2)
+    limiter.release(HOST, [200], latency=0.1)
+    assert acquired.wait(2)
+    waiter.join()
+
+
+def test_adapter_reports_retried_statuses_to_limiter():
+    """Statuses urllib3 retried internally, and Retry-After pauses, reach the limiter."""
+    limiter = RateLimiter()
+    adapter = ChickenHTTPAdapter(rate_limiter=limiter)
+
+    response = _fake_response(429, headers={"Retry-After": "0"})
+    response.raw = MagicMock()
+    response.raw.retries.history = [MagicMock(status=503)]
+
+    request = MagicMock(url="https://www.nhl.com/scores/htmlreports/20232024/PL020001.HTM")
+    with patch.object(HTTPAdapter, "send", return_value=response):
+        adapter.send(request)
+
+    metrics = limiter.metrics()[HOST]
+    assert (metrics["throttled"], metrics["server_errors"], metrics["in_flight"]) == (1, 1, 0)
+
+
+def test_adapter_skips_unlisted_hosts():
+    limiter = RateLimiter(hosts=("www.nhl.com",))
+    adapter = ChickenHTTPAdapter(rate_limiter=limiter)
+
+    with patch.object(HTTPAdapter, "send", return_value=_fake_response(200)):
+        adapter.send(MagicMock(url="https://example.com"))
+
+    assert limiter.metrics()[HOST]["requests"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"initial_rate": 0.1, "min_rate": 1.0}, {"initial_concurrency": 0}, {"decrease_factor": 1.5}]
+)
+def test_rate_limiter_invalid_input(kwargs):
+    from chickenstats.exceptions import InvalidInputError
+
+    with pytest.raises(InvalidInputError):
+        RateLimiter(**kwargs)
+
+
 # ---------------------------------------------------------------------------
 # ScrapeSpeedColumn
 # ---------------------------------------------------------------------------